@@ -1,9 +1,13 @@
+import asyncio
 import logging
 import json
 import hashlib
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from openai import OpenAI
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
@@ -11,7 +15,7 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_user_id
 from app.core.config import get_settings
 from app.core.request_context import get_request_id
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db
 from app.schemas.ai import (
     AIVideoCreateRequest,
     AIVideoCreateResponse,
@@ -62,33 +66,58 @@ from app.schemas.project import (
     ProjectResponse,
     UpdateProjectRequest,
 )
-from app.schemas.render import CreateRenderRequest, RenderResponse
+from app.schemas.render import CreateRenderRequest, RenderQueueResponse, RenderResponse
 from app.schemas.upload import UploadDeleteResponse, UploadSignRequest, UploadSignResponse
 from app.schemas.user import UserAvatarUploadResponse, UserProfileResponse, UserProfileUpdateRequest, UserSettingsResponse, UserSettingsUpdateRequest
-from app.schemas.video import MusicTrackResponse, VideoCreateResponse, VideoResponse, VideoRetryResponse
-from app.schemas.tts import TTSCatalogResponse, TTSLanguageOptionResponse, TTSPreviewRequest, TTSPreviewResponse, TTSVoiceOptionResponse
+from app.schemas.video import (
+    MusicTrackResponse,
+    VideoCancelResponse,
+    VideoCreateResponse,
+    VideoPromoteResponse,
+    VideoResponse,
+    VideoRetryResponse,
+    VideoVariantCreateResponse,
+    VideoVariantGroupResponse,
+    VideoVariantSummary,
+)
+from app.schemas.tts import (
+    TTSCacheStatsResponse,
+    TTSCatalogResponse,
+    TTSLanguageOptionResponse,
+    TTSPreviewBatchItemResponse,
+    TTSPreviewBatchRequest,
+    TTSPreviewBatchResponse,
+    TTSPreviewRequest,
+    TTSPreviewResponse,
+    TTSVoiceOptionResponse,
+)
 from app.services.avatar_service import AvatarService
 from app.services.auth_service import AuthService
 from app.services.image_generation_service import ImageGenerationService
+from app.services.music_library import BUILTIN_MUSIC_TRACKS, MusicLibrary
 from app.services.project_service import ProjectService
+from app.services.render_scheduler import RenderScheduler
 from app.services.render_service import RenderService
+from app.services.script_translation import translate_script
 from app.services.template_service import TemplateService
 from app.services.ai_video_service import AIVideoCreateService, ProviderError
 from app.services.asset_search_service import AssetSearchService
 from app.services.asset_tagging_service import AssetTaggingService
-from app.services.credit_service import CreditCapExceededError, CreditService, InsufficientCreditsError
+from app.services.credit_service import CreditCapExceededError, CreditEstimate, CreditService, InsufficientCreditsError
 from app.services.pricing_service import PricingService
 from app.services.upload_service import UploadService
+from app.services.tts_cache import tts_cache_index
 from app.services.user_service import UserService
 from app.services.video_service import VideoService
-from app.services.video_pipeline import BUILTIN_MUSIC_TRACKS
 from app.services.tts import (
     PREVIEW_MAX_CHARS,
     PREVIEW_MAX_REQUESTS_PER_WINDOW,
     PREVIEW_WINDOW_SECONDS,
+    VoiceoverResult,
+    agenerate_voiceover,
     assert_preview_rate_limit,
+    astream_voiceover,
     generate_voiceover,
-    generate_voiceover_detailed,
     get_cached_voiceover_detailed,
     list_tts_languages,
     list_tts_voices,
@@ -190,6 +219,8 @@ def _to_video_response(video, db: Session) -> VideoResponse:
         captions_enabled=bool(video.captions_enabled) if video.captions_enabled is not None else True,
         caption_style=video.caption_style,
         audio_sample_rate_hz=video.audio_sample_rate_hz,
+        quality=video.quality or 'final',
+        variant_group_id=video.variant_group_id,
         status=video.status.value if hasattr(video.status, 'value') else str(video.status),
         progress=video.progress,
         image_urls=image_urls,
@@ -203,6 +234,9 @@ def _to_video_response(video, db: Session) -> VideoResponse:
         music_volume=video.music_volume,
         duck_music=video.duck_music,
         thumbnail_url=video.thumbnail_url,
+        thumbnail_320_url=video.thumbnail_320_url,
+        thumbnail_640_url=video.thumbnail_640_url,
+        preview_sprite_url=video.preview_sprite_url,
         output_url=video.output_url,
         error_message=video.error_message,
         auto_tags=auto_tags,
@@ -314,6 +348,16 @@ async def health() -> dict[str, str]:
     return {'status': 'ok'}
 
 
+@router.get('/health/render-queue', response_model=RenderQueueResponse)
+def render_queue_depth() -> RenderQueueResponse:
+    return RenderQueueResponse(**RenderScheduler().queue_depth())
+
+
+@router.get('/health/tts-cache', response_model=TTSCacheStatsResponse)
+def tts_cache_stats() -> TTSCacheStatsResponse:
+    return TTSCacheStatsResponse(**tts_cache_index(Path('data/tts_cache')).stats())
+
+
 @router.get('/api/credits/wallet', response_model=CreditWalletResponse)
 def get_credit_wallet(
     user_id: str = Depends(get_user_id),
@@ -658,27 +702,7 @@ def translate_script_text_v2(
     payload: ScriptTranslateRequest,
     _: str = Depends(get_user_id),
 ):
-    translated_text = ''
-    if settings.openai_api_key:
-        client = OpenAI(api_key=settings.openai_api_key)
-        response = client.chat.completions.create(
-            model=settings.openai_model,
-            temperature=0.2,
-            messages=[
-                {
-                    'role': 'system',
-                    'content': 'Translate the provided text accurately into the requested target language. Return only the translated text with no explanation.',
-                },
-                {
-                    'role': 'user',
-                    'content': f'Target language: {payload.target_language}\n\nText:\n{payload.text}',
-                },
-            ],
-        )
-        translated_text = (response.choices[0].message.content or '').strip()
-    if not translated_text:
-        translated_text = payload.text
-    return TextResponse(text=translated_text)
+    return TextResponse(text=translate_script(payload.text, payload.target_language))
 
 
 @router.post('/ai/reel-script', response_model=ReelScriptResponse)
@@ -1427,17 +1451,19 @@ def list_music_tracks() -> list[MusicTrackResponse]:
         'corporate-calm': 'Corporate Calm',
         'soft-motivation': 'Soft Motivation',
     }
+    library = MusicLibrary()
     tracks: list[MusicTrackResponse] = []
     for track_id, url in BUILTIN_MUSIC_TRACKS.items():
         local_path = Path(f"data/{url.replace('/static/', '', 1)}") if url.startswith('/static/') else Path(url)
         exists = local_path.exists()
         if not exists:
             continue
+        info = library.cached_info(local_path)
         tracks.append(
             MusicTrackResponse(
                 id=track_id,
                 name=labels.get(track_id, track_id),
-                duration_sec=None,
+                duration_sec=round(info.duration_seconds) if info else None,
                 preview_url=url,
             )
         )
@@ -1469,29 +1495,19 @@ def get_tts_catalog(_: str = Depends(get_user_id)) -> TTSCatalogResponse:
 
 
 @router.post('/tts/preview', response_model=TTSPreviewResponse)
-def generate_tts_preview(
+async def generate_tts_preview(
     payload: TTSPreviewRequest,
     user_id: str = Depends(get_user_id),
     db: Session = Depends(get_db),
 ) -> TTSPreviewResponse:
     preview_text = payload.text.strip()[:PREVIEW_MAX_CHARS]
     credit_service = CreditService(db)
-    wallet = credit_service.ensure_wallet(user_id)
-    try:
-        estimate = credit_service.estimate(
-            'tts_preview',
-            {
-                'voice': payload.voice,
-                'provider': 'free' if payload.voice in credit_service.FREE_VOICE_KEYS else 'sarvam',
-                'sample_rate_hz': payload.sample_rate_hz,
-            },
-        )
-    except CreditCapExceededError as exc:
-        raise HTTPException(status_code=400, detail='Requested configuration exceeds allowed credit cap') from exc
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # The session, the wallet and the cache index are all blocking; keep them off the loop.
+    wallet = await run_in_threadpool(credit_service.ensure_wallet, user_id)
+    estimate = await run_in_threadpool(_estimate_tts_preview, credit_service, payload)
     cache_dir = Path('data/tts_cache')
-    cached = get_cached_voiceover_detailed(
+    cached = await run_in_threadpool(
+        get_cached_voiceover_detailed,
         script=preview_text,
         voice=payload.voice,
         cache_dir=cache_dir,
@@ -1508,46 +1524,27 @@ def generate_tts_preview(
                 status_code=429,
                 detail=f'{exc} Limit: {PREVIEW_MAX_REQUESTS_PER_WINDOW} previews every {PREVIEW_WINDOW_SECONDS // 60} minutes.',
             ) from exc
-        result = generate_voiceover_detailed(
+        result = await agenerate_voiceover(
             script=preview_text,
             voice=payload.voice,
             cache_dir=cache_dir,
             language=payload.language,
             sample_rate_hz=payload.sample_rate_hz,
             allow_premium=wallet.current_credits >= estimate.required_credits,
+            hedge=settings.tts_preview_hedging,
         )
     applied_credits = 0
     remaining_credits = wallet.current_credits
     if not result.cached and result.provider == 'Sarvam AI' and estimate.required_credits > 0:
         try:
-            deduction = credit_service.deduct_credits(
-                user_id=user_id,
-                amount=estimate.required_credits,
-                feature_key='tts_preview',
-                metadata={
-                    'voice': payload.voice,
-                    'language': payload.language,
-                    'sample_rate_hz': payload.sample_rate_hz,
-                    'text_hash': hashlib.sha256(preview_text.encode('utf-8')).hexdigest(),
-                },
-                source='premium',
-                idempotency_key=credit_service.make_idempotency_key(
-                    'tts_preview',
-                    {
-                        'user_id': user_id,
-                        'voice': payload.voice,
-                        'language': payload.language,
-                        'sample_rate_hz': payload.sample_rate_hz,
-                        'text_hash': hashlib.sha256(preview_text.encode('utf-8')).hexdigest(),
-                    },
-                ),
+            remaining_credits = await run_in_threadpool(
+                _charge_tts_preview, credit_service, user_id, payload, preview_text, estimate.required_credits
             )
             applied_credits = estimate.required_credits
-            remaining_credits = deduction.wallet.current_credits
         except InsufficientCreditsError:
             # If premium synthesis succeeded but credits became unavailable concurrently,
             # surface the asset as fallback-free but do not pretend the balance changed.
-            result = generate_voiceover_detailed(
+            result = await agenerate_voiceover(
                 script=preview_text,
                 voice=payload.voice,
                 cache_dir=cache_dir,
@@ -1568,6 +1565,278 @@ def generate_tts_preview(
     )
 
 
+@router.post('/tts/preview/stream')
+async def stream_tts_preview(
+    payload: TTSPreviewRequest,
+    user_id: str = Depends(get_user_id),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    preview_text = payload.text.strip()[:PREVIEW_MAX_CHARS]
+    credit_service = CreditService(db)
+    wallet = await run_in_threadpool(credit_service.ensure_wallet, user_id)
+    estimate = await run_in_threadpool(_estimate_tts_preview, credit_service, payload)
+    cache_dir = Path('data/tts_cache')
+    cached = await run_in_threadpool(
+        get_cached_voiceover_detailed,
+        script=preview_text,
+        voice=payload.voice,
+        cache_dir=cache_dir,
+        language=payload.language,
+        sample_rate_hz=payload.sample_rate_hz,
+    )
+    if not cached:
+        try:
+            assert_preview_rate_limit(user_id)
+        except RuntimeError as exc:
+            raise HTTPException(
+                status_code=429,
+                detail=f'{exc} Limit: {PREVIEW_MAX_REQUESTS_PER_WINDOW} previews every {PREVIEW_WINDOW_SECONDS // 60} minutes.',
+            ) from exc
+
+    async def open_stream(allow_premium: bool):
+        try:
+            return await astream_voiceover(
+                script=preview_text,
+                voice=payload.voice,
+                cache_dir=cache_dir,
+                language=payload.language,
+                sample_rate_hz=payload.sample_rate_hz,
+                allow_premium=allow_premium,
+            )
+        except (RuntimeError, ValueError) as exc:
+            raise HTTPException(status_code=502, detail=f'TTS preview failed: {exc}') from exc
+
+    # Audio starts flowing as soon as the first sentence (Sarvam) or the first MP3 frames
+    # (edge-tts) exist. The premium charge is only taken once the whole preview has been
+    # sent, so a stream cut short by a provider costs nothing; headers are already gone by
+    # then, so clients read the balance from the wallet afterwards.
+    stream = await open_stream(wallet.current_credits >= estimate.required_credits)
+    chunks = stream.chunks
+    if not stream.cached and stream.provider == 'Sarvam AI' and estimate.required_credits > 0:
+        chunks = _charge_after_stream(stream.chunks, user_id, payload, preview_text, estimate.required_credits)
+    headers = {
+        'Cache-Control': 'no-store',
+        'X-TTS-Provider': stream.provider,
+        'X-TTS-Resolved-Voice': stream.resolved_voice,
+        'X-TTS-Cached': 'true' if stream.cached else 'false',
+    }
+    if stream.provider_message:
+        headers['X-TTS-Provider-Message'] = stream.provider_message.encode('ascii', 'replace').decode('ascii')[:300]
+    return StreamingResponse(chunks, media_type=stream.media_type, headers=headers)
+
+
+@router.post('/tts/preview/batch', response_model=TTSPreviewBatchResponse)
+async def generate_tts_preview_batch(
+    payload: TTSPreviewBatchRequest,
+    user_id: str = Depends(get_user_id),
+    db: Session = Depends(get_db),
+) -> TTSPreviewBatchResponse:
+    preview_text = payload.text.strip()[:PREVIEW_MAX_CHARS]
+    credit_service = CreditService(db)
+    wallet = await run_in_threadpool(credit_service.ensure_wallet, user_id)
+    cache_dir = Path('data/tts_cache')
+    items = [
+        TTSPreviewRequest(text=payload.text, language=payload.language, voice=voice, sample_rate_hz=payload.sample_rate_hz)
+        for voice in dict.fromkeys(payload.voices)
+    ]
+    estimates = {item.voice: await run_in_threadpool(_estimate_tts_preview, credit_service, item) for item in items}
+    results: dict[str, VoiceoverResult | BaseException] = {}
+    for item in items:
+        cached = await run_in_threadpool(
+            get_cached_voiceover_detailed,
+            script=preview_text,
+            voice=item.voice,
+            cache_dir=cache_dir,
+            language=payload.language,
+            sample_rate_hz=payload.sample_rate_hz,
+        )
+        if cached:
+            results[item.voice] = cached
+    pending = [item for item in items if item.voice not in results]
+    if pending:
+        try:
+            assert_preview_rate_limit(user_id, count=len(pending))
+        except RuntimeError as exc:
+            raise HTTPException(
+                status_code=429,
+                detail=f'{exc} Limit: {PREVIEW_MAX_REQUESTS_PER_WINDOW} previews every {PREVIEW_WINDOW_SECONDS // 60} minutes.',
+            ) from exc
+
+    # Premium voices are granted in request order while the balance covers them, so the
+    # single charge below never exceeds the wallet.
+    budget = wallet.current_credits
+    allow_premium: dict[str, bool] = {}
+    for item in pending:
+        required = estimates[item.voice].required_credits
+        allow_premium[item.voice] = budget >= required
+        if allow_premium[item.voice]:
+            budget -= required
+
+    async def synthesize(voices: list[str], premium: dict[str, bool]) -> None:
+        # Every voice is awaited together; the per-provider semaphores on the TTS loop cap
+        # how many actually reach Sarvam, edge-tts or gTTS at once.
+        outcomes = await asyncio.gather(
+            *(
+                agenerate_voiceover(
+                    script=preview_text,
+                    voice=voice,
+                    cache_dir=cache_dir,
+                    language=payload.language,
+                    sample_rate_hz=payload.sample_rate_hz,
+                    allow_premium=premium[voice],
+                    hedge=settings.tts_preview_hedging,
+                )
+                for voice in voices
+            ),
+            return_exceptions=True,
+        )
+        results.update(zip(voices, outcomes))
+
+    await synthesize([item.voice for item in pending], allow_premium)
+    charged: list[str] = []
+    for item in pending:
+        result = results[item.voice]
+        if isinstance(result, VoiceoverResult) and not result.cached and result.provider == 'Sarvam AI' and estimates[item.voice].required_credits > 0:
+            charged.append(item.voice)
+    applied_credits = 0
+    remaining_credits = wallet.current_credits
+    if charged:
+        amount = sum(estimates[voice].required_credits for voice in charged)
+        try:
+            remaining_credits = await run_in_threadpool(
+                _charge_tts_preview_batch, credit_service, user_id, payload, charged, preview_text, amount
+            )
+            applied_credits = amount
+        except InsufficientCreditsError:
+            # Credits spent concurrently elsewhere: fall back for the premium voices rather
+            # than failing the whole batch, exactly as the single preview does.
+            await synthesize(charged, dict.fromkeys(charged, False))
+            charged = []
+
+    previews: list[TTSPreviewBatchItemResponse] = []
+    for item in items:
+        result = results[item.voice]
+        if isinstance(result, BaseException):
+            logger.warning('tts_batch_preview_failed', extra={'voice': item.voice, 'error': str(result)})
+            previews.append(TTSPreviewBatchItemResponse(voice=item.voice, error=f'TTS preview failed: {result}'))
+            continue
+        previews.append(
+            TTSPreviewBatchItemResponse(
+                voice=item.voice,
+                preview_url=f"/static/{result.path.as_posix().replace('data/', '', 1)}",
+                provider=result.provider,
+                resolved_voice=result.resolved_voice,
+                cached=result.cached,
+                provider_message=result.provider_message,
+                applied_credits=estimates[item.voice].required_credits if item.voice in charged else 0,
+            )
+        )
+    return TTSPreviewBatchResponse(
+        previews=previews,
+        preview_limit=f'{PREVIEW_MAX_REQUESTS_PER_WINDOW} uncached previews / {PREVIEW_WINDOW_SECONDS // 60} min · {PREVIEW_MAX_CHARS} chars max',
+        applied_credits=applied_credits,
+        remaining_credits=remaining_credits,
+    )
+
+
+def _estimate_tts_preview(credit_service: CreditService, payload: TTSPreviewRequest) -> CreditEstimate:
+    try:
+        return credit_service.estimate(
+            'tts_preview',
+            {
+                'voice': payload.voice,
+                'provider': 'free' if payload.voice in credit_service.FREE_VOICE_KEYS else 'sarvam',
+                'sample_rate_hz': payload.sample_rate_hz,
+            },
+        )
+    except CreditCapExceededError as exc:
+        raise HTTPException(status_code=400, detail='Requested configuration exceeds allowed credit cap') from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+def _charge_tts_preview(
+    credit_service: CreditService,
+    user_id: str,
+    payload: TTSPreviewRequest,
+    preview_text: str,
+    amount: int,
+) -> int:
+    text_hash = hashlib.sha256(preview_text.encode('utf-8')).hexdigest()
+    deduction = credit_service.deduct_credits(
+        user_id=user_id,
+        amount=amount,
+        feature_key='tts_preview',
+        metadata={
+            'voice': payload.voice,
+            'language': payload.language,
+            'sample_rate_hz': payload.sample_rate_hz,
+            'text_hash': text_hash,
+        },
+        source='premium',
+        idempotency_key=credit_service.make_idempotency_key(
+            'tts_preview',
+            {
+                'user_id': user_id,
+                'voice': payload.voice,
+                'language': payload.language,
+                'sample_rate_hz': payload.sample_rate_hz,
+                'text_hash': text_hash,
+            },
+        ),
+    )
+    return deduction.wallet.current_credits
+
+
+async def _charge_after_stream(
+    chunks: AsyncIterator[bytes],
+    user_id: str,
+    payload: TTSPreviewRequest,
+    preview_text: str,
+    amount: int,
+) -> AsyncIterator[bytes]:
+    async for data in chunks:
+        yield data
+    # The request's session is closed once the response starts, so the charge gets its own.
+    try:
+        await run_in_threadpool(_charge_tts_preview_detached, user_id, payload, preview_text, amount)
+    except InsufficientCreditsError:
+        logger.warning('tts_stream_charge_failed', extra={'user_id': user_id, 'voice': payload.voice, 'amount': amount})
+
+
+def _charge_tts_preview_detached(user_id: str, payload: TTSPreviewRequest, preview_text: str, amount: int) -> int:
+    db = SessionLocal()
+    try:
+        return _charge_tts_preview(CreditService(db), user_id, payload, preview_text, amount)
+    finally:
+        db.close()
+
+
+def _charge_tts_preview_batch(
+    credit_service: CreditService,
+    user_id: str,
+    payload: TTSPreviewBatchRequest,
+    voices: list[str],
+    preview_text: str,
+    amount: int,
+) -> int:
+    metadata = {
+        'voices': voices,
+        'language': payload.language,
+        'sample_rate_hz': payload.sample_rate_hz,
+        'text_hash': hashlib.sha256(preview_text.encode('utf-8')).hexdigest(),
+    }
+    deduction = credit_service.deduct_credits(
+        user_id=user_id,
+        amount=amount,
+        feature_key='tts_preview',
+        metadata=metadata,
+        source='premium',
+        idempotency_key=credit_service.make_idempotency_key('tts_preview_batch', {'user_id': user_id, **metadata}),
+    )
+    return deduction.wallet.current_credits
+
+
 @router.post('/videos', response_model=VideoCreateResponse, status_code=status.HTTP_202_ACCEPTED)
 async def create_video(
     script: str = Form(default=''),
@@ -1580,6 +1849,7 @@ async def create_video(
     duration_seconds: int | None = Form(default=None),
     captions_enabled: bool = Form(default=True),
     audio_sample_rate_hz: int = Form(default=22050),
+    quality: str = Form(default='final'),
     selected_model: str | None = Form(default=None),
     reference_images: list[str] = Form(default=[]),
     music_mode: str = Form(default='none'),
@@ -1606,6 +1876,7 @@ async def create_video(
             duration_seconds=duration_seconds,
             captions_enabled=captions_enabled,
             audio_sample_rate_hz=audio_sample_rate_hz,
+            quality=quality,
             selected_model=selected_model,
             reference_images=reference_images,
             music_mode=music_mode,
@@ -1619,6 +1890,83 @@ async def create_video(
     return VideoCreateResponse(id=video.id, status=video.status.value if hasattr(video.status, 'value') else str(video.status))
 
 
+@router.post('/videos/variants', response_model=VideoVariantCreateResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_video_variants(
+    script: str = Form(...),
+    source_language: str = Form(default='English'),
+    languages: list[str] = Form(...),
+    aspect_ratios: list[str] = Form(default=['9:16']),
+    voice: str = Form(default='Shubh'),
+    title: str | None = Form(default=None),
+    resolution: str = Form(default='1080p'),
+    duration_mode: str = Form(default='auto'),
+    duration_seconds: int | None = Form(default=None),
+    captions_enabled: bool = Form(default=True),
+    audio_sample_rate_hz: int = Form(default=22050),
+    quality: str = Form(default='final'),
+    music_mode: str = Form(default='none'),
+    music_track_id: str | None = Form(default=None),
+    music_volume: int = Form(default=20),
+    duck_music: bool = Form(default=True),
+    images: list[UploadFile] = File(default=[]),
+    music_file: UploadFile | None = File(default=None),
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    service = VideoService(db)
+    try:
+        videos = await service.create_video_variants(
+            user_id=user_id,
+            script=script,
+            source_language=source_language,
+            languages=languages,
+            aspect_ratios=aspect_ratios,
+            voice=voice,
+            images=images,
+            title=title,
+            resolution=resolution,
+            duration_mode=duration_mode,
+            duration_seconds=duration_seconds,
+            captions_enabled=captions_enabled,
+            audio_sample_rate_hz=audio_sample_rate_hz,
+            quality=quality,
+            music_mode=music_mode,
+            music_track_id=music_track_id,
+            music_volume=music_volume,
+            duck_music=duck_music,
+            music_file=music_file,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return VideoVariantCreateResponse(
+        variant_group_id=videos[0].variant_group_id,
+        videos=[
+            VideoVariantSummary(
+                id=video.id,
+                status=video.status.value if hasattr(video.status, 'value') else str(video.status),
+                language=video.language,
+                aspect_ratio=video.aspect_ratio,
+            )
+            for video in videos
+        ],
+    )
+
+
+@router.get('/videos/variants/{variant_group_id}', response_model=VideoVariantGroupResponse)
+def get_video_variants(
+    variant_group_id: str,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    videos = VideoService(db).list_variant_group(variant_group_id, user_id)
+    if not videos:
+        raise HTTPException(status_code=404, detail='Variant group not found')
+    return VideoVariantGroupResponse(
+        variant_group_id=variant_group_id,
+        videos=[_to_video_response(video, db) for video in videos],
+    )
+
+
 @router.get('/videos/{video_id}', response_model=VideoResponse)
 def get_video(
     video_id: str,
@@ -1643,3 +1991,39 @@ def retry_video(
     if not video:
         raise HTTPException(status_code=404, detail='Video not found')
     return VideoRetryResponse(id=video.id, status=video.status.value if hasattr(video.status, 'value') else str(video.status))
+
+
+@router.post('/videos/{video_id}/cancel', response_model=VideoCancelResponse)
+def cancel_video(
+    video_id: str,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    service = VideoService(db)
+    try:
+        video = service.cancel_video(video_id, user_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    if not video:
+        raise HTTPException(status_code=404, detail='Video not found')
+    return VideoCancelResponse(id=video.id, status=video.status.value if hasattr(video.status, 'value') else str(video.status))
+
+
+@router.post('/videos/{video_id}/promote', response_model=VideoPromoteResponse, status_code=status.HTTP_202_ACCEPTED)
+def promote_video(
+    video_id: str,
+    db: Session = Depends(get_db),
+    user_id: str = Depends(get_user_id),
+):
+    service = VideoService(db)
+    try:
+        video = service.promote_video(video_id, user_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    if not video:
+        raise HTTPException(status_code=404, detail='Video not found')
+    return VideoPromoteResponse(
+        id=video.id,
+        status=video.status.value if hasattr(video.status, 'value') else str(video.status),
+        quality=video.quality,
+    )
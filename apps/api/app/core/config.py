@@ -27,6 +27,12 @@ class Settings(BaseSettings):
     openai_video_model: str = 'sora-2'
     sarvam_api_key: str | None = None
     sarvam_model: str = 'bulbul:v3'
+    tts_sarvam_max_concurrency: int = 4
+    tts_edge_max_concurrency: int = 8
+    tts_gtts_max_concurrency: int = 2
+    tts_cache_max_bytes: int = 2 * 1024 * 1024 * 1024
+    tts_preview_hedging: bool = False
+    tts_preview_hedge_after_seconds: float = 1.5
     kling_api_key: str | None = None
     kling_api_base: str = 'https://api.klingai.com'
     gemini_api_key: str | None = None
@@ -47,6 +53,17 @@ class Settings(BaseSettings):
     stripe_api_base: str = 'https://api.stripe.com/v1'
     geoip_api_base: str = 'https://ipapi.co'
     pricing_default_country: str = 'IN'
+    render_mode: str = 'staged'
+    render_cache_enabled: bool = True
+    render_cache_max_bytes: int = 20 * 1024 * 1024 * 1024
+    render_parallel_segments: bool = False
+    render_segment_seconds: int = 10
+    render_segment_workers: int = 0
+    render_scratch_dir: str = ''
+    render_max_concurrent_jobs: int = 0
+    render_slots_dir: str = ''
+    render_distributed: bool = False
+    render_chunk_seconds: int = 30
 
     @property
     def allowed_origins_list(self) -> list[str]:
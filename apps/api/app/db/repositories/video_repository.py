@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.models.entities import Video, VideoStatus
@@ -22,6 +22,10 @@ class VideoRepository:
         stmt = select(Video).where(Video.user_id == user_id).order_by(Video.created_at.desc())
         return list(self.db.scalars(stmt).all())
 
+    def list_by_variant_group(self, variant_group_id: str) -> list[Video]:
+        stmt = select(Video).where(Video.variant_group_id == variant_group_id).order_by(Video.created_at, Video.id)
+        return list(self.db.scalars(stmt).all())
+
     def update(self, video: Video, **kwargs) -> Video:
         for key, value in kwargs.items():
             setattr(video, key, value)
@@ -30,38 +34,67 @@ class VideoRepository:
         self.db.refresh(video)
         return video
 
+    def start(self, video_id: str, progress: int = 0) -> Video | None:
+        # Jobs are created as drafts; the worker picking one up is what makes it processing.
+        return self._transition(
+            video_id,
+            {VideoStatus.draft, VideoStatus.processing},
+            progress=progress,
+            status=VideoStatus.processing,
+        )
+
     def set_progress(self, video_id: str, progress: int, status: VideoStatus) -> Video | None:
-        video = self.get_by_id(video_id)
-        if not video:
-            return None
-        video.progress = progress
-        video.status = status
-        self.db.add(video)
-        self.db.commit()
-        self.db.refresh(video)
-        return video
+        return self._transition(video_id, {VideoStatus.processing, status}, progress=progress, status=status)
 
-    def complete(self, video_id: str, output_url: str, thumbnail_url: str) -> Video | None:
-        video = self.get_by_id(video_id)
-        if not video:
-            return None
-        video.progress = 100
-        video.status = VideoStatus.completed
-        video.output_url = output_url
-        video.thumbnail_url = thumbnail_url
-        video.error_message = None
-        self.db.add(video)
-        self.db.commit()
-        self.db.refresh(video)
-        return video
+    def complete(
+        self,
+        video_id: str,
+        output_url: str,
+        thumbnail_url: str,
+        thumbnail_320_url: str | None = None,
+        thumbnail_640_url: str | None = None,
+        preview_sprite_url: str | None = None,
+    ) -> Video | None:
+        return self._transition(
+            video_id,
+            {VideoStatus.processing},
+            progress=100,
+            status=VideoStatus.completed,
+            output_url=output_url,
+            thumbnail_url=thumbnail_url,
+            thumbnail_320_url=thumbnail_320_url,
+            thumbnail_640_url=thumbnail_640_url,
+            preview_sprite_url=preview_sprite_url,
+            error_message=None,
+        )
 
-    def fail(self, video_id: str, message: str) -> Video | None:
-        video = self.get_by_id(video_id)
-        if not video:
-            return None
-        video.status = VideoStatus.failed
-        video.error_message = message[:255]
-        self.db.add(video)
+    def fail(self, video_id: str, message: str, progress: int | None = None) -> Video | None:
+        values = {'progress': progress} if progress is not None else {}
+        return self._transition(
+            video_id,
+            {VideoStatus.processing},
+            status=VideoStatus.failed,
+            error_message=message[:255],
+            **values,
+        )
+
+    def cancel(self, video_id: str) -> Video | None:
+        return self._transition(video_id, {VideoStatus.processing}, status=VideoStatus.cancelled, error_message=None)
+
+    def _transition(self, video_id: str, from_statuses: set[VideoStatus], **values) -> Video | None:
+        # Workers and the API race on the same row; a write only lands while the video is
+        # still in one of from_statuses, so a cancel is never overwritten by a late
+        # completed/failed and vice versa. None means the transition lost.
+        result = self.db.execute(
+            update(Video)
+            .where(Video.id == video_id, Video.status.in_(from_statuses))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
-        self.db.refresh(video)
+        if result.rowcount != 1:
+            return None
+        video = self.get_by_id(video_id)
+        if video is not None:
+            self.db.refresh(video)
         return video
@@ -1,6 +1,8 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-import subprocess
+import threading
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -17,13 +19,22 @@ from app.db.session import engine
 from app.middleware.rate_limit import RateLimitStubMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
-from app.services.video_pipeline import BUILTIN_MUSIC_TRACKS
+from app.services.music_library import MusicLibrary
 
 settings = get_settings()
 configure_logging(settings.log_level)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Placeholder tracks and their normalized library copies are built off the startup
+    # path; nothing shells out to ffmpeg at import time.
+    threading.Thread(target=MusicLibrary().ensure_builtin_tracks, name='music-library-seed', daemon=True).start()
+    yield
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.add_middleware(RequestIDMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
@@ -98,11 +109,18 @@ def _ensure_video_columns() -> None:
         ('music_file_url', 'ALTER TABLE videos ADD COLUMN music_file_url VARCHAR(255)'),
         ('music_volume', 'ALTER TABLE videos ADD COLUMN music_volume INTEGER DEFAULT 20'),
         ('duck_music', 'ALTER TABLE videos ADD COLUMN duck_music BOOLEAN DEFAULT 1'),
+        ('quality', "ALTER TABLE videos ADD COLUMN quality VARCHAR(10) DEFAULT 'final'"),
+        ('thumbnail_320_url', 'ALTER TABLE videos ADD COLUMN thumbnail_320_url VARCHAR(255)'),
+        ('thumbnail_640_url', 'ALTER TABLE videos ADD COLUMN thumbnail_640_url VARCHAR(255)'),
+        ('preview_sprite_url', 'ALTER TABLE videos ADD COLUMN preview_sprite_url VARCHAR(255)'),
+        ('variant_group_id', 'ALTER TABLE videos ADD COLUMN variant_group_id VARCHAR(36)'),
     ]
     with engine.begin() as conn:
         for column_name, statement in migrations:
             if column_name not in existing:
                 conn.execute(text(statement))
+        # Same name create_all gives the model's index=True, so fresh and migrated DBs match.
+        conn.execute(text('CREATE INDEX IF NOT EXISTS ix_videos_variant_group_id ON videos (variant_group_id)'))
 
 
 _ensure_video_columns()
@@ -238,41 +256,6 @@ Path('data/renders').mkdir(parents=True, exist_ok=True)
 Path('data/image_generations').mkdir(parents=True, exist_ok=True)
 
 
-def _ensure_builtin_music_previews() -> None:
-    # Generate lightweight placeholder previews if local files are missing.
-    tones = {
-        'uplift-india.mp3': 392,
-        'corporate-calm.mp3': 330,
-        'soft-motivation.mp3': 262,
-    }
-    for _, url in BUILTIN_MUSIC_TRACKS.items():
-        path_str = url.replace('/static/', '', 1) if url.startswith('/static/') else url
-        target = Path('data') / path_str
-        if target.exists():
-            continue
-        target.parent.mkdir(parents=True, exist_ok=True)
-        freq = tones.get(target.name, 330)
-        try:
-            subprocess.run(
-                [
-                    'ffmpeg',
-                    '-y',
-                    '-f',
-                    'lavfi',
-                    '-i',
-                    f'sine=frequency={freq}:duration=12',
-                    '-q:a',
-                    '4',
-                    str(target),
-                ],
-                check=True,
-                capture_output=True,
-            )
-        except Exception as exc:
-            logger.warning('music_preview_seed_failed', extra={'error': str(exc), 'path': str(target)})
-
-
-_ensure_builtin_music_previews()
 app.mount('/static', StaticFiles(directory='data'), name='static')
 app.include_router(router)
 
@@ -20,6 +20,7 @@ class VideoStatus(str, enum.Enum):
     processing = 'processing'
     completed = 'completed'
     failed = 'failed'
+    cancelled = 'cancelled'
 
 
 class ImageGenerationStatus(str, enum.Enum):
@@ -119,6 +120,8 @@ class Video(Base):
     captions_enabled: Mapped[bool] = mapped_column(default=True)
     caption_style: Mapped[str | None] = mapped_column(String(40), nullable=True)
     audio_sample_rate_hz: Mapped[int] = mapped_column(Integer, default=22050)
+    quality: Mapped[str] = mapped_column(String(10), default='final')
+    variant_group_id: Mapped[str | None] = mapped_column(String(36), nullable=True, index=True)
     status: Mapped[VideoStatus] = mapped_column(Enum(VideoStatus), default=VideoStatus.draft, index=True)
     progress: Mapped[int] = mapped_column(Integer, default=0)
     image_urls: Mapped[str] = mapped_column(Text, default='[]')
@@ -132,6 +135,9 @@ class Video(Base):
     music_volume: Mapped[int] = mapped_column(Integer, default=20)
     duck_music: Mapped[bool] = mapped_column(default=True)
     thumbnail_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    thumbnail_320_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    thumbnail_640_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    preview_sprite_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     output_url: Mapped[str | None] = mapped_column(String(255), nullable=True)
     error_message: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,3 +1,5 @@
+import os
+import shutil
 from pathlib import Path
 from uuid import uuid4
 
@@ -11,12 +13,28 @@ class StorageProvider:
     def delete(self, path: str) -> bool:
         raise NotImplementedError
 
+    def put_object(self, key: str, source: Path) -> None:
+        raise NotImplementedError
+
+    def get_object(self, key: str, target: Path) -> None:
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> int:
+        raise NotImplementedError
+
 
 class LocalStorageProvider(StorageProvider):
     def __init__(self) -> None:
         settings = get_settings()
         self.upload_dir = Path('data/uploads')
         self.upload_dir.mkdir(parents=True, exist_ok=True)
+        # Objects exchanged between render workers; multi-node setups mount this directory
+        # on every node.
+        self.objects_dir = Path('data/storage')
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
         self.base_url = settings.public_asset_base_url.rstrip('/')
 
     def sign_upload(self, filename: str) -> tuple[str, str]:
@@ -33,3 +51,45 @@ class LocalStorageProvider(StorageProvider):
             target.unlink()
             return True
         return False
+
+    def put_object(self, key: str, source: Path) -> None:
+        target = self._object_path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_target = target.with_name(f'.{target.name}.{os.getpid()}.tmp')
+        shutil.copyfile(source, temp_target)
+        os.replace(temp_target, target)
+
+    def get_object(self, key: str, target: Path) -> None:
+        source = self._object_path(key)
+        if not source.is_file():
+            raise FileNotFoundError(f'Storage object not found: {key}')
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+
+    def exists(self, key: str) -> bool:
+        return self._object_path(key).is_file()
+
+    def delete_prefix(self, prefix: str) -> int:
+        root = self._object_path(prefix)
+        if root.is_file():
+            root.unlink()
+            return 1
+        if not root.is_dir():
+            return 0
+        removed = sum(1 for path in root.rglob('*') if path.is_file())
+        shutil.rmtree(root, ignore_errors=True)
+        return removed
+
+    def _object_path(self, key: str) -> Path:
+        root = self.objects_dir.resolve()
+        target = (root / key.strip('/')).resolve()
+        if target == root or root not in target.parents:
+            raise ValueError(f'Invalid storage key: {key}')
+        return target
+
+
+def get_storage_provider() -> StorageProvider:
+    backend = get_settings().storage_backend
+    if backend == 'local':
+        return LocalStorageProvider()
+    raise RuntimeError(f'Unsupported storage backend: {backend}')
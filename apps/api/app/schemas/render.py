@@ -9,6 +9,13 @@ class CreateRenderRequest(BaseModel):
     include_broll: bool = False
 
 
+class RenderQueueResponse(BaseModel):
+    max_jobs: int
+    active: int
+    queued: int
+    threads_per_job: int
+
+
 class RenderResponse(BaseModel):
     id: str
     project_id: str
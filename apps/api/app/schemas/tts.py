@@ -1,3 +1,5 @@
+from typing import Annotated
+
 from pydantic import BaseModel, Field
 
 
@@ -31,6 +33,23 @@ class TTSPreviewRequest(BaseModel):
     sample_rate_hz: int = Field(default=22050, ge=8000, le=48000)
 
 
+class TTSPreviewBatchRequest(BaseModel):
+    text: str = Field(min_length=1, max_length=400)
+    language: str = Field(min_length=2, max_length=40)
+    voices: list[Annotated[str, Field(min_length=1, max_length=80)]] = Field(min_length=1, max_length=8)
+    sample_rate_hz: int = Field(default=22050, ge=8000, le=48000)
+
+
+class TTSCacheStatsResponse(BaseModel):
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+
 class TTSPreviewResponse(BaseModel):
     preview_url: str
     provider: str
@@ -40,3 +59,21 @@ class TTSPreviewResponse(BaseModel):
     provider_message: str | None = None
     applied_credits: int = 0
     remaining_credits: int | None = None
+
+
+class TTSPreviewBatchItemResponse(BaseModel):
+    voice: str
+    preview_url: str | None = None
+    provider: str | None = None
+    resolved_voice: str | None = None
+    cached: bool = False
+    provider_message: str | None = None
+    applied_credits: int = 0
+    error: str | None = None
+
+
+class TTSPreviewBatchResponse(BaseModel):
+    previews: list[TTSPreviewBatchItemResponse] = Field(default_factory=list)
+    preview_limit: str
+    applied_credits: int = 0
+    remaining_credits: int | None = None
@@ -18,6 +18,8 @@ class VideoResponse(BaseModel):
     captions_enabled: bool
     caption_style: str | None = None
     audio_sample_rate_hz: int | None = None
+    quality: str = 'final'
+    variant_group_id: str | None = None
     status: str
     progress: int
     image_urls: list[str] = Field(default_factory=list)
@@ -31,6 +33,9 @@ class VideoResponse(BaseModel):
     music_volume: int
     duck_music: bool
     thumbnail_url: str | None
+    thumbnail_320_url: str | None = None
+    thumbnail_640_url: str | None = None
+    preview_sprite_url: str | None = None
     output_url: str | None
     error_message: str | None
     auto_tags: list[str] = Field(default_factory=list)
@@ -44,11 +49,39 @@ class VideoCreateResponse(BaseModel):
     status: str
 
 
+class VideoVariantSummary(BaseModel):
+    id: str
+    status: str
+    language: str | None
+    aspect_ratio: str
+
+
+class VideoVariantCreateResponse(BaseModel):
+    variant_group_id: str
+    videos: list[VideoVariantSummary]
+
+
+class VideoVariantGroupResponse(BaseModel):
+    variant_group_id: str
+    videos: list[VideoResponse]
+
+
 class VideoRetryResponse(BaseModel):
     id: str
     status: str
 
 
+class VideoCancelResponse(BaseModel):
+    id: str
+    status: str
+
+
+class VideoPromoteResponse(BaseModel):
+    id: str
+    status: str
+    quality: str
+
+
 class MusicTrackResponse(BaseModel):
     id: str
     name: str
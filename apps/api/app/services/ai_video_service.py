@@ -1,7 +1,6 @@
 import json
 import logging
 import mimetypes
-import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,6 +14,9 @@ from app.core.config import Settings
 from app.db.repositories.video_repository import VideoRepository
 from app.models.entities import Video, VideoStatus
 from app.services.asset_tagging_service import AssetTaggingService
+from app.services.image_ingest import ImageIngestService
+from app.services.render_cancellation import CancellationToken, RenderCancelled
+from app.services.render_scheduler import RenderScheduler
 from app.services.render_service import celery_app
 from app.services.video_pipeline import VideoPipelineService
 
@@ -86,6 +88,7 @@ class AIVideoCreateService:
         self.settings = settings
         self.repo = VideoRepository(db)
         self.pipeline = VideoPipelineService()
+        self.cancel_token: CancellationToken | None = None
         self.tagging = AssetTaggingService(db)
         self.providers = {
             'sora2': self.generate_with_sora2,
@@ -255,7 +258,10 @@ class AIVideoCreateService:
                     raise ProviderError(str(error_message))
                 if time.time() - start > OPENAI_VIDEO_TIMEOUT_SECONDS:
                     raise ProviderError('OpenAI Sora generation timed out while waiting for completion')
-                time.sleep(OPENAI_POLL_INTERVAL_SECONDS)
+                if self.cancel_token is not None:
+                    self.cancel_token.sleep(OPENAI_POLL_INTERVAL_SECONDS)
+                else:
+                    time.sleep(OPENAI_POLL_INTERVAL_SECONDS)
 
             content_response = client.get(
                 f'https://api.openai.com/v1/videos/{openai_video_id}/content',
@@ -351,25 +357,28 @@ class AIVideoCreateService:
         render_id = f'{render_id_prefix}-{Path.cwd().name}-{Path(script[:32]).stem}'.replace(' ', '-')
         render_id = f'{render_id_prefix}-{abs(hash((script, image_url, voice, aspect_ratio, resolution, duration_seconds))) % 10**10}'
         image_urls = [image_url] if image_url else []
-        self.pipeline.render_video_from_assets(
-            video_id=render_id,
-            title='AI Generated Video',
-            script=script,
-            language_name=language,
-            voice_name=voice,
-            audio_sample_rate_hz=audio_sample_rate_hz,
-            image_urls=image_urls,
-            aspect_ratio=aspect_ratio,
-            resolution=resolution,
-            duration_mode='custom',
-            duration_seconds=duration_seconds,
-            captions_enabled=True,
-            music_mode='none',
-            music_track_id=None,
-            music_file_url=None,
-            music_volume=0,
-            duck_music=False,
-        )
+        with RenderScheduler().admit(render_id, cancel_token=self.cancel_token) as slot:
+            self.pipeline.thread_budget = slot.threads
+            self.pipeline.cancel_token = self.cancel_token
+            self.pipeline.render_video_from_assets(
+                video_id=render_id,
+                title='AI Generated Video',
+                script=script,
+                language_name=language,
+                voice_name=voice,
+                audio_sample_rate_hz=audio_sample_rate_hz,
+                image_urls=image_urls,
+                aspect_ratio=aspect_ratio,
+                resolution=resolution,
+                duration_mode='custom',
+                duration_seconds=duration_seconds,
+                captions_enabled=True,
+                music_mode='none',
+                music_track_id=None,
+                music_file_url=None,
+                music_volume=0,
+                duck_music=False,
+            )
         return (f'/static/renders/{render_id}.mp4', f'/static/renders/{render_id}.jpg')
 
     def _map_openai_video_size(self, aspect_ratio: str, resolution: str) -> str:
@@ -408,11 +417,7 @@ class AIVideoCreateService:
                 parsed = urlparse(image_url)
                 filename = Path(parsed.path).name or 'reference-image.png'
                 mime = response.headers.get('content-type') or mimetypes.guess_type(filename)[0] or 'image/png'
-                prepared_bytes = self._prepare_reference_image_bytes(
-                    source_bytes=response.content,
-                    source_name=filename,
-                    target_size=size,
-                )
+                prepared_bytes = self._prepare_reference_image_bytes(source_bytes=response.content, target_size=size)
                 return f'{Path(filename).stem}-{size.replace("x", "-")}.png', prepared_bytes, 'image/png'
 
         normalized = image_url
@@ -423,47 +428,25 @@ class AIVideoCreateService:
         local_path = Path('data') / normalized
         if not local_path.exists():
             raise ProviderError('Reference image file not found locally')
-        prepared_bytes = self._prepare_reference_image_bytes(
-            source_bytes=local_path.read_bytes(),
-            source_name=local_path.name,
-            target_size=size,
-        )
+        prepared_bytes = self._prepare_reference_image_bytes(source_path=local_path, target_size=size)
         return f'{local_path.stem}-{size.replace("x", "-")}.png', prepared_bytes, 'image/png'
 
-    def _prepare_reference_image_bytes(self, *, source_bytes: bytes, source_name: str, target_size: str) -> bytes:
+    def _prepare_reference_image_bytes(
+        self,
+        *,
+        target_size: str,
+        source_bytes: bytes | None = None,
+        source_path: Path | None = None,
+    ) -> bytes:
         width_str, height_str = target_size.split('x', 1)
-        width = int(width_str)
-        height = int(height_str)
-
-        temp_dir = Path('data/tmp')
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        source_path = temp_dir / f'sora-source-{abs(hash((source_name, len(source_bytes), target_size))) % 10**10}{Path(source_name).suffix or ".img"}'
-        output_path = temp_dir / f'sora-prepared-{abs(hash((source_name, target_size))) % 10**10}.png'
-
-        source_path.write_bytes(source_bytes)
+        size = (int(width_str), int(height_str))
+        ingest = ImageIngestService()
         try:
-            subprocess.run(
-                [
-                    'ffmpeg',
-                    '-y',
-                    '-i',
-                    str(source_path),
-                    '-vf',
-                    f'scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,format=rgba',
-                    '-frames:v',
-                    '1',
-                    str(output_path),
-                ],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            return output_path.read_bytes()
-        except subprocess.CalledProcessError as exc:
-            raise ProviderError(f'Failed to prepare reference image for Sora: {self._truncate_error(exc.stderr.decode("utf-8", errors="ignore"))}') from exc
-        finally:
-            if source_path.exists():
-                source_path.unlink()
+            if source_path is not None:
+                return ingest.derivative(source_path, size, 'png').read_bytes()
+            return ingest.derivative_bytes(source_bytes or b'', size, 'png')
+        except (ValueError, RuntimeError) as exc:
+            raise ProviderError(f'Failed to prepare reference image for Sora: {self._truncate_error(str(exc))}') from exc
 
     def _truncate_error(self, value: str, limit: int = 260) -> str:
         compact = ' '.join(value.split())
@@ -519,10 +502,9 @@ class AIVideoCreateService:
         return int(duration_seconds)
 
     def _update_video_progress(self, video_id: str, progress: int) -> None:
-        video = self.repo.get_by_id(video_id)
-        if not video:
-            return
-        self.repo.update(video, status=VideoStatus.processing, progress=progress)
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+        self.repo.set_progress(video_id, progress, VideoStatus.processing)
 
 
 @celery_app.task(name='process_ai_video')
@@ -534,11 +516,16 @@ def celery_process_ai_video(video_id: str) -> None:
     settings = get_settings()
     service = AIVideoCreateService(db, settings)
     repo = VideoRepository(db)
+    cancel_token = CancellationToken(video_id)
+    service.cancel_token = cancel_token
     try:
+        cancel_token.raise_if_cancelled()
         video = repo.get_by_id(video_id)
         if not video:
             return
-        repo.update(video, status=VideoStatus.processing, progress=20)
+        if repo.start(video_id, progress=20) is None:
+            # Cancelled, or already settled by another delivery of this task.
+            return
         payload = {
             'videoId': video.id,
             'imageUrl': video.source_image_url,
@@ -556,24 +543,23 @@ def celery_process_ai_video(video_id: str) -> None:
         adapter = service.providers.get(video.selected_model or '')
         if not adapter:
             raise ProviderError(f'Unsupported model: {video.selected_model}')
-        repo.update(video, progress=55)
+        repo.set_progress(video_id, 55, VideoStatus.processing)
         result = adapter(payload)
-        repo.update(
-            video,
-            provider_name=result.provider,
+        cancel_token.raise_if_cancelled()
+        repo.update(video, provider_name=result.provider)
+        completed = repo.complete(
+            video_id,
             output_url=result.video_url,
             thumbnail_url=video.source_image_url or video.thumbnail_url,
-            progress=100,
-            status=VideoStatus.completed,
-            error_message=None,
         )
-        refreshed = repo.get_by_id(video_id)
-        if refreshed:
-            service.tagging.auto_tag_video(refreshed)
+        if completed:
+            service.tagging.auto_tag_video(completed)
+    except RenderCancelled:
+        logger.info('ai_video_job_cancelled', extra={'render_id': video_id})
+        repo.set_progress(video_id, 0, VideoStatus.cancelled)
     except Exception as exc:
         logger.exception('ai_video_job_failed', extra={'render_id': video_id})
-        target = repo.get_by_id(video_id)
-        if target:
-            repo.update(target, status=VideoStatus.failed, progress=100, error_message=str(exc)[:255])
+        repo.fail(video_id, str(exc), progress=100)
     finally:
+        cancel_token.clear()
         db.close()
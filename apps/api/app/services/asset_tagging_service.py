@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.core.config import get_settings
 from app.db.repositories.asset_tag_repository import AssetTagRepository
 from app.models.entities import ImageGeneration, Video
+from app.services.scratch_workspace import scratch_workspace
 
 logger = logging.getLogger(__name__)
 
@@ -52,10 +53,12 @@ class AssetTaggingService:
     def auto_tag_video(self, video: Video) -> list[str]:
         prompt = ' '.join(filter(None, [video.title or '', video.script or '', video.selected_model or '', video.aspect_ratio, video.resolution]))
         # Tag multiple representative frames so video search is not limited to a single thumbnail.
-        frame_urls = self._extract_video_frame_urls(video)
         vision_tags: list[str] = []
-        for frame_url in frame_urls:
-            vision_tags.extend(self._extract_vision_tags(image_url=frame_url, prompt=prompt, content_type='video'))
+        with scratch_workspace(f'tag-{video.id}') as work_dir:
+            for frame_path in self._extract_video_frames(video, work_dir):
+                vision_tags.extend(
+                    self._extract_vision_tags(image_url=self._file_to_data_url(frame_path), prompt=prompt, content_type='video')
+                )
         if not vision_tags and video.thumbnail_url:
             vision_tags.extend(self._extract_vision_tags(image_url=video.thumbnail_url, prompt=prompt, content_type='video'))
         derived = self._derive_tags(prompt)
@@ -149,11 +152,14 @@ class AssetTaggingService:
         return output
 
     def _to_openai_image_url(self, image_url: str) -> str | None:
-        if image_url.startswith('http://') or image_url.startswith('https://'):
+        if image_url.startswith(('http://', 'https://', 'data:')):
             return image_url
         local_path = self._url_to_local_path(image_url)
         if not local_path.exists():
             return None
+        return self._file_to_data_url(local_path)
+
+    def _file_to_data_url(self, local_path: Path) -> str:
         mime_type = mimetypes.guess_type(local_path.name)[0] or 'image/png'
         encoded = base64.b64encode(local_path.read_bytes()).decode('utf-8')
         return f'data:{mime_type};base64,{encoded}'
@@ -171,7 +177,7 @@ class AssetTaggingService:
             path = path.lstrip('/')
         return Path('data') / path
 
-    def _extract_video_frame_urls(self, video: Video) -> list[str]:
+    def _extract_video_frames(self, video: Video, work_dir: Path) -> list[Path]:
         local_path = None
         if video.output_url:
             candidate = self._url_to_local_path(video.output_url)
@@ -188,19 +194,15 @@ class AssetTaggingService:
         if not timestamps:
             return []
 
-        frame_dir = Path('data/tmp/video_tag_frames')
-        frame_dir.mkdir(parents=True, exist_ok=True)
-
-        frame_urls: list[str] = []
+        frame_paths: list[Path] = []
         for index, second in enumerate(timestamps, start=1):
-            frame_name = f'{video.id}-frame-{index}.jpg'
-            frame_path = frame_dir / frame_name
+            frame_path = work_dir / f'{video.id}-frame-{index}.jpg'
             try:
                 self._write_video_frame(local_path=local_path, output_path=frame_path, timestamp=second)
-                frame_urls.append(f'/static/tmp/video_tag_frames/{frame_name}')
+                frame_paths.append(frame_path)
             except Exception as exc:
                 logger.warning('video_frame_tag_extract_failed', extra={'asset_id': video.id, 'timestamp': second, 'error': str(exc)})
-        return frame_urls
+        return frame_paths
 
     def _probe_video_duration(self, local_path: Path) -> float:
         try:
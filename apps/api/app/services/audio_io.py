@@ -0,0 +1,150 @@
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+_MP3_BITRATES = {
+    (3, 3): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (3, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (3, 1): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 3): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 1): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+@dataclass(frozen=True)
+class AudioInfo:
+    codec: str
+    sample_rate_hz: int
+    channels: int
+    duration_seconds: float
+
+
+@dataclass(frozen=True)
+class _WavLayout:
+    format_tag: int
+    channels: int
+    sample_rate_hz: int
+    sample_width: int
+    data_offset: int
+    data_size: int
+
+
+def audio_info(path: Path) -> AudioInfo | None:
+    # Header-only parsing of the two formats the TTS providers produce, so duration and
+    # sample-rate checks never fork ffprobe. Anything else returns None.
+    try:
+        with path.open('rb') as handle:
+            head = handle.read(12)
+            if head[:4] == b'RIFF' and head[8:12] == b'WAVE':
+                return _wav_info(path)
+        if path.suffix == '.mp3' or head[:3] == b'ID3' or head[:2] in (b'\xff\xfb', b'\xff\xf3', b'\xff\xf2'):
+            return _mp3_info(path.read_bytes())
+    except (OSError, ValueError, struct.error):
+        return None
+    return None
+
+
+def audio_duration(path: Path) -> float | None:
+    info = audio_info(path)
+    return round(info.duration_seconds, 3) if info is not None else None
+
+
+def _wav_info(path: Path) -> AudioInfo:
+    layout = _wav_layout(path)
+    block_align = layout.channels * layout.sample_width
+    if not block_align or not layout.sample_rate_hz:
+        raise ValueError(f'Invalid WAV format chunk: {path}')
+    frames = layout.data_size // block_align
+    return AudioInfo('pcm', layout.sample_rate_hz, layout.channels, frames / float(layout.sample_rate_hz))
+
+
+def _wav_layout(path: Path) -> _WavLayout:
+    file_size = os.path.getsize(path)
+    fmt: tuple[int, int, int, int] | None = None
+    with path.open('rb') as handle:
+        riff = handle.read(12)
+        if riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+            raise ValueError(f'Not a WAV file: {path}')
+        while True:
+            chunk = handle.read(8)
+            if len(chunk) < 8:
+                raise ValueError(f'WAV file has no data chunk: {path}')
+            chunk_id, chunk_size = chunk[:4], struct.unpack('<I', chunk[4:])[0]
+            if chunk_id == b'fmt ':
+                format_tag, channels, sample_rate, _, _, bits = struct.unpack('<HHIIHH', handle.read(16))
+                fmt = (format_tag, channels, sample_rate, bits // 8)
+                handle.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+            elif chunk_id == b'data':
+                if fmt is None:
+                    raise ValueError(f'WAV data precedes its format chunk: {path}')
+                offset = handle.tell()
+                # Streamed WAVs carry 0xFFFFFFFF (or a stale size); the file length wins.
+                size = min(chunk_size, file_size - offset)
+                return _WavLayout(*fmt, data_offset=offset, data_size=size)
+            else:
+                handle.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def _mp3_info(data: bytes) -> AudioInfo:
+    position = 0
+    if data[:3] == b'ID3' and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        position = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    sample_rate = channels = 0
+    samples = 0
+    first = True
+    end = len(data) - 4
+    while position <= end:
+        frame = _mp3_frame(data, position)
+        if frame is None:
+            position += 1
+            continue
+        length, frame_samples, frame_rate, frame_channels = frame
+        if first:
+            first = False
+            sample_rate, channels = frame_rate, frame_channels
+            # A LAME/Xing tag frame is silence that decoders drop; its frame count, when
+            # present, saves walking the rest of the file.
+            tag = data[position:position + length]
+            marker = max(tag.find(b'Xing'), tag.find(b'Info'))
+            if marker >= 0:
+                flags = struct.unpack('>I', tag[marker + 4:marker + 8])[0]
+                if flags & 0x1:
+                    count = struct.unpack('>I', tag[marker + 8:marker + 12])[0]
+                    return AudioInfo('mp3', sample_rate, channels, count * frame_samples / float(sample_rate))
+                position += length
+                continue
+        samples += frame_samples
+        position += length
+    if not sample_rate:
+        raise ValueError('No MPEG audio frames found')
+    return AudioInfo('mp3', sample_rate, channels, samples / float(sample_rate))
+
+
+def _mp3_frame(data: bytes, position: int) -> tuple[int, int, int, int] | None:
+    header = struct.unpack('>I', data[position:position + 4])[0]
+    if header >> 21 != 0x7FF:
+        return None
+    version = (header >> 19) & 0x3
+    layer = (header >> 17) & 0x3
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0x3
+    if version == 1 or layer == 0 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = _MP3_BITRATES[(3 if version == 3 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header >> 9) & 0x1
+    channels = 1 if (header >> 6) & 0x3 == 3 else 2
+    if layer == 3:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate, channels
+    frame_samples = 576 if layer == 1 and version != 3 else 1152
+    length = (frame_samples // 8) * bitrate // sample_rate + padding
+    return length, frame_samples, sample_rate, channels
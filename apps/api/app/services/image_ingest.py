@@ -0,0 +1,81 @@
+import hashlib
+import io
+import logging
+import os
+from pathlib import Path
+
+from app.services.render_cache import content_digest
+
+logger = logging.getLogger(__name__)
+
+# Masters are kept large enough for a 1080p long edge but never at full phone-camera size.
+MASTER_MAX_EDGE = 2160
+MASTER_JPEG_QUALITY = 92
+DERIVATIVE_JPEG_QUALITY = 90
+
+
+def _load_pillow():
+    try:
+        from PIL import Image, ImageOps
+    except ModuleNotFoundError as exc:
+        raise RuntimeError('Pillow dependency is missing. Install requirements in apps/api.') from exc
+    return Image, ImageOps
+
+
+class ImageIngestService:
+    def __init__(self, masters_dir: Path | None = None, derivatives_dir: Path | None = None) -> None:
+        self.masters_dir = masters_dir or Path('data/uploads')
+        self.derivatives_dir = derivatives_dir or Path('data/image_derivatives')
+        self.masters_dir.mkdir(parents=True, exist_ok=True)
+        self.derivatives_dir.mkdir(parents=True, exist_ok=True)
+
+    def ingest(self, data: bytes) -> Path:
+        # Masters are content-addressed, so re-uploading the same photo decodes nothing.
+        master_path = self.masters_dir / f'{hashlib.sha256(data).hexdigest()[:32]}.jpg'
+        if master_path.exists() and master_path.stat().st_size > 0:
+            return master_path
+
+        image = self._open(data)
+        image.thumbnail((MASTER_MAX_EDGE, MASTER_MAX_EDGE))
+        self._save(image, master_path, 'JPEG', quality=MASTER_JPEG_QUALITY)
+        logger.info('image_master_stored', extra={'path': str(master_path), 'size': image.size})
+        return master_path
+
+    def derivative(self, source_path: Path, target_size: tuple[int, int], image_format: str = 'jpg') -> Path:
+        width, height = target_size
+        extension = 'png' if image_format == 'png' else 'jpg'
+        digest = content_digest(source_path)
+        derivative_path = self.derivatives_dir / f'{digest[:32]}-{width}x{height}.{extension}'
+        if derivative_path.exists() and derivative_path.stat().st_size > 0:
+            return derivative_path
+
+        _, ImageOps = _load_pillow()
+        image = self._open(source_path.read_bytes(), target_size=target_size)
+        # Same letterboxing as the ffmpeg scale+pad the renderers used to run per frame.
+        framed = ImageOps.pad(image, (width, height), color=(0, 0, 0))
+        if extension == 'png':
+            self._save(framed, derivative_path, 'PNG')
+        else:
+            self._save(framed, derivative_path, 'JPEG', quality=DERIVATIVE_JPEG_QUALITY)
+        return derivative_path
+
+    def derivative_bytes(self, data: bytes, target_size: tuple[int, int], image_format: str = 'png') -> bytes:
+        return self.derivative(self.ingest(data), target_size, image_format).read_bytes()
+
+    def _open(self, data: bytes, target_size: tuple[int, int] | None = None):
+        Image, ImageOps = _load_pillow()
+        try:
+            image = Image.open(io.BytesIO(data))
+            # JPEG can decode straight at a reduced scale, which is most of the cost for
+            # large phone photos.
+            edge = max(target_size) if target_size else MASTER_MAX_EDGE
+            image.draft('RGB', (edge, edge))
+            image = ImageOps.exif_transpose(image)
+            return image.convert('RGB')
+        except (OSError, Image.DecompressionBombError) as exc:
+            raise ValueError('Unsupported or corrupt image upload') from exc
+
+    def _save(self, image, target: Path, image_format: str, **options) -> None:
+        temp_target = target.with_name(f'.{target.name}.{os.getpid()}.tmp')
+        image.save(temp_target, format=image_format, **options)
+        os.replace(temp_target, target)
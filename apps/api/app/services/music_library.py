@@ -0,0 +1,209 @@
+import json
+import logging
+import math
+import os
+import re
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from app.services.render_cache import content_digest
+from app.services.tts import SUPPORTED_SAMPLE_RATES
+
+logger = logging.getLogger(__name__)
+
+BUILTIN_MUSIC_TRACKS: dict[str, str] = {
+    'uplift-india': '/static/music/uplift-india.mp3',
+    'corporate-calm': '/static/music/corporate-calm.mp3',
+    'soft-motivation': '/static/music/soft-motivation.mp3',
+}
+
+# Placeholder tones for builtin tracks that are not shipped with the checkout.
+BUILTIN_PLACEHOLDER_TONES = {
+    'uplift-india.mp3': 392,
+    'corporate-calm.mp3': 330,
+    'soft-motivation.mp3': 262,
+}
+
+# Renders mix at the voiceover's rate, so beds are prepared for every rate TTS can produce.
+MUSIC_SAMPLE_RATES = SUPPORTED_SAMPLE_RATES
+# Pre-looped beds cover the video lengths renders most often ask for; anything longer is
+# rounded up to the next minute.
+PRELOOP_SECONDS = (15, 30, 60, 120, 300)
+MUSIC_TARGET_LUFS = -16.0
+MUSIC_TRUE_PEAK_DB = -1.5
+
+_DURATION_PATTERN = re.compile(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
+@dataclass(frozen=True)
+class MusicTrackInfo:
+    digest: str
+    duration_seconds: float
+    integrated_lufs: float | None
+    true_peak_db: float | None
+    loudness_range: float | None
+    gain_db: float
+
+
+class MusicLibrary:
+    # Tracks are decoded, loudness-analysed and resampled once per content digest; renders
+    # then mix against PCM beds that already have the right rate, level and length.
+    def __init__(self, library_dir: Path | None = None) -> None:
+        self.library_dir = library_dir or Path('data/music_library')
+        self.library_dir.mkdir(parents=True, exist_ok=True)
+
+    def ingest(self, source: Path) -> MusicTrackInfo:
+        info = self.analyze(source)
+        for sample_rate in MUSIC_SAMPLE_RATES:
+            self.normalized(source, sample_rate)
+        return info
+
+    def analyze(self, source: Path) -> MusicTrackInfo:
+        cached = self.cached_info(source)
+        if cached is not None:
+            return cached
+
+        digest = content_digest(source)
+        stderr = self._ffmpeg([
+            '-hide_banner',
+            '-nostats',
+            '-i',
+            str(source),
+            '-af',
+            f'loudnorm=I={MUSIC_TARGET_LUFS}:TP={MUSIC_TRUE_PEAK_DB}:print_format=json',
+            '-f',
+            'null',
+            '-',
+        ])
+        stats = self._parse_loudnorm(stderr)
+        integrated = stats.get('input_i')
+        true_peak = stats.get('input_tp')
+        gain_db = 0.0
+        if integrated is not None:
+            gain_db = MUSIC_TARGET_LUFS - integrated
+            if true_peak is not None:
+                # Never push the loudest sample past the true-peak ceiling.
+                gain_db = min(gain_db, MUSIC_TRUE_PEAK_DB - true_peak)
+        info = MusicTrackInfo(
+            digest=digest,
+            duration_seconds=self._parse_duration(stderr),
+            integrated_lufs=integrated,
+            true_peak_db=true_peak,
+            loudness_range=stats.get('input_lra'),
+            gain_db=round(gain_db, 2),
+        )
+        self._write_atomic(self._info_path(digest), json.dumps(asdict(info)).encode('utf-8'))
+        logger.info('music_track_analyzed', extra={'path': str(source), **asdict(info)})
+        return info
+
+    def cached_info(self, source: Path) -> MusicTrackInfo | None:
+        try:
+            data = json.loads(self._info_path(content_digest(source)).read_text(encoding='utf-8'))
+            return MusicTrackInfo(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def normalized(self, source: Path, sample_rate: int) -> Path:
+        info = self.analyze(source)
+        target = self.library_dir / f'{info.digest[:32]}-{sample_rate}.wav'
+        if target.exists() and target.stat().st_size > 0:
+            return target
+        self._render_to(target, [
+            '-i',
+            str(source),
+            '-af',
+            f'volume={info.gain_db}dB',
+            '-ar',
+            str(sample_rate),
+            '-ac',
+            '2',
+            '-c:a',
+            'pcm_s16le',
+        ])
+        return target
+
+    def bed(self, source: Path, total_duration: float, sample_rate: int) -> Path:
+        info = self.analyze(source)
+        base = self.normalized(source, sample_rate)
+        if info.duration_seconds >= total_duration:
+            return base
+        length = next(
+            (seconds for seconds in PRELOOP_SECONDS if seconds >= total_duration),
+            int(math.ceil(total_duration / 60.0)) * 60,
+        )
+        target = self.library_dir / f'{info.digest[:32]}-{sample_rate}-loop{length}.wav'
+        if target.exists() and target.stat().st_size > 0:
+            return target
+        # Looping PCM is a copy, not a decode; this runs once per track, rate and length.
+        self._render_to(target, ['-stream_loop', '-1', '-i', str(base), '-t', str(length), '-c:a', 'pcm_s16le'])
+        return target
+
+    def owns(self, path: Path) -> bool:
+        return path.parent.resolve() == self.library_dir.resolve()
+
+    def ensure_builtin_tracks(self) -> None:
+        for url in BUILTIN_MUSIC_TRACKS.values():
+            target = Path('data') / url.replace('/static/', '', 1)
+            try:
+                if not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    frequency = BUILTIN_PLACEHOLDER_TONES.get(target.name, 330)
+                    self._ffmpeg(['-y', '-f', 'lavfi', '-i', f'sine=frequency={frequency}:duration=12', '-q:a', '4', str(target)])
+                self.ingest(target)
+            except RuntimeError as exc:
+                logger.warning('music_preview_seed_failed', extra={'error': str(exc), 'path': str(target)})
+
+    def _render_to(self, target: Path, args: list[str]) -> None:
+        temp_target = target.with_name(f'.{target.stem}.{os.getpid()}.{uuid4().hex[:8]}.tmp{target.suffix}')
+        try:
+            self._ffmpeg(['-y', *args, str(temp_target)])
+            os.replace(temp_target, target)
+        finally:
+            temp_target.unlink(missing_ok=True)
+
+    def _ffmpeg(self, args: list[str]) -> str:
+        try:
+            result = subprocess.run(['ffmpeg', *args], check=True, capture_output=True, text=True)
+        except FileNotFoundError as exc:
+            raise RuntimeError('ffmpeg is not installed') from exc
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f'Music ingest failed: {(exc.stderr or "")[-800:]}') from exc
+        return result.stderr
+
+    def _parse_loudnorm(self, stderr: str) -> dict[str, float | None]:
+        start, end = stderr.rfind('{'), stderr.rfind('}')
+        if start < 0 or end < start:
+            return {}
+        try:
+            raw = json.loads(stderr[start:end + 1])
+        except ValueError:
+            return {}
+        stats: dict[str, float | None] = {}
+        for name in ('input_i', 'input_tp', 'input_lra'):
+            try:
+                value = float(raw.get(name, ''))
+            except (TypeError, ValueError):
+                value = None
+            # Silent tracks report -inf; there is nothing to normalise.
+            stats[name] = value if value is not None and math.isfinite(value) else None
+        return stats
+
+    def _parse_duration(self, stderr: str) -> float:
+        match = _DURATION_PATTERN.search(stderr)
+        if not match:
+            return 0.0
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    def _info_path(self, digest: str) -> Path:
+        return self.library_dir / f'{digest[:32]}.json'
+
+    def _write_atomic(self, target: Path, data: bytes) -> None:
+        temp_target = target.with_name(f'.{target.name}.{os.getpid()}.{uuid4().hex[:8]}.tmp')
+        try:
+            temp_target.write_bytes(data)
+            os.replace(temp_target, target)
+        finally:
+            temp_target.unlink(missing_ok=True)
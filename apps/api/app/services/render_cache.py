@@ -0,0 +1,169 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pipeline output changes for identical inputs so stale renders are not served.
+RENDER_CACHE_VERSION = 4
+DIGEST_MEMO_ENTRIES = 4096
+# Entries used this recently are never evicted, so a render that just restored or stored a
+# stage can still link it.
+EVICTION_GRACE_SECONDS = 600
+# Eviction frees down to this share of the budget so it does not run on every store.
+EVICTION_LOW_WATERMARK = 0.9
+# A store sweeps the directory at most this often per process.
+EVICTION_INTERVAL_SECONDS = 60
+
+
+def content_digest(path: Path) -> str:
+    stat = path.stat()
+    return _file_digest(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=DIGEST_MEMO_ENTRIES)
+def _file_digest(path: str, size: int, mtime_ns: int) -> str:
+    # Size and mtime are part of the memo key, so an edited file is hashed again.
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    def __init__(self, cache_dir: Path | None = None, max_bytes: int | None = None) -> None:
+        self.cache_dir = cache_dir or Path('data/render_cache')
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes if max_bytes is not None else get_settings().render_cache_max_bytes
+        self._last_evicted_at = 0.0
+
+    def make_key(self, inputs: dict[str, Any]) -> str:
+        normalized = json.dumps({'version': RENDER_CACHE_VERSION, **inputs}, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def contains(self, key: str, names: list[str]) -> bool:
+        entries = [self._entry_path(key, name) for name in names]
+        return all(entry.exists() and entry.stat().st_size > 0 for entry in entries)
+
+    def restore(self, key: str, targets: dict[str, Path]) -> bool:
+        if not self.contains(key, list(targets)):
+            return False
+        for name, target in targets.items():
+            entry = self._entry_path(key, name)
+            self._link(entry, target)
+            self._touch(entry)
+        logger.info('render_cache_hit', extra={'cache_key': key})
+        return True
+
+    def store(self, key: str, artifacts: dict[str, Path]) -> None:
+        try:
+            for name, source in artifacts.items():
+                if source.exists() and source.stat().st_size > 0:
+                    self._link(source, self._entry_path(key, name))
+        except OSError as exc:
+            logger.warning('render_cache_store_failed', extra={'cache_key': key, 'error': str(exc)})
+        if time.monotonic() - self._last_evicted_at >= EVICTION_INTERVAL_SECONDS:
+            self.evict()
+
+    def evict(self) -> int:
+        # Only bytes the cache alone holds count against the budget: an entry still hard
+        # linked from a render output or scratch workspace frees nothing when unlinked.
+        # Keys go least recently used first, all of their artifacts together.
+        self._last_evicted_at = time.monotonic()
+        if self.max_bytes <= 0:
+            return 0
+        files: list[tuple[str, Path, os.stat_result]] = []
+        links_in_cache: dict[tuple[int, int], int] = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith('.'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.name.split('.', 1)[0], Path(entry.path), stat))
+                inode = (stat.st_dev, stat.st_ino)
+                links_in_cache[inode] = links_in_cache.get(inode, 0) + 1
+
+        keys: dict[str, tuple[float, int, list[Path]]] = {}
+        counted: set[tuple[int, int]] = set()
+        total = 0
+        for key, path, stat in files:
+            inode = (stat.st_dev, stat.st_ino)
+            owned = stat.st_size if stat.st_nlink <= links_in_cache[inode] else 0
+            if owned and inode not in counted:
+                counted.add(inode)
+                total += owned
+            used_at, size, paths = keys.get(key, (0.0, 0, []))
+            keys[key] = (max(used_at, stat.st_atime, stat.st_mtime), size + owned, [*paths, path])
+        if total <= self.max_bytes:
+            return 0
+
+        target = int(self.max_bytes * EVICTION_LOW_WATERMARK)
+        cutoff = time.time() - EVICTION_GRACE_SECONDS
+        evicted = 0
+        for key, (used_at, size, paths) in sorted(keys.items(), key=lambda item: item[1][0]):
+            if total <= target or used_at >= cutoff:
+                break
+            if not size:
+                continue
+            for path in paths:
+                path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        if evicted:
+            logger.info('render_cache_evicted', extra={'entries': evicted, 'bytes_after': total, 'max_bytes': self.max_bytes})
+        return evicted
+
+    def get_value(self, key: str) -> Any:
+        entry = self._entry_path(key, 'json')
+        try:
+            return json.loads(entry.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def put_value(self, key: str, value: Any) -> None:
+        entry = self._entry_path(key, 'json')
+        temp_entry = entry.with_name(f'.{entry.name}.{os.getpid()}.{uuid4().hex[:8]}.tmp')
+        try:
+            temp_entry.write_text(json.dumps(value), encoding='utf-8')
+            os.replace(temp_entry, entry)
+        except OSError as exc:
+            logger.warning('render_cache_store_failed', extra={'cache_key': key, 'error': str(exc)})
+        finally:
+            temp_entry.unlink(missing_ok=True)
+
+    def _touch(self, entry: Path) -> None:
+        # Recency is the access time; set it explicitly since most mounts use relatime.
+        try:
+            os.utime(entry, ns=(time.time_ns(), entry.stat().st_mtime_ns))
+        except OSError:
+            pass
+
+    def _entry_path(self, key: str, name: str) -> Path:
+        return self.cache_dir / f'{key}.{name}'
+
+    def _link(self, source: Path, target: Path) -> None:
+        # Link to a temporary name first so readers never observe a partial file. Segment
+        # encoders and variant prebuilds store from several threads of one process.
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_target = target.with_name(f'.{target.name}.{os.getpid()}.{uuid4().hex[:8]}.tmp')
+        try:
+            try:
+                os.link(source, temp_target)
+            except OSError:
+                shutil.copy2(source, temp_target)
+            os.replace(temp_target, target)
+        finally:
+            temp_target.unlink(missing_ok=True)
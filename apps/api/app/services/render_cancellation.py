@@ -0,0 +1,54 @@
+import time
+from pathlib import Path
+
+
+class RenderCancelled(Exception):
+    pass
+
+
+class CancellationToken:
+    # A marker file rather than in-memory state: the API process sets it, and whichever
+    # worker process owns the job observes it.
+    def __init__(self, job_id: str, control_dir: Path | None = None) -> None:
+        self.job_id = job_id
+        self.control_dir = control_dir or Path('data/render_control/cancelled')
+        self.control_dir.mkdir(parents=True, exist_ok=True)
+        self.marker_path = self.control_dir / job_id
+
+    def cancel(self) -> None:
+        self.marker_path.touch()
+
+    def clear(self) -> None:
+        self.marker_path.unlink(missing_ok=True)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.marker_path.exists()
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise RenderCancelled(f'Render {self.job_id} was cancelled')
+
+    def sleep(self, seconds: float, check_interval: float = 0.5) -> None:
+        deadline = time.monotonic() + seconds
+        while True:
+            self.raise_if_cancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(check_interval, remaining))
+
+
+class GroupCancellationToken:
+    # Work shared by several jobs (a variant group's slideshow prebuild) is only worth
+    # stopping once every job that would use it has been cancelled.
+    def __init__(self, tokens: list[CancellationToken]) -> None:
+        self.tokens = tokens
+
+    @property
+    def cancelled(self) -> bool:
+        return all(token.cancelled for token in self.tokens)
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise RenderCancelled(f'All {len(self.tokens)} jobs sharing this work were cancelled')
@@ -0,0 +1,124 @@
+import fcntl
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from app.core.config import get_settings
+from app.services.render_cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenderSlot:
+    index: int
+    threads: int
+
+
+class RenderScheduler:
+    # Slots are flock()ed files in a node-local directory, so the cap holds across every
+    # worker process on the host and a crashed worker releases its slot automatically.
+    def __init__(self, slots_dir: Path | None = None, max_jobs: int | None = None) -> None:
+        settings = get_settings()
+        cpu_count = os.cpu_count() or 1
+        self.max_jobs = max(1, max_jobs or settings.render_max_concurrent_jobs or cpu_count // 4)
+        self.threads_per_job = max(1, cpu_count // self.max_jobs)
+        configured_dir = settings.render_slots_dir
+        self.slots_dir = slots_dir or (
+            Path(configured_dir) if configured_dir else Path(tempfile.gettempdir()) / 'rangmanch-render-slots'
+        )
+        self.queue_dir = self.slots_dir / 'queue'
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def admit(
+        self,
+        job_id: str,
+        poll_seconds: float = 0.5,
+        cancel_token: CancellationToken | None = None,
+    ) -> Iterator[RenderSlot]:
+        started = time.monotonic()
+        marker_path = self.queue_dir / f'{job_id}.{os.getpid()}.{threading.get_ident()}'
+        marker: IO[str] | None = None
+        try:
+            while True:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                acquired = self._try_acquire()
+                if acquired is not None:
+                    break
+                if marker is None:
+                    # Lock under a hidden name first so queue_depth never sees an unlocked marker.
+                    pending_path = marker_path.with_name(f'.{marker_path.name}')
+                    marker = pending_path.open('w')
+                    fcntl.flock(marker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    os.replace(pending_path, marker_path)
+                    logger.info('render_job_queued', extra={'render_id': job_id, **self.queue_depth()})
+                time.sleep(poll_seconds)
+        finally:
+            if marker is not None:
+                marker_path.unlink(missing_ok=True)
+                marker.close()
+
+        index, handle = acquired
+        logger.info(
+            'render_job_admitted',
+            extra={'render_id': job_id, 'slot': index, 'waited_seconds': round(time.monotonic() - started, 3)},
+        )
+        try:
+            yield RenderSlot(index=index, threads=self.threads_per_job)
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            handle.close()
+
+    def queue_depth(self) -> dict[str, int]:
+        active = sum(1 for index in range(self.max_jobs) if self._is_locked(self._slot_path(index)))
+        queued = 0
+        for marker_path in self.queue_dir.iterdir():
+            if marker_path.name.startswith('.'):
+                continue
+            if self._is_locked(marker_path):
+                queued += 1
+            else:
+                # Left behind by a worker that died while waiting.
+                marker_path.unlink(missing_ok=True)
+        return {
+            'max_jobs': self.max_jobs,
+            'active': active,
+            'queued': queued,
+            'threads_per_job': self.threads_per_job,
+        }
+
+    def _try_acquire(self) -> tuple[int, IO[str]] | None:
+        for index in range(self.max_jobs):
+            handle = self._slot_path(index).open('a')
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                handle.close()
+                continue
+            return index, handle
+        return None
+
+    def _is_locked(self, path: Path) -> bool:
+        try:
+            handle = path.open('a')
+        except OSError:
+            return False
+        with handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return True
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            return False
+
+    def _slot_path(self, index: int) -> Path:
+        return self.slots_dir / f'slot-{index}.lock'
@@ -45,7 +45,8 @@ class RenderService:
 @celery_app.task(name='process_render')
 def process_render(render_id: str, include_broll: bool) -> None:
     from app.db.session import SessionLocal
-    from app.services.video_pipeline import VideoPipelineService
+    from app.services.render_scheduler import RenderScheduler
+    from app.services.video_pipeline import VideoPipelineService, throttled_progress
 
     db = SessionLocal()
     repo = RenderRepository(db)
@@ -60,11 +61,18 @@ def process_render(render_id: str, include_broll: bool) -> None:
         project = project_repo.get_by_id(render.project_id)
         repo.set_progress(render_id, 55, RenderStatus.rendering)
 
-        video_path, thumb_path = pipeline.build_video(
-            render_id=render_id,
-            script=project.script if project else '',
-            include_broll=include_broll,
-        )
+        with RenderScheduler().admit(render_id) as slot:
+            pipeline.thread_budget = slot.threads
+            video_path, thumb_path = pipeline.build_video(
+                render_id=render_id,
+                script=project.script if project else '',
+                include_broll=include_broll,
+                on_progress=throttled_progress(
+                    lambda percent: repo.set_progress(render_id, percent, RenderStatus.rendering),
+                    start=55,
+                    end=95,
+                ),
+            )
 
         video_url = f'/static/renders/{render_id}.mp4'
         thumb_url = f'/static/renders/{render_id}.jpg'
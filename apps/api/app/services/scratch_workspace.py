@@ -0,0 +1,62 @@
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import uuid4
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Workspaces older than this belong to workers that died without cleaning up.
+STALE_WORKSPACE_SECONDS = 24 * 60 * 60
+
+
+def scratch_root() -> Path:
+    configured = get_settings().render_scratch_dir
+    root = Path(configured) if configured else Path(tempfile.gettempdir()) / 'rangmanch-scratch'
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+@contextmanager
+def scratch_workspace(job_id: str) -> Iterator[Path]:
+    root = scratch_root()
+    _sweep_stale(root)
+    workspace = Path(tempfile.mkdtemp(prefix=f'{job_id}-', dir=root))
+    try:
+        yield workspace
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+def promote(source: Path, target: Path) -> None:
+    # Scratch may live on tmpfs or another disk, where rename fails with EXDEV; copy next
+    # to the target first so the public path only ever sees a complete file.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(source, target)
+    except OSError:
+        # Threads of one worker promote concurrently, so the pid alone is not unique.
+        temp_target = target.with_name(f'.{target.name}.{os.getpid()}.{uuid4().hex[:8]}.tmp')
+        try:
+            shutil.copyfile(source, temp_target)
+            os.replace(temp_target, target)
+        finally:
+            temp_target.unlink(missing_ok=True)
+        source.unlink(missing_ok=True)
+
+
+def _sweep_stale(root: Path) -> None:
+    cutoff = time.time() - STALE_WORKSPACE_SECONDS
+    for entry in root.iterdir():
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
+                logger.info('scratch_workspace_swept', extra={'path': str(entry)})
+        except OSError:
+            continue
@@ -0,0 +1,26 @@
+from openai import OpenAI
+
+from app.core.config import get_settings
+
+
+def translate_script(text: str, target_language: str) -> str:
+    settings = get_settings()
+    translated_text = ''
+    if settings.openai_api_key:
+        client = OpenAI(api_key=settings.openai_api_key)
+        response = client.chat.completions.create(
+            model=settings.openai_model,
+            temperature=0.2,
+            messages=[
+                {
+                    'role': 'system',
+                    'content': 'Translate the provided text accurately into the requested target language. Return only the translated text with no explanation.',
+                },
+                {
+                    'role': 'user',
+                    'content': f'Target language: {target_language}\n\nText:\n{text}',
+                },
+            ],
+        )
+        translated_text = (response.choices[0].message.content or '').strip()
+    return translated_text or text
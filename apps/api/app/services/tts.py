@@ -1,12 +1,25 @@
 import asyncio
 import hashlib
 import logging
+import os
+import re
+import shlex
+import struct
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+import wave
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
+from typing import TypeVar
+from uuid import uuid4
 
 from app.core.config import get_settings
+from app.services.audio_io import audio_info
+from app.services.tts_cache import atts_cache_index, single_flight, tts_cache_index
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +51,25 @@ class VoiceoverResult:
     provider_message: str | None = None
 
 
+@dataclass(frozen=True)
+class VoiceoverStream:
+    media_type: str
+    resolved_voice: str
+    provider: str
+    cached: bool
+    chunks: AsyncIterator[bytes]
+    provider_message: str | None = None
+
+
+@dataclass(frozen=True)
+class _StreamHead:
+    media_type: str
+    resolved_voice: str
+    provider: str
+    cached: bool
+    provider_message: str | None = None
+
+
 LANGUAGE_OPTIONS: tuple[LanguageOption, ...] = (
     LanguageOption('en-IN', 'English', 'English'),
     LanguageOption('hi-IN', 'Hindi', 'हिन्दी'),
@@ -164,6 +196,25 @@ PREVIEW_WINDOW_SECONDS = 600
 PREVIEW_MAX_REQUESTS_PER_WINDOW = 20
 _preview_request_log: dict[str, list[float]] = {}
 SUPPORTED_SAMPLE_RATES = (8000, 22050, 48000)
+STREAM_READ_BYTES = 64 * 1024
+_STREAM_END = object()
+# Scripts longer than a preview are split into sentence chunks of roughly these sizes.
+TTS_CHUNK_SCRIPT_CHARS = 320
+TTS_CHUNK_MIN_CHARS = 40
+TTS_CHUNK_MAX_CHARS = 300
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?।॥])\s+|\n+')
+_CLAUSE_BREAK = re.compile(r'(?<=[,;:])\s+')
+
+T = TypeVar('T')
+
+# One long-lived event loop per process runs every synthesis, so provider semaphores are
+# shared by API requests, Celery tasks and their threads alike.
+_loop_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+_provider_semaphores: dict[str, asyncio.Semaphore] = {}
+# Hedged syntheses that lost the race but are still filling the cache.
+_background_tasks: set[asyncio.Future] = set()
 
 
 def list_tts_languages() -> list[LanguageOption]:
@@ -254,23 +305,28 @@ def _normalize_sample_rate(sample_rate_hz: int | None) -> int:
 
 def _resample_audio_file(path: Path, sample_rate_hz: int) -> Path:
     normalized_rate = _normalize_sample_rate(sample_rate_hz)
+    # Reading the header spares the ffmpeg fork when the provider already produced this rate.
+    info = audio_info(path)
+    if info is not None and info.sample_rate_hz == normalized_rate:
+        return path
     target = path.with_name(f'{path.stem}_{normalized_rate}{path.suffix}')
     if target.exists() and target.stat().st_size > 0:
         return target
     try:
-        subprocess.run(
-            [
-                'ffmpeg',
-                '-y',
-                '-i',
-                str(path),
-                '-ar',
-                str(normalized_rate),
-                str(target),
-            ],
-            check=True,
-            capture_output=True,
-        )
+        with _staged_output(target) as temp_path:
+            subprocess.run(
+                [
+                    'ffmpeg',
+                    '-y',
+                    '-i',
+                    str(path),
+                    '-ar',
+                    str(normalized_rate),
+                    str(temp_path),
+                ],
+                check=True,
+                capture_output=True,
+            )
         if target.exists() and target.stat().st_size > 0:
             return target
     except Exception as exc:  # noqa: BLE001
@@ -278,6 +334,67 @@ def _resample_audio_file(path: Path, sample_rate_hz: int) -> Path:
     return path
 
 
+def _tts_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_pid
+    with _loop_lock:
+        # A forked worker inherits the loop object but not the thread running it.
+        if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='tts-event-loop', daemon=True).start()
+            _loop = loop
+            _loop_pid = os.getpid()
+            _provider_semaphores.clear()
+        return _loop
+
+
+def _run_on_tts_loop(coro: Coroutine[object, object, T]) -> T:
+    loop = _tts_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError('Synchronous TTS cannot be called from the TTS event loop; await agenerate_voiceover instead')
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+@asynccontextmanager
+async def _provider_slot(provider: str) -> AsyncIterator[None]:
+    semaphore = _provider_semaphores.get(provider)
+    if semaphore is None:
+        settings = get_settings()
+        limits = {
+            'sarvam': settings.tts_sarvam_max_concurrency,
+            'edge': settings.tts_edge_max_concurrency,
+            'gtts': settings.tts_gtts_max_concurrency,
+        }
+        semaphore = _provider_semaphores.setdefault(provider, asyncio.Semaphore(max(1, limits[provider])))
+    async with semaphore:
+        yield
+
+
+async def agenerate_voiceover(
+    script: str,
+    voice: str,
+    cache_dir: Path,
+    language: str | None = None,
+    sample_rate_hz: int = 22050,
+    allow_premium: bool = True,
+    hedge: bool = False,
+) -> VoiceoverResult:
+    coro = _generate_voiceover(
+        script=script,
+        voice=voice,
+        cache_dir=cache_dir,
+        language=language,
+        sample_rate_hz=sample_rate_hz,
+        allow_premium=allow_premium,
+        hedge=hedge,
+    )
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _tts_loop()))
+
+
 def generate_voiceover_detailed(
     script: str,
     voice: str,
@@ -285,6 +402,27 @@ def generate_voiceover_detailed(
     language: str | None = None,
     sample_rate_hz: int = 22050,
     allow_premium: bool = True,
+) -> VoiceoverResult:
+    return _run_on_tts_loop(
+        _generate_voiceover(
+            script=script,
+            voice=voice,
+            cache_dir=cache_dir,
+            language=language,
+            sample_rate_hz=sample_rate_hz,
+            allow_premium=allow_premium,
+        )
+    )
+
+
+async def _generate_voiceover(
+    script: str,
+    voice: str,
+    cache_dir: Path,
+    language: str | None,
+    sample_rate_hz: int,
+    allow_premium: bool,
+    hedge: bool = False,
 ) -> VoiceoverResult:
     text = script.strip()
     if not text:
@@ -295,62 +433,655 @@ def generate_voiceover_detailed(
     voice_option = resolve_voice_option(voice)
     normalized_sample_rate = _normalize_sample_rate(sample_rate_hz)
 
-    settings = get_settings()
-    key = hashlib.sha256(f'{settings.sarvam_model}:{voice_option.provider_voice}:{language_code}:{normalized_sample_rate}:{text}'.encode('utf-8')).hexdigest()
-    sarvam_path = cache_dir / f'{key}.wav'
+    index = await atts_cache_index(cache_dir)
+    sarvam_path = _sarvam_cache_path(cache_dir, text, voice_option.provider_voice, language_code, normalized_sample_rate)
 
-    if sarvam_path.exists() and sarvam_path.stat().st_size > 0:
+    if await index.alookup(sarvam_path):
         return VoiceoverResult(sarvam_path, voice_option.provider_voice, 'Sarvam AI', True, None)
 
-    sarvam_error: Exception | None = None
-    if settings.sarvam_api_key and allow_premium:
+    edge_voice = resolve_edge_voice(voice)
+    output_path = _fallback_cache_path(cache_dir, text, edge_voice, language_code, normalized_sample_rate)
+    # One synthesis per script across every API and worker process; concurrent requests for
+    # the same voiceover wait here and are then served from the cache it produced.
+    async with AsyncExitStack() as lock:
+        waited = await lock.enter_async_context(single_flight(cache_dir, sarvam_path.name))
+        if waited:
+            if await index.alookup(sarvam_path):
+                return VoiceoverResult(sarvam_path, voice_option.provider_voice, 'Sarvam AI', True, None)
+            if await index.alookup(output_path):
+                return VoiceoverResult(output_path, edge_voice, 'Fallback TTS', True, None)
+        return await _synthesize_voiceover(
+            text=text,
+            cache_dir=cache_dir,
+            language_code=language_code,
+            voice_option=voice_option,
+            edge_voice=edge_voice,
+            normalized_sample_rate=normalized_sample_rate,
+            sarvam_path=sarvam_path,
+            output_path=output_path,
+            allow_premium=allow_premium,
+            hedge=hedge,
+            lock=lock,
+        )
+
+
+async def _synthesize_voiceover(
+    *,
+    text: str,
+    cache_dir: Path,
+    language_code: str,
+    voice_option: VoiceOption,
+    edge_voice: str,
+    normalized_sample_rate: int,
+    sarvam_path: Path,
+    output_path: Path,
+    allow_premium: bool,
+    hedge: bool = False,
+    lock: AsyncExitStack | None = None,
+) -> VoiceoverResult:
+    settings = get_settings()
+
+    # Long scripts are synthesized sentence by sentence; each chunk is cached under its own
+    # key, so an edit only re-synthesizes the sentences that changed.
+    chunks = split_script_chunks(text) if len(text) > TTS_CHUNK_SCRIPT_CHARS else [text]
+    sarvam = partial(
+        _synthesize_sarvam,
+        text=text,
+        chunks=chunks,
+        cache_dir=cache_dir,
+        language_code=language_code,
+        voice_option=voice_option,
+        normalized_sample_rate=normalized_sample_rate,
+        sarvam_path=sarvam_path,
+    )
+    fallback = partial(
+        _synthesize_fallback,
+        text=text,
+        chunks=chunks,
+        cache_dir=cache_dir,
+        language_code=language_code,
+        edge_voice=edge_voice,
+        normalized_sample_rate=normalized_sample_rate,
+        output_path=output_path,
+    )
+
+    if not (settings.sarvam_api_key and allow_premium):
+        return await fallback(sarvam_error=None)
+    if hedge:
+        return await _hedged_voiceover(sarvam, fallback, settings.tts_preview_hedge_after_seconds, lock)
+    try:
+        return await sarvam()
+    except Exception as exc:  # noqa: BLE001
+        return await fallback(sarvam_error=exc)
+
+
+async def _hedged_voiceover(
+    sarvam: Callable[[], Awaitable[VoiceoverResult]],
+    fallback: Callable[..., Awaitable[VoiceoverResult]],
+    hedge_after_seconds: float,
+    lock: AsyncExitStack | None = None,
+) -> VoiceoverResult:
+    # Sarvam gets a head start; if it has not answered by then the fallback races it and
+    # the first voiceover wins. The loser keeps running so its file still lands in the cache,
+    # and it takes the caller's single-flight lock with it until it settles.
+    sarvam_task = asyncio.ensure_future(sarvam())
+    done, _ = await asyncio.wait({sarvam_task}, timeout=max(hedge_after_seconds, 0.0))
+    if done:
         try:
-            resolved_speaker = _synthesize_with_sarvam(
-                text=text,
-                output_path=sarvam_path,
-                language_code=language_code,
-                speaker=voice_option.provider_voice,
-            )
-            if sarvam_path.exists() and sarvam_path.stat().st_size > 0:
-                logger.info('sarvam_tts_generated', extra={'voice': resolved_speaker, 'language': language_code})
-                return VoiceoverResult(sarvam_path, resolved_speaker, 'Sarvam AI', False, None)
+            return sarvam_task.result()
         except Exception as exc:  # noqa: BLE001
-            sarvam_error = exc
-            logger.warning('sarvam_tts_failed', extra={'voice': voice_option.provider_voice, 'language': language_code, 'error': str(exc)})
+            return await fallback(sarvam_error=exc)
 
-    edge_voice = resolve_edge_voice(voice)
-    fallback_key = hashlib.sha256(f'{edge_voice}:{language_code}:{normalized_sample_rate}:{text}'.encode('utf-8')).hexdigest()
-    output_path = cache_dir / f'{fallback_key}.mp3'
-    if output_path.exists() and output_path.stat().st_size > 0:
-        return VoiceoverResult(output_path, edge_voice, 'Fallback TTS', True, None)
+    fallback_task = asyncio.ensure_future(fallback(sarvam_error=None))
+    pending = {sarvam_task, fallback_task}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in (sarvam_task, fallback_task):
+                if task in done and task.exception() is None:
+                    result = task.result()
+                    if task is fallback_task:
+                        result = replace(result, provider_message='Sarvam preview was slow, fallback voice was used')
+                    logger.info('tts_hedge_settled', extra={'winner': result.provider, 'voice': result.resolved_voice})
+                    return result
+    finally:
+        for task in pending:
+            _background_tasks.add(task)
+            task.add_done_callback(_finish_background_task)
+        if pending and lock is not None:
+            release = asyncio.ensure_future(_release_after(pending, lock.pop_all()))
+            _background_tasks.add(release)
+            release.add_done_callback(_finish_background_task)
+    sarvam_error = sarvam_task.exception()
+    raise RuntimeError(f'Sarvam TTS failed: {sarvam_error}') from fallback_task.exception()
+
+
+async def _release_after(tasks: set[asyncio.Future], lock: AsyncExitStack) -> None:
+    try:
+        await asyncio.wait(tasks)
+    finally:
+        await lock.aclose()
 
-    edge_error: Exception | None = None
+
+def _finish_background_task(task: asyncio.Future) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning('tts_hedge_loser_failed', extra={'error': str(task.exception())})
+
+
+async def _synthesize_sarvam(
+    *,
+    text: str,
+    chunks: list[str],
+    cache_dir: Path,
+    language_code: str,
+    voice_option: VoiceOption,
+    normalized_sample_rate: int,
+    sarvam_path: Path,
+) -> VoiceoverResult:
     try:
-        try:
-            asyncio.run(_synthesize_to_path(text=text, edge_voice=edge_voice, output_path=output_path))
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            try:
-                loop.run_until_complete(_synthesize_to_path(text=text, edge_voice=edge_voice, output_path=output_path))
-            finally:
-                loop.close()
+        if len(chunks) > 1:
+            await _synthesize_chunks(
+                chunks,
+                sarvam_path,
+                partial(
+                    _sarvam_chunk,
+                    cache_dir=cache_dir,
+                    speaker=voice_option.provider_voice,
+                    language_code=language_code,
+                    sample_rate_hz=normalized_sample_rate,
+                ),
+            )
+            resolved_speaker = voice_option.provider_voice
+        else:
+            async with _provider_slot('sarvam'):
+                with _staged_output(sarvam_path) as temp_path:
+                    resolved_speaker = await asyncio.to_thread(
+                        _synthesize_with_sarvam,
+                        text=text,
+                        output_path=temp_path,
+                        language_code=language_code,
+                        speaker=voice_option.provider_voice,
+                    )
+        if not _has_audio(sarvam_path):
+            raise RuntimeError('Sarvam output file was not generated')
     except Exception as exc:  # noqa: BLE001
-        edge_error = exc
+        logger.warning('sarvam_tts_failed', extra={'voice': voice_option.provider_voice, 'language': language_code, 'error': str(exc)})
+        raise
+    index = await atts_cache_index(cache_dir)
+    await index.arecord(
+        sarvam_path,
+        provider='sarvam',
+        voice=resolved_speaker,
+        language=language_code,
+        sample_rate_hz=normalized_sample_rate,
+    )
+    logger.info('sarvam_tts_generated', extra={'voice': resolved_speaker, 'language': language_code, 'chunks': len(chunks)})
+    return VoiceoverResult(sarvam_path, resolved_speaker, 'Sarvam AI', False, None)
+
 
-    if (not output_path.exists() or output_path.stat().st_size == 0) and edge_error is not None:
+async def _synthesize_fallback(
+    *,
+    text: str,
+    chunks: list[str],
+    cache_dir: Path,
+    language_code: str,
+    edge_voice: str,
+    normalized_sample_rate: int,
+    output_path: Path,
+    sarvam_error: Exception | None,
+    edge_error: Exception | None = None,
+) -> VoiceoverResult:
+    index = await atts_cache_index(cache_dir)
+    if await index.alookup(output_path):
+        return VoiceoverResult(output_path, edge_voice, 'Fallback TTS', True, None)
+
+    # A caller that already tried edge-tts passes its error and goes straight to gTTS.
+    if edge_error is None:
+        try:
+            if len(chunks) > 1:
+                # Chunks stay on one provider so the stitched track keeps a single voice; a
+                # failed chunk drops the whole script to gTTS below.
+                await _synthesize_chunks(
+                    chunks,
+                    output_path,
+                    partial(
+                        _edge_chunk,
+                        cache_dir=cache_dir,
+                        edge_voice=edge_voice,
+                        language_code=language_code,
+                        sample_rate_hz=normalized_sample_rate,
+                    ),
+                )
+            else:
+                async with _provider_slot('edge'):
+                    with _staged_output(output_path) as temp_path:
+                        await _synthesize_to_path(text=text, edge_voice=edge_voice, output_path=temp_path)
+        except Exception as exc:  # noqa: BLE001
+            edge_error = exc
+
+    if not _has_audio(output_path) and edge_error is not None:
         fallback_lang = GTTS_LANGUAGE_MAP.get(language_code, 'en')
-        _synthesize_with_gtts(text=text, output_path=output_path, lang=fallback_lang)
+        async with _provider_slot('gtts'):
+            with _staged_output(output_path) as temp_path:
+                await asyncio.to_thread(_synthesize_with_gtts, text=text, output_path=temp_path, lang=fallback_lang)
 
-    if not output_path.exists() or output_path.stat().st_size == 0:
+    if not _has_audio(output_path):
         if sarvam_error is not None:
             raise RuntimeError(f'Sarvam TTS failed: {sarvam_error}')
         raise RuntimeError('TTS output file was not generated')
 
-    output_path = _resample_audio_file(output_path, normalized_sample_rate)
+    fallback_provider = 'gtts' if edge_error is not None else 'edge'
+    await index.arecord(
+        output_path,
+        provider=fallback_provider,
+        voice=edge_voice,
+        language=language_code,
+        sample_rate_hz=normalized_sample_rate,
+    )
+    resampled_path = await asyncio.to_thread(_resample_audio_file, output_path, normalized_sample_rate)
+    if resampled_path != output_path:
+        await index.arecord(
+            resampled_path,
+            provider=fallback_provider,
+            voice=edge_voice,
+            language=language_code,
+            sample_rate_hz=normalized_sample_rate,
+        )
+    output_path = resampled_path
     message = f'Sarvam preview failed, fallback voice was used: {sarvam_error}' if sarvam_error is not None else None
     return VoiceoverResult(output_path, edge_voice, 'Fallback TTS', False, message)
 
 
+def split_script_chunks(text: str) -> list[str]:
+    pieces: list[str] = []
+    for sentence in _SENTENCE_BREAK.split(text):
+        sentence = sentence.strip()
+        if len(sentence) <= TTS_CHUNK_MAX_CHARS:
+            if sentence:
+                pieces.append(sentence)
+            continue
+        for clause in _CLAUSE_BREAK.split(sentence):
+            clause = clause.strip()
+            while len(clause) > TTS_CHUNK_MAX_CHARS:
+                cut = clause.rfind(' ', 0, TTS_CHUNK_MAX_CHARS)
+                cut = cut if cut > 0 else TTS_CHUNK_MAX_CHARS
+                pieces.append(clause[:cut].strip())
+                clause = clause[cut:].strip()
+            if clause:
+                pieces.append(clause)
+
+    # Short sentences ride along with the next one. The decision depends only on the
+    # sentence itself, so an edit never shifts the chunk boundaries around it.
+    chunks: list[str] = []
+    pending = ''
+    for piece in pieces:
+        pending = f'{pending} {piece}'.strip()
+        if len(pending) >= TTS_CHUNK_MIN_CHARS:
+            chunks.append(pending)
+            pending = ''
+    if pending:
+        if chunks:
+            chunks[-1] = f'{chunks[-1]} {pending}'
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+async def _synthesize_chunks(
+    chunks: list[str],
+    target: Path,
+    synthesize: Callable[[str], Awaitable[tuple[Path, bool]]],
+) -> None:
+    unique_chunks = list(dict.fromkeys(chunks))
+    results = dict(zip(unique_chunks, await asyncio.gather(*(synthesize(chunk) for chunk in unique_chunks))))
+    await asyncio.to_thread(_concat_audio, [results[chunk][0] for chunk in chunks], target)
+    logger.info(
+        'tts_chunks_stitched',
+        extra={
+            'path': str(target),
+            'chunks': len(chunks),
+            'reused': sum(1 for _, cached in results.values() if cached),
+        },
+    )
+
+
+async def _sarvam_chunk(
+    text: str,
+    *,
+    cache_dir: Path,
+    speaker: str,
+    language_code: str,
+    sample_rate_hz: int,
+) -> tuple[Path, bool]:
+    index = await atts_cache_index(cache_dir)
+    path = _sarvam_cache_path(cache_dir, text, speaker, language_code, sample_rate_hz)
+    if await index.alookup(path):
+        return path, True
+    async with single_flight(cache_dir, path.name) as waited:
+        if waited and await index.alookup(path):
+            return path, True
+        async with _provider_slot('sarvam'):
+            with _staged_output(path) as temp_path:
+                await asyncio.to_thread(
+                    _synthesize_with_sarvam,
+                    text=text,
+                    output_path=temp_path,
+                    language_code=language_code,
+                    speaker=speaker,
+                )
+    if not _has_audio(path):
+        raise RuntimeError('Sarvam returned no audio for a script chunk')
+    await index.arecord(path, provider='sarvam', voice=speaker, language=language_code, sample_rate_hz=sample_rate_hz)
+    return path, False
+
+
+async def _edge_chunk(
+    text: str,
+    *,
+    cache_dir: Path,
+    edge_voice: str,
+    language_code: str,
+    sample_rate_hz: int,
+) -> tuple[Path, bool]:
+    index = await atts_cache_index(cache_dir)
+    path = _fallback_cache_path(cache_dir, text, edge_voice, language_code, sample_rate_hz)
+    if await index.alookup(path):
+        return path, True
+    async with single_flight(cache_dir, path.name) as waited:
+        if waited and await index.alookup(path):
+            return path, True
+        async with _provider_slot('edge'):
+            with _staged_output(path) as temp_path:
+                await _synthesize_to_path(text=text, edge_voice=edge_voice, output_path=temp_path)
+    if not _has_audio(path):
+        raise RuntimeError('edge-tts returned no audio for a script chunk')
+    await index.arecord(path, provider='edge', voice=edge_voice, language=language_code, sample_rate_hz=sample_rate_hz)
+    return path, False
+
+
+def _concat_audio(paths: list[Path], target: Path) -> None:
+    # PCM joins sample-exact with stream copy; MP3 is decoded and re-encoded once so frame
+    # padding between chunks does not turn into audible gaps.
+    codec_args = ['-c', 'copy'] if target.suffix == '.wav' else ['-c:a', 'libmp3lame', '-q:a', '2']
+    with _staged_output(target) as temp_target:
+        list_path = temp_target.with_suffix('.txt')
+        list_path.write_text('\n'.join(f"file {shlex.quote(str(path.resolve()))}" for path in paths), encoding='utf-8')
+        try:
+            subprocess.run(
+                ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', str(list_path), *codec_args, str(temp_target)],
+                check=True,
+                capture_output=True,
+            )
+        except FileNotFoundError as exc:
+            raise RuntimeError('ffmpeg is not installed') from exc
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f'TTS chunk stitching failed: {(exc.stderr or b"").decode("utf-8", "replace")[-400:]}') from exc
+        finally:
+            list_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _staged_output(target: Path) -> Iterator[Path]:
+    # Writers fill a private temp file that is renamed into place only once complete, so no
+    # reader or concurrent writer ever sees a partial voiceover.
+    temp_path = target.with_name(f'.{target.stem}.{os.getpid()}.{uuid4().hex[:8]}{target.suffix}')
+    try:
+        yield temp_path
+        if _has_audio(temp_path):
+            os.replace(temp_path, target)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _sarvam_cache_path(cache_dir: Path, text: str, speaker: str, language_code: str, sample_rate_hz: int) -> Path:
+    model = get_settings().sarvam_model
+    key = hashlib.sha256(f'{model}:{speaker}:{language_code}:{sample_rate_hz}:{text}'.encode('utf-8')).hexdigest()
+    return cache_dir / f'{key}.wav'
+
+
+def _fallback_cache_path(cache_dir: Path, text: str, edge_voice: str, language_code: str, sample_rate_hz: int) -> Path:
+    key = hashlib.sha256(f'{edge_voice}:{language_code}:{sample_rate_hz}:{text}'.encode('utf-8')).hexdigest()
+    return cache_dir / f'{key}.mp3'
+
+
+def _has_audio(path: Path) -> bool:
+    return path.exists() and path.stat().st_size > 0
+
+
+async def astream_voiceover(
+    script: str,
+    voice: str,
+    cache_dir: Path,
+    language: str | None = None,
+    sample_rate_hz: int = 22050,
+    allow_premium: bool = True,
+) -> VoiceoverStream:
+    # Synthesis runs on the shared TTS loop (where the provider limits live); audio is
+    # handed across to the caller's loop as it arrives.
+    items = _bridge_to_caller(
+        lambda: _voiceover_stream(
+            script=script,
+            voice=voice,
+            cache_dir=cache_dir,
+            language=language,
+            sample_rate_hz=sample_rate_hz,
+            allow_premium=allow_premium,
+        )
+    )
+    head = await anext(items)
+    return VoiceoverStream(
+        media_type=head.media_type,
+        resolved_voice=head.resolved_voice,
+        provider=head.provider,
+        cached=head.cached,
+        chunks=items,
+        provider_message=head.provider_message,
+    )
+
+
+async def _bridge_to_caller(produce: Callable[[], AsyncIterator[object]]) -> AsyncIterator:
+    caller_loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for item in produce():
+                caller_loop.call_soon_threadsafe(queue.put_nowait, item)
+        except Exception as exc:  # noqa: BLE001
+            caller_loop.call_soon_threadsafe(queue.put_nowait, exc)
+        else:
+            caller_loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+    future = asyncio.run_coroutine_threadsafe(pump(), _tts_loop())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # A client that disconnects stops the synthesis; partial output is discarded.
+        future.cancel()
+
+
+async def _voiceover_stream(
+    *,
+    script: str,
+    voice: str,
+    cache_dir: Path,
+    language: str | None,
+    sample_rate_hz: int,
+    allow_premium: bool,
+) -> AsyncIterator[object]:
+    text = script.strip()
+    if not text:
+        raise ValueError('Script is required for TTS voiceover generation')
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    language_code = resolve_language_code(language)
+    voice_option = resolve_voice_option(voice)
+    normalized_sample_rate = _normalize_sample_rate(sample_rate_hz)
+    settings = get_settings()
+    index = await atts_cache_index(cache_dir)
+    sarvam_path = _sarvam_cache_path(cache_dir, text, voice_option.provider_voice, language_code, normalized_sample_rate)
+    edge_voice = resolve_edge_voice(voice)
+    output_path = _fallback_cache_path(cache_dir, text, edge_voice, language_code, normalized_sample_rate)
+    premium = bool(settings.sarvam_api_key and allow_premium)
+
+    if await index.alookup(sarvam_path):
+        yield _StreamHead('audio/wav', voice_option.provider_voice, 'Sarvam AI', True)
+        async for data in _file_chunks(sarvam_path):
+            yield data
+        return
+    if not premium and await index.alookup(output_path):
+        yield _StreamHead(_media_type(output_path), edge_voice, 'Fallback TTS', True)
+        async for data in _file_chunks(output_path):
+            yield data
+        return
+
+    sarvam_error: Exception | None = None
+    if premium:
+        # Sarvam has no incremental output, so a long script's first sentence is synthesized
+        # on its own and streamed while the rest are still in flight; chunk files land in the
+        # cache. Text that fits one request goes out as one request.
+        chunks = split_script_chunks(text) if len(text) > TTS_CHUNK_SCRIPT_CHARS else [text]
+        unique_chunks = list(dict.fromkeys(chunks))
+        tasks = {
+            chunk: asyncio.ensure_future(
+                _sarvam_chunk(
+                    chunk,
+                    cache_dir=cache_dir,
+                    speaker=voice_option.provider_voice,
+                    language_code=language_code,
+                    sample_rate_hz=normalized_sample_rate,
+                )
+            )
+            for chunk in unique_chunks
+        }
+        try:
+            try:
+                first_path, _ = await tasks[chunks[0]]
+            except Exception as exc:  # noqa: BLE001
+                sarvam_error = exc
+                logger.warning('sarvam_tts_failed', extra={'voice': voice_option.provider_voice, 'language': language_code, 'error': str(exc)})
+            else:
+                yield _StreamHead('audio/wav', voice_option.provider_voice, 'Sarvam AI', False)
+                header, frames = await asyncio.to_thread(_wav_stream_parts, first_path)
+                yield header
+                yield frames
+                chunk_paths = [first_path]
+                for chunk in chunks[1:]:
+                    path, _ = await tasks[chunk]
+                    chunk_paths.append(path)
+                    yield (await asyncio.to_thread(_wav_stream_parts, path))[1]
+                if chunk_paths != [sarvam_path]:
+                    await asyncio.to_thread(_concat_audio, chunk_paths, sarvam_path)
+                await index.arecord(
+                    sarvam_path,
+                    provider='sarvam',
+                    voice=voice_option.provider_voice,
+                    language=language_code,
+                    sample_rate_hz=normalized_sample_rate,
+                )
+                return
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        if await index.alookup(output_path):
+            yield _StreamHead(_media_type(output_path), edge_voice, 'Fallback TTS', True)
+            async for data in _file_chunks(output_path):
+                yield data
+            return
+
+    message = f'Sarvam preview failed, fallback voice was used: {sarvam_error}' if sarvam_error is not None else None
+    edge_error: Exception | None = None
+    try:
+        import edge_tts
+    except ModuleNotFoundError as exc:
+        edge_tts = None
+        edge_error = exc
+    if edge_tts is not None:
+        # edge-tts emits MP3 frames as they are synthesized; they go to the client and into
+        # a staged cache file at the same time.
+        async with _provider_slot('edge'):
+            with _staged_output(output_path) as temp_path:
+                stream = edge_tts.Communicate(text=text, voice=edge_voice).stream()
+                first_audio = b''
+                try:
+                    async for part in stream:
+                        if part['type'] == 'audio':
+                            first_audio = part['data']
+                            break
+                    else:
+                        raise RuntimeError('edge-tts returned no audio')
+                except Exception as exc:  # noqa: BLE001
+                    edge_error = exc
+                    logger.warning('edge_tts_stream_failed', extra={'voice': edge_voice, 'error': str(exc)})
+                if first_audio:
+                    yield _StreamHead('audio/mpeg', edge_voice, 'Fallback TTS', False, message)
+                    with temp_path.open('wb') as handle:
+                        handle.write(first_audio)
+                        yield first_audio
+                        async for part in stream:
+                            if part['type'] == 'audio':
+                                handle.write(part['data'])
+                                yield part['data']
+        if first_audio:
+            await index.arecord(output_path, provider='edge', voice=edge_voice, language=language_code, sample_rate_hz=normalized_sample_rate)
+            return
+
+    # gTTS cannot stream; synthesize the whole preview and send the file. edge-tts has
+    # already failed above, so it is not tried a second time.
+    async with single_flight(cache_dir, sarvam_path.name):
+        result = await _synthesize_fallback(
+            text=text,
+            chunks=[text],
+            cache_dir=cache_dir,
+            language_code=language_code,
+            edge_voice=edge_voice,
+            normalized_sample_rate=normalized_sample_rate,
+            output_path=output_path,
+            sarvam_error=sarvam_error,
+            edge_error=edge_error,
+        )
+    yield _StreamHead(_media_type(result.path), result.resolved_voice, result.provider, result.cached, result.provider_message)
+    async for data in _file_chunks(result.path):
+        yield data
+
+
+def _media_type(path: Path) -> str:
+    return 'audio/wav' if path.suffix == '.wav' else 'audio/mpeg'
+
+
+async def _file_chunks(path: Path) -> AsyncIterator[bytes]:
+    data = await asyncio.to_thread(path.read_bytes)
+    for offset in range(0, len(data), STREAM_READ_BYTES):
+        yield data[offset:offset + STREAM_READ_BYTES]
+
+
+def _wav_stream_parts(path: Path) -> tuple[bytes, bytes]:
+    with wave.open(str(path), 'rb') as reader:
+        channels = reader.getnchannels()
+        sample_width = reader.getsampwidth()
+        frame_rate = reader.getframerate()
+        frames = reader.readframes(reader.getnframes())
+    # The total length is unknown while later sentences are still synthesizing; players
+    # treat the 0xFFFFFFFF sizes as "read until the stream ends".
+    block_align = channels * sample_width
+    header = b''.join([
+        b'RIFF',
+        struct.pack('<I', 0xFFFFFFFF),
+        b'WAVEfmt ',
+        struct.pack('<IHHIIHH', 16, 1, channels, frame_rate, frame_rate * block_align, block_align, sample_width * 8),
+        b'data',
+        struct.pack('<I', 0xFFFFFFFF),
+    ])
+    return header, frames
+
+
 def generate_voiceover(
     script: str,
     voice: str,
@@ -370,13 +1101,13 @@ def generate_voiceover(
     return result.path, result.resolved_voice
 
 
-def assert_preview_rate_limit(user_id: str) -> None:
+def assert_preview_rate_limit(user_id: str, count: int = 1) -> None:
     now = time.time()
     window_start = now - PREVIEW_WINDOW_SECONDS
     timestamps = [item for item in _preview_request_log.get(user_id, []) if item >= window_start]
-    if len(timestamps) >= PREVIEW_MAX_REQUESTS_PER_WINDOW:
+    if len(timestamps) + count > PREVIEW_MAX_REQUESTS_PER_WINDOW:
         raise RuntimeError('Preview limit reached. Try again in a few minutes.')
-    timestamps.append(now)
+    timestamps.extend([now] * count)
     _preview_request_log[user_id] = timestamps
 
 
@@ -394,18 +1125,16 @@ def get_cached_voiceover(
     cache_dir.mkdir(parents=True, exist_ok=True)
     language_code = resolve_language_code(language)
     voice_option = resolve_voice_option(voice)
-    settings = get_settings()
     normalized_sample_rate = _normalize_sample_rate(sample_rate_hz)
 
-    sarvam_key = hashlib.sha256(f'{settings.sarvam_model}:{voice_option.provider_voice}:{language_code}:{normalized_sample_rate}:{text}'.encode('utf-8')).hexdigest()
-    sarvam_path = cache_dir / f'{sarvam_key}.wav'
-    if sarvam_path.exists() and sarvam_path.stat().st_size > 0:
+    index = tts_cache_index(cache_dir)
+    sarvam_path = _sarvam_cache_path(cache_dir, text, voice_option.provider_voice, language_code, normalized_sample_rate)
+    if index.lookup(sarvam_path):
         return sarvam_path, voice_option.provider_voice
 
     edge_voice = resolve_edge_voice(voice)
-    fallback_key = hashlib.sha256(f'{edge_voice}:{language_code}:{normalized_sample_rate}:{text}'.encode('utf-8')).hexdigest()
-    fallback_path = cache_dir / f'{fallback_key}.mp3'
-    if fallback_path.exists() and fallback_path.stat().st_size > 0:
+    fallback_path = _fallback_cache_path(cache_dir, text, edge_voice, language_code, normalized_sample_rate)
+    if index.lookup(fallback_path):
         return fallback_path, edge_voice
 
     return None
@@ -428,19 +1157,18 @@ def get_cached_voiceover_detailed(
     settings = get_settings()
     normalized_sample_rate = _normalize_sample_rate(sample_rate_hz)
 
-    sarvam_key = hashlib.sha256(f'{settings.sarvam_model}:{voice_option.provider_voice}:{language_code}:{normalized_sample_rate}:{text}'.encode('utf-8')).hexdigest()
-    sarvam_path = cache_dir / f'{sarvam_key}.wav'
-    if sarvam_path.exists() and sarvam_path.stat().st_size > 0:
+    index = tts_cache_index(cache_dir)
+    sarvam_path = _sarvam_cache_path(cache_dir, text, voice_option.provider_voice, language_code, normalized_sample_rate)
+    if index.lookup(sarvam_path):
         return VoiceoverResult(sarvam_path, voice_option.provider_voice, 'Sarvam AI', True, None)
 
-    edge_voice = resolve_edge_voice(voice)
-    fallback_key = hashlib.sha256(f'{edge_voice}:{language_code}:{normalized_sample_rate}:{text}'.encode('utf-8')).hexdigest()
-    fallback_path = cache_dir / f'{fallback_key}.mp3'
     if settings.sarvam_api_key:
         # If Sarvam is configured, do not keep serving an older fallback cache.
         # This allows previews to recover to the real provider once Sarvam is fixed.
         return None
-    if fallback_path.exists() and fallback_path.stat().st_size > 0:
+    edge_voice = resolve_edge_voice(voice)
+    fallback_path = _fallback_cache_path(cache_dir, text, edge_voice, language_code, normalized_sample_rate)
+    if index.lookup(fallback_path):
         return VoiceoverResult(fallback_path, edge_voice, 'Fallback TTS', True, None)
 
     return None
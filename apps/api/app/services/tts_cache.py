@@ -0,0 +1,292 @@
+import asyncio
+import fcntl
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Collection, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.services.audio_io import audio_duration
+
+logger = logging.getLogger(__name__)
+
+TTS_CACHE_INDEX_NAME = 'index.sqlite3'
+TTS_CACHE_SUFFIXES = ('.wav', '.mp3')
+TTS_CACHE_LOCK_DIR = '.locks'
+# Entries hit this recently are never evicted, so a render or preview that just looked a
+# file up can still read it.
+EVICTION_GRACE_SECONDS = 600
+# Eviction frees down to this share of the budget so it does not run on every write.
+EVICTION_LOW_WATERMARK = 0.9
+# A hit refreshes its row's last_hit_at only once this stale, well inside the eviction
+# grace period; other hits and all counters are written in batches.
+HIT_REFRESH_SECONDS = 60
+HIT_FLUSH_SECONDS = 30
+SINGLE_FLIGHT_POLL_SECONDS = 0.05
+# A synthesis that holds its key longer than this is presumed stuck; waiters go ahead.
+SINGLE_FLIGHT_TIMEOUT_SECONDS = 120.0
+
+_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS entries (
+        name TEXT PRIMARY KEY,
+        provider TEXT NOT NULL,
+        voice TEXT,
+        language TEXT,
+        sample_rate_hz INTEGER,
+        duration_seconds REAL,
+        size_bytes INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        last_hit_at REAL NOT NULL,
+        hit_count INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS entries_last_hit ON entries (last_hit_at)',
+    'CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)',
+)
+
+_indexes: dict[Path, 'TTSCacheIndex'] = {}
+_indexes_lock = threading.Lock()
+
+
+def tts_cache_index(cache_dir: Path) -> 'TTSCacheIndex':
+    key = cache_dir.resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = TTSCacheIndex(cache_dir)
+        return index
+
+
+async def atts_cache_index(cache_dir: Path) -> 'TTSCacheIndex':
+    # The first call per directory creates the schema and reconciles it against the disk.
+    return await asyncio.to_thread(tts_cache_index, cache_dir)
+
+
+@asynccontextmanager
+async def single_flight(cache_dir: Path, key: str) -> AsyncIterator[bool]:
+    # flock() on a per-key file excludes every other holder, in this process or any other
+    # API or worker process on the host, and is released if the holder dies. Yields whether
+    # the caller had to wait, i.e. whether someone else may have produced the result.
+    lock_path = _lock_path(cache_dir, key)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = lock_path.open('a')
+    waited = False
+    locked = False
+    deadline = time.monotonic() + SINGLE_FLIGHT_TIMEOUT_SECONDS
+    try:
+        while True:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                os.utime(handle.fileno())
+                break
+            except BlockingIOError:
+                waited = True
+                if time.monotonic() >= deadline:
+                    logger.warning('tts_single_flight_timeout', extra={'key': key})
+                    break
+                await asyncio.sleep(SINGLE_FLIGHT_POLL_SECONDS)
+        yield waited
+    finally:
+        if locked:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+        handle.close()
+
+
+def _lock_path(cache_dir: Path, key: str) -> Path:
+    # Keys are cache file names, so eviction can remove a key's lock file with its audio.
+    return cache_dir / TTS_CACHE_LOCK_DIR / f'{key}.lock'
+
+
+class TTSCacheIndex:
+    # Lookups are one primary-key read plus a stat of the indexed file; the index is shared
+    # by every API and worker process through SQLite's own locking.
+    def __init__(self, cache_dir: Path, max_bytes: int | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = cache_dir / TTS_CACHE_INDEX_NAME
+        self.max_bytes = max_bytes if max_bytes is not None else get_settings().tts_cache_max_bytes
+        self._pending_hits: dict[str, tuple[int, float]] = {}
+        self._pending_misses = 0
+        self._pending_lock = threading.Lock()
+        self._flushed_at = time.time()
+        with self._connect() as db:
+            db.execute('PRAGMA journal_mode=WAL')
+            for statement in _SCHEMA:
+                db.execute(statement)
+        self.reconcile()
+
+    def lookup(self, path: Path) -> bool:
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute('SELECT last_hit_at FROM entries WHERE name = ?', (path.name,)).fetchone()
+            hit = row is not None and path.is_file()
+            if row is not None and not hit:
+                # Removed by hand since it was indexed; forget it rather than hand out a dead path.
+                db.execute('DELETE FROM entries WHERE name = ?', (path.name,))
+            with self._pending_lock:
+                if hit:
+                    count, _ = self._pending_hits.get(path.name, (0, now))
+                    self._pending_hits[path.name] = (count + 1, now)
+                else:
+                    self._pending_misses += 1
+            # Hits are only counted in memory; the row is written when its recency is about to
+            # matter to eviction or when the batch is due, so reads rarely take the write lock.
+            stale = hit and now - row[0] >= HIT_REFRESH_SECONDS
+            if stale or now - self._flushed_at >= HIT_FLUSH_SECONDS:
+                self._flush_hits(db)
+        return hit
+
+    async def alookup(self, path: Path) -> bool:
+        # SQLite writes block; coroutines on the API or TTS loop go through a worker thread.
+        return await asyncio.to_thread(self.lookup, path)
+
+    async def arecord(self, path: Path, **metadata: object) -> None:
+        await asyncio.to_thread(self.record, path, **metadata)
+
+    def record(
+        self,
+        path: Path,
+        *,
+        provider: str,
+        voice: str | None = None,
+        language: str | None = None,
+        sample_rate_hz: int | None = None,
+    ) -> None:
+        try:
+            size_bytes = path.stat().st_size
+        except OSError:
+            return
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                '''
+                INSERT INTO entries (name, provider, voice, language, sample_rate_hz, duration_seconds,
+                                     size_bytes, created_at, last_hit_at, hit_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                ON CONFLICT(name) DO UPDATE SET
+                    provider = excluded.provider,
+                    voice = excluded.voice,
+                    language = excluded.language,
+                    sample_rate_hz = excluded.sample_rate_hz,
+                    duration_seconds = excluded.duration_seconds,
+                    size_bytes = excluded.size_bytes,
+                    last_hit_at = excluded.last_hit_at
+                ''',
+                (path.name, provider, voice, language, sample_rate_hz, audio_duration(path), size_bytes, now, now),
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        if self.max_bytes <= 0:
+            return 0
+        with self._connect() as db:
+            self._flush_hits(db)
+            total = db.execute('SELECT COALESCE(SUM(size_bytes), 0) FROM entries').fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+            target = int(self.max_bytes * EVICTION_LOW_WATERMARK)
+            cutoff = time.time() - EVICTION_GRACE_SECONDS
+            victims: list[str] = []
+            candidates = db.execute(
+                'SELECT name, size_bytes FROM entries WHERE last_hit_at < ? ORDER BY last_hit_at',
+                (cutoff,),
+            ).fetchall()
+            for name, size_bytes in candidates:
+                if total <= target:
+                    break
+                victims.append(name)
+                total -= size_bytes
+            # Rows go first so no lookup can return a file that is about to disappear.
+            db.executemany('DELETE FROM entries WHERE name = ?', [(name,) for name in victims])
+            self._bump(db, 'evictions', len(victims))
+        for name in victims:
+            (self.cache_dir / name).unlink(missing_ok=True)
+            _lock_path(self.cache_dir, name).unlink(missing_ok=True)
+        if victims:
+            logger.info('tts_cache_evicted', extra={'entries': len(victims), 'bytes_after': total, 'max_bytes': self.max_bytes})
+        return len(victims)
+
+    def reconcile(self) -> None:
+        # Brings the index in line with files written before it existed or removed by hand.
+        on_disk: dict[str, int] = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(TTS_CACHE_SUFFIXES) and not entry.name.startswith('.'):
+                    on_disk[entry.name] = entry.stat().st_size
+        now = time.time()
+        with self._connect() as db:
+            indexed = {name for (name,) in db.execute('SELECT name FROM entries')}
+            missing = indexed - on_disk.keys()
+            db.executemany('DELETE FROM entries WHERE name = ?', [(name,) for name in missing])
+            db.executemany(
+                'INSERT INTO entries (name, provider, size_bytes, created_at, last_hit_at) VALUES (?, ?, ?, ?, ?)',
+                [(name, 'unknown', size, now, now) for name, size in on_disk.items() if name not in indexed and size > 0],
+            )
+        if missing or len(on_disk) > len(indexed):
+            logger.info('tts_cache_reconciled', extra={'indexed': len(on_disk), 'dropped': len(missing)})
+        self._prune_locks(on_disk.keys())
+
+    def _prune_locks(self, cached: Collection[str]) -> None:
+        # Lock files of syntheses that failed never get an entry to be evicted with; drop them
+        # once no holder can still be inside its single-flight window.
+        lock_dir = self.cache_dir / TTS_CACHE_LOCK_DIR
+        if not lock_dir.is_dir():
+            return
+        cutoff = time.time() - SINGLE_FLIGHT_TIMEOUT_SECONDS
+        with os.scandir(lock_dir) as entries:
+            for entry in entries:
+                if entry.name.removesuffix('.lock') not in cached and entry.stat().st_mtime < cutoff:
+                    Path(entry.path).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, float | int]:
+        with self._connect() as db:
+            self._flush_hits(db)
+            entries, total_bytes = db.execute('SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries').fetchone()
+            counters = dict(db.execute('SELECT name, value FROM counters'))
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        lookups = hits + misses
+        return {
+            'entries': entries,
+            'total_bytes': total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'evictions': counters.get('evictions', 0),
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _flush_hits(self, db: sqlite3.Connection) -> None:
+        with self._pending_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            misses, self._pending_misses = self._pending_misses, 0
+            self._flushed_at = time.time()
+        db.executemany(
+            'UPDATE entries SET last_hit_at = MAX(last_hit_at, ?), hit_count = hit_count + ? WHERE name = ?',
+            [(last_hit_at, count, name) for name, (count, last_hit_at) in pending.items()],
+        )
+        self._bump(db, 'hits', sum(count for count, _ in pending.values()))
+        self._bump(db, 'misses', misses)
+
+    def _bump(self, db: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        if amount:
+            db.execute(
+                'INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + ?',
+                (name, amount, amount),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
@@ -1,24 +1,170 @@
 import logging
+import os
 import re
 import shlex
+import shutil
+import signal
 import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from uuid import uuid4
 
+from app.core.config import get_settings
 from app.providers.broll import BrollProvider
-from app.services.tts import generate_voiceover
+from app.providers.storage import StorageProvider, get_storage_provider
+from app.services.audio_io import audio_duration
+from app.services.image_ingest import ImageIngestService
+from app.services.music_library import BUILTIN_MUSIC_TRACKS, MusicLibrary
+from app.services.render_cache import RenderCache, content_digest
+from app.services.render_cancellation import CancellationToken, GroupCancellationToken
+from app.services.scratch_workspace import promote, scratch_workspace
+from app.services.tts import generate_voiceover_detailed
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_IMAGE_DURATION = 3.0
 MUSIC_BASE_GAIN = 0.7
 
-BUILTIN_MUSIC_TRACKS: dict[str, str] = {
-    'uplift-india': '/static/music/uplift-india.mp3',
-    'corporate-calm': '/static/music/corporate-calm.mp3',
-    'soft-motivation': '/static/music/soft-motivation.mp3',
+RENDER_MODE_SINGLE_PASS = 'single_pass'
+RENDER_MODE_STAGED = 'staged'
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    name: str
+    fps: int
+    preset: str
+    crf: int
+    preview_short_edge: int | None = None
+    output_suffix: str = ''
+    # Slideshows are stills: overlays are drawn at overlay_fps and frames are only
+    # duplicated up to fps at the end. overlay_fps must divide fps.
+    overlay_fps: int = 6
+    tune: str = 'stillimage'
+    gop_seconds: int = 10
+
+    def output_size(self, target_size: tuple[int, int]) -> tuple[int, int]:
+        if not self.preview_short_edge:
+            return target_size
+        width, height = target_size
+        ratio = self.preview_short_edge / min(width, height)
+        return (int(width * ratio) // 2 * 2, int(height * ratio) // 2 * 2)
+
+
+# Relative share of wall time per stage, used to fold per-stage ffmpeg progress into one
+# overall percentage.
+SINGLE_PASS_STAGE_WEIGHTS = {'voiceover': 0.15, 'render': 0.85}
+STAGED_STAGE_WEIGHTS = {'voiceover': 0.15, 'slideshow': 0.6, 'audio': 0.15, 'mux': 0.05, 'previews': 0.05}
+DISTRIBUTED_FINISH_STAGE_WEIGHTS = {'mux': 0.5, 'previews': 0.5}
+
+# Hover scrubbing tiles this many evenly spaced frames into a single strip.
+PREVIEW_SPRITE_FRAMES = 10
+PREVIEW_SPRITE_WIDTH = 160
+PREVIEW_WEBP_QUALITY = 80
+
+ProgressCallback = Callable[[float], None]
+
+
+@dataclass(frozen=True)
+class RenderArtifacts:
+    video_path: str
+    poster_path: str
+    thumb_320_path: str
+    thumb_640_path: str
+    sprite_path: str
+
+
+@dataclass(frozen=True)
+class DistributedRenderPlan:
+    # Travels through the Celery broker as JSON, so every field stays a plain value; files
+    # are referenced by storage key.
+    render_id: str
+    storage_prefix: str
+    quality: str
+    width: int
+    height: int
+    title: str | None
+    script: str
+    captions_enabled: bool
+    per_image_duration: float
+    total_duration: float
+    frame_keys: list[str]
+    chunks: list[list[float]]
+    audio_key: str
+    slideshow_key: str | None
+    cache_key: str | None
+
+
+class RenderProgress:
+    def __init__(self, callback: ProgressCallback, weights: dict[str, float]) -> None:
+        self._callback = callback
+        self._parts: dict[tuple[str, int], tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self.set_weights(weights)
+
+    def set_weights(self, weights: dict[str, float]) -> None:
+        total = sum(weights.values()) or 1.0
+        self._weights = {stage: weight / total for stage, weight in weights.items()}
+
+    def update(self, stage: str, fraction: float, *, part: int = 0, part_weight: float = 1.0) -> None:
+        if stage not in self._weights:
+            return
+        # Parallel segment encoders report concurrently; the lock also serialises the callback.
+        with self._lock:
+            self._parts[(stage, part)] = (max(0.0, min(1.0, fraction)), part_weight)
+            overall = sum(
+                self._weights[name] * done * weight for (name, _), (done, weight) in self._parts.items()
+            )
+            self._callback(min(1.0, overall))
+
+
+def throttled_progress(
+    report: Callable[[int], None],
+    *,
+    start: int,
+    end: int,
+    min_interval: float = 1.0,
+) -> ProgressCallback:
+    state = {'percent': start, 'at': 0.0}
+
+    def on_progress(fraction: float) -> None:
+        percent = start + int((end - start) * fraction)
+        now = time.monotonic()
+        if percent <= state['percent'] or (now - state['at'] < min_interval and percent < end):
+            return
+        state['percent'] = percent
+        state['at'] = now
+        report(percent)
+
+    return on_progress
+
+
+RENDER_PROFILES: dict[str, RenderProfile] = {
+    'final': RenderProfile('final', fps=30, preset='medium', crf=23),
+    # Draft previews keep the final layout (overlays are composited at target size) but
+    # encode a 360p, low-fps, ultrafast stream so users can check timing quickly.
+    'draft': RenderProfile('draft', fps=12, preset='ultrafast', crf=30, preview_short_edge=360, output_suffix='_draft'),
 }
 
 
+@lru_cache(maxsize=64)
+def _font_family_name(font_path: str) -> str | None:
+    # For a collection (.ttc) this is the family of its first face.
+    try:
+        from PIL import ImageFont
+
+        family, _ = ImageFont.truetype(font_path, size=12).getname()
+    except (ModuleNotFoundError, OSError, ValueError):
+        return None
+    return family or None
+
+
 class VideoPipelineService:
     def __init__(self) -> None:
         self.renders_dir = Path('data/renders')
@@ -26,9 +172,32 @@ class VideoPipelineService:
         self.tts_cache_dir = Path('data/tts_cache')
         self.tts_cache_dir.mkdir(parents=True, exist_ok=True)
         self.broll_provider = BrollProvider()
+        self.image_ingest = ImageIngestService()
+        self.music_library = MusicLibrary()
+        settings = get_settings()
+        self.settings = settings
+        self.render_cache = RenderCache() if settings.render_cache_enabled else None
+        self.render_mode = settings.render_mode
+        self.parallel_segments = settings.render_parallel_segments
+        self.segment_seconds = max(1, settings.render_segment_seconds)
+        self.segment_workers = settings.render_segment_workers or (os.cpu_count() or 1)
         self._font_cache: dict[str, str | None] = {}
+        self._progress: RenderProgress | None = None
+        # Core budget granted by the render scheduler; None leaves ffmpeg on its defaults.
+        self.thread_budget: int | None = None
+        self.cancel_token: CancellationToken | GroupCancellationToken | None = None
+        self.distributed = settings.render_distributed
+        self.chunk_seconds = max(1, settings.render_chunk_seconds)
+        self._storage: StorageProvider | None = None
+        self._encoder_threads: int | None = None
 
-    def build_video(self, render_id: str, script: str, include_broll: bool) -> tuple[str, str]:
+    def build_video(
+        self,
+        render_id: str,
+        script: str,
+        include_broll: bool,
+        on_progress: ProgressCallback | None = None,
+    ) -> tuple[str, str]:
         output_path = self.renders_dir / f'{render_id}.mp4'
         thumb_path = self.renders_dir / f'{render_id}.jpg'
 
@@ -45,6 +214,7 @@ class VideoPipelineService:
             'color=c=0x111827:s=1280x720:d=6',
             '-vf',
             f"drawtext=text='{caption}':fontcolor=white:fontsize=42:x=(w-text_w)/2:y=(h-text_h)/2",
+            *(['-threads', str(self.thread_budget)] if self.thread_budget else []),
             '-c:v',
             'libx264',
             '-pix_fmt',
@@ -52,13 +222,16 @@ class VideoPipelineService:
             str(output_path),
         ]
 
+        self._progress = RenderProgress(on_progress, {'render': 1.0}) if on_progress else None
         try:
-            self._run(cmd)
+            self._run(cmd, stage='render', duration=6.0)
             self._make_thumbnail(output_path, thumb_path)
         except Exception as exc:
             logger.warning('ffmpeg_unavailable_fallback', extra={'render_id': render_id, 'error': str(exc)})
             output_path.write_bytes(b'VIDYOBHARAT-MOCK-MP4')
             thumb_path.write_bytes(b'VIDYOBHARAT-MOCK-THUMB')
+        finally:
+            self._progress = None
 
         return str(output_path), str(thumb_path)
 
@@ -81,33 +254,330 @@ class VideoPipelineService:
         music_file_url: str | None,
         music_volume: int,
         duck_music: bool,
-    ) -> tuple[str, str]:
-        output_path = self.renders_dir / f'{video_id}.mp4'
-        thumb_path = self.renders_dir / f'{video_id}.jpg'
-        slideshow_path = self.renders_dir / f'{video_id}_slideshow.mp4'
+        quality: str = 'final',
+        on_progress: ProgressCallback | None = None,
+        distribute: bool = False,
+    ) -> RenderArtifacts | DistributedRenderPlan:
+        try:
+            with scratch_workspace(video_id) as work_dir:
+                return self._render_video_from_assets(
+                    work_dir=work_dir,
+                    video_id=video_id,
+                    title=title,
+                    script=script,
+                    language_name=language_name,
+                    voice_name=voice_name,
+                    audio_sample_rate_hz=audio_sample_rate_hz,
+                    image_urls=image_urls,
+                    aspect_ratio=aspect_ratio,
+                    resolution=resolution,
+                    duration_mode=duration_mode,
+                    duration_seconds=duration_seconds,
+                    captions_enabled=captions_enabled,
+                    music_mode=music_mode,
+                    music_track_id=music_track_id,
+                    music_file_url=music_file_url,
+                    music_volume=music_volume,
+                    duck_music=duck_music,
+                    quality=quality,
+                    on_progress=on_progress,
+                    distribute=distribute,
+                )
+        finally:
+            self._progress = None
+            self._encoder_threads = None
+
+    def render_distributed_chunk(self, plan: DistributedRenderPlan, index: int) -> str:
+        profile = RENDER_PROFILES.get(plan.quality, RENDER_PROFILES['final'])
+        first, last, start, end = plan.chunks[index]
+        segment = (int(first), int(last), start, end)
+        storage = self._object_store()
+        with scratch_workspace(f'{plan.render_id}-chunk{index}') as work_dir:
+            image_paths = [work_dir / Path(key).name for key in plan.frame_keys]
+            for image_index in range(segment[0], segment[1]):
+                if not image_paths[image_index].exists():
+                    storage.get_object(plan.frame_keys[image_index], image_paths[image_index])
+            chunk_path = work_dir / f'chunk{index:03d}.mp4'
+            command = self._segment_command(
+                segment_path=chunk_path,
+                segment=segment,
+                image_paths=image_paths,
+                per_image_duration=plan.per_image_duration,
+                total_duration=plan.total_duration,
+                title=plan.title,
+                script=plan.script,
+                captions_enabled=plan.captions_enabled,
+                target_size=(plan.width, plan.height),
+                profile=profile,
+                threads=self.thread_budget,
+            )
+            self._run(command, stage='slideshow', duration=end - start)
+            chunk_key = self._chunk_key(plan, index)
+            storage.put_object(chunk_key, chunk_path)
+        logger.info('render_chunk_completed', extra={'render_id': plan.render_id, 'chunk': index, 'seconds': round(end - start, 3)})
+        return chunk_key
+
+    def finish_distributed_render(
+        self,
+        plan: DistributedRenderPlan,
+        chunk_keys: list[str],
+        on_progress: ProgressCallback | None = None,
+    ) -> RenderArtifacts:
+        profile = RENDER_PROFILES.get(plan.quality, RENDER_PROFILES['final'])
+        stem = f'{plan.render_id}{profile.output_suffix}'
+        storage = self._object_store()
+        try:
+            with scratch_workspace(plan.render_id) as work_dir:
+                if on_progress:
+                    self._progress = RenderProgress(on_progress, DISTRIBUTED_FINISH_STAGE_WEIGHTS)
+                chunk_paths: list[Path] = []
+                for chunk_key in chunk_keys:
+                    chunk_path = work_dir / Path(chunk_key).name
+                    storage.get_object(chunk_key, chunk_path)
+                    chunk_paths.append(chunk_path)
+                slideshow_path = work_dir / f'{stem}_slideshow.mp4'
+                self._check_cancelled()
+                self._concat_segments(chunk_paths, slideshow_path)
+                if plan.slideshow_key and self.render_cache is not None:
+                    self.render_cache.store(plan.slideshow_key, {'mp4': slideshow_path})
+
+                audio_path = work_dir / f'{stem}_audio.m4a'
+                storage.get_object(plan.audio_key, audio_path)
+                work_output_path = work_dir / f'{stem}.mp4'
+                work_preview_paths = self._preview_paths(work_dir, stem)
+                self._mux(
+                    output_path=work_output_path,
+                    slideshow_path=slideshow_path,
+                    audio_path=audio_path,
+                    total_duration=plan.total_duration,
+                )
+                self._run_stage(
+                    'previews',
+                    self._stage_key('previews', {'slideshow': plan.slideshow_key}),
+                    work_preview_paths,
+                    lambda: self._make_previews(slideshow_path, work_preview_paths, plan.total_duration),
+                )
+                return self._publish_render(
+                    video_id=plan.render_id,
+                    profile=profile,
+                    work_output_path=work_output_path,
+                    work_preview_paths=work_preview_paths,
+                    cache_key=plan.cache_key,
+                )
+        finally:
+            self._progress = None
+            self.discard_distributed_render(plan)
+
+    def completed_chunks(self, plan: DistributedRenderPlan) -> int:
+        storage = self._object_store()
+        return sum(1 for index in range(len(plan.chunks)) if storage.exists(self._chunk_key(plan, index)))
+
+    def discard_distributed_render(self, plan: DistributedRenderPlan) -> None:
+        removed = self._object_store().delete_prefix(plan.storage_prefix)
+        logger.info('render_chunks_discarded', extra={'render_id': plan.render_id, 'objects': removed})
+
+    def prebuild_variant_slideshows(
+        self,
+        *,
+        variant_id: str,
+        title: str | None,
+        script: str,
+        language_name: str | None,
+        voice_name: str,
+        audio_sample_rate_hz: int,
+        image_urls: list[str],
+        targets: list[tuple[str, str]],
+        duration_mode: str,
+        duration_seconds: int | None,
+        captions_enabled: bool,
+        quality: str = 'final',
+    ) -> int:
+        # Variants of one language share the voiceover and therefore the timing, so every
+        # (aspect ratio, resolution) slideshow is encoded by a single multi-output ffmpeg
+        # run and seeded into the stage cache; each variant's render then restores it.
+        if self.render_cache is None:
+            return 0
+        self._check_cancelled()
+        profile = RENDER_PROFILES.get(quality, RENDER_PROFILES['final'])
+        image_paths = self._urls_to_local_paths(image_urls)
+        voice_duration = 0.0
+        if script.strip():
+            voice_result = generate_voiceover_detailed(
+                script=script,
+                voice=voice_name,
+                cache_dir=self.tts_cache_dir,
+                language=language_name,
+                sample_rate_hz=audio_sample_rate_hz,
+            )
+            voice_duration = self._voice_duration(voice_result.path)
+        total_duration, per_image_duration = self._resolve_timing(
+            voice_duration=voice_duration,
+            image_count=len(image_paths),
+            voice_exists=bool(script.strip()),
+            duration_mode=duration_mode,
+            duration_seconds=duration_seconds,
+        )
+
+        with scratch_workspace(variant_id) as work_dir:
+            pending: list[tuple[str, Path, list[Path], tuple[int, int]]] = []
+            for aspect_ratio, resolution in dict.fromkeys(targets):
+                self._check_cancelled()
+                target_size = self._resolve_target_size(aspect_ratio, resolution)
+                frames = self._prepare_frames(image_paths, target_size)
+                key = self._slideshow_stage_key(
+                    image_paths=frames,
+                    per_image_duration=per_image_duration,
+                    total_duration=total_duration,
+                    title=title,
+                    script=script,
+                    captions_enabled=captions_enabled,
+                    target_size=target_size,
+                    profile=profile,
+                )
+                if key and not self.render_cache.contains(key, ['mp4']):
+                    slideshow_path = work_dir / f'{variant_id}-{target_size[0]}x{target_size[1]}_slideshow.mp4'
+                    pending.append((key, slideshow_path, frames, target_size))
+            if not pending:
+                return 0
+
+            # Each output gets its share of the job's cores rather than a full budget apiece.
+            threads = max(1, (self.thread_budget or os.cpu_count() or 1) // len(pending))
+            cmd = ['ffmpeg', '-y']
+            filter_parts: list[str] = []
+            output_args: list[str] = []
+            for index, (_, slideshow_path, frames, target_size) in enumerate(pending):
+                cmd.extend(self._slideshow_input_args(
+                    concat_file=slideshow_path.with_suffix('.txt'),
+                    image_paths=frames,
+                    per_image_duration=per_image_duration,
+                    total_duration=total_duration,
+                    target_size=target_size,
+                    profile=profile,
+                ))
+                video_filter = self._build_video_filter(
+                    title=title,
+                    script=script,
+                    captions_enabled=captions_enabled,
+                    total_duration=total_duration,
+                    target_size=target_size,
+                    profile=profile,
+                    captions_path=slideshow_path.with_suffix('.ass'),
+                )
+                filter_parts.append(f'[{index}:v]{video_filter}[v{index}]')
+                output_args.extend([
+                    '-map',
+                    f'[v{index}]',
+                    '-r',
+                    str(profile.fps),
+                    *self._video_codec_args(profile, threads=threads),
+                    '-t',
+                    f'{total_duration:.2f}',
+                    str(slideshow_path),
+                ])
+            cmd.extend(['-filter_complex', ';'.join(filter_parts), *output_args])
+            self._run(cmd, stage='slideshow', duration=total_duration)
+            for key, slideshow_path, _, _ in pending:
+                self.render_cache.store(key, {'mp4': slideshow_path})
+        logger.info('variant_slideshows_prebuilt', extra={'render_id': variant_id, 'outputs': len(pending)})
+        return len(pending)
+
+    def _render_video_from_assets(
+        self,
+        *,
+        work_dir: Path,
+        video_id: str,
+        title: str | None,
+        script: str,
+        language_name: str | None,
+        voice_name: str,
+        audio_sample_rate_hz: int,
+        image_urls: list[str],
+        aspect_ratio: str,
+        resolution: str,
+        duration_mode: str,
+        duration_seconds: int | None,
+        captions_enabled: bool,
+        music_mode: str,
+        music_track_id: str | None,
+        music_file_url: str | None,
+        music_volume: int,
+        duck_music: bool,
+        quality: str,
+        on_progress: ProgressCallback | None,
+        distribute: bool = False,
+    ) -> RenderArtifacts | DistributedRenderPlan:
+        profile = RENDER_PROFILES.get(quality, RENDER_PROFILES['final'])
+        stem = f'{video_id}{profile.output_suffix}'
+        output_path = self.renders_dir / f'{stem}.mp4'
+        preview_paths = self._preview_paths(self.renders_dir, stem)
+        outputs = {'mp4': output_path, **preview_paths}
+        # Intermediates and in-progress outputs live in the job's scratch workspace; only the
+        # finished video and its previews are promoted into data/renders.
+        work_output_path = work_dir / output_path.name
+        work_preview_paths = self._preview_paths(work_dir, stem)
+        slideshow_path = work_dir / f'{stem}_slideshow.mp4'
         voice_path: Path | None = None
 
         image_paths = self._urls_to_local_paths(image_urls)
         voice_exists = bool(script.strip())
         real_voice_exists = False
         target_size = self._resolve_target_size(aspect_ratio, resolution)
+        music_path = self._resolve_music_path(music_mode, music_track_id, music_file_url)
+
+        cache_key: str | None = None
+        if self.render_cache is not None:
+            cache_key = self.render_cache.make_key(
+                self._render_cache_inputs(
+                    title=title,
+                    script=script,
+                    language_name=language_name,
+                    voice_name=voice_name,
+                    audio_sample_rate_hz=audio_sample_rate_hz,
+                    image_paths=image_paths,
+                    target_size=target_size,
+                    duration_mode=duration_mode,
+                    duration_seconds=duration_seconds,
+                    captions_enabled=captions_enabled,
+                    music_path=music_path,
+                    music_volume=music_volume,
+                    duck_music=duck_music,
+                    profile=profile,
+                )
+            )
+            if self.render_cache.restore(cache_key, outputs):
+                logger.info('render_served_from_cache', extra={'render_id': video_id})
+                return self._render_artifacts(output_path, preview_paths)
+
+        image_paths = self._prepare_frames(image_paths, target_size)
+
+        if on_progress:
+            self._progress = RenderProgress(on_progress, SINGLE_PASS_STAGE_WEIGHTS)
+        self._check_cancelled()
 
         voice_duration = 0.0
+        cacheable = True
         if voice_exists:
-            voice_path, resolved_voice = generate_voiceover(
+            voice_result = generate_voiceover_detailed(
                 script=script,
                 voice=voice_name,
                 cache_dir=self.tts_cache_dir,
                 language=language_name,
                 sample_rate_hz=audio_sample_rate_hz,
             )
-            voice_duration = self._probe_duration(voice_path)
+            voice_path = voice_result.path
+            voice_duration = self._voice_duration(voice_path)
             real_voice_exists = True
+            # A fallback voice while Sarvam is configured is a degraded render; let the next
+            # attempt try the real provider instead of pinning it in the cache.
+            cacheable = voice_result.provider == 'Sarvam AI' or not self.settings.sarvam_api_key
             logger.info(
                 f'TTS generated voiceover at {voice_path}',
-                extra={'render_id': video_id, 'voice': resolved_voice},
+                extra={'render_id': video_id, 'voice': voice_result.resolved_voice},
             )
 
+        self._report_progress('voiceover', 1.0)
+        self._check_cancelled()
+
         total_duration, per_image_duration = self._resolve_timing(
             voice_duration=voice_duration,
             image_count=len(image_paths),
@@ -115,8 +585,146 @@ class VideoPipelineService:
             duration_mode=duration_mode,
             duration_seconds=duration_seconds,
         )
-        self._build_slideshow(
-            slideshow_path=slideshow_path,
+        self._encoder_threads = self._threads_for_job(total_duration)
+        if music_path is not None:
+            music_path = self._music_bed(music_path, total_duration, audio_sample_rate_hz)
+
+        if distribute:
+            plan = self._plan_distributed_render(
+                work_dir=work_dir,
+                video_id=video_id,
+                profile=profile,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                title=title,
+                script=script,
+                captions_enabled=captions_enabled,
+                target_size=target_size,
+                voice_path=voice_path if real_voice_exists else None,
+                music_path=music_path,
+                music_volume=music_volume,
+                duck_music=duck_music,
+                voice_exists=real_voice_exists,
+                cache_key=cache_key if cacheable else None,
+                cacheable=cacheable,
+            )
+            if plan is not None:
+                return plan
+
+        segmented = self._use_segmented_slideshow(image_paths, total_duration)
+        single_pass = self.render_mode == RENDER_MODE_SINGLE_PASS and not segmented
+        if self._progress is not None and not single_pass:
+            self._progress.set_weights(STAGED_STAGE_WEIGHTS)
+        if single_pass:
+            # One ffmpeg invocation: slideshow, overlays, audio mix and previews share a
+            # single decode/encode instead of encoding the video three times.
+            self._render_single_pass(
+                output_path=work_output_path,
+                preview_paths=work_preview_paths,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                title=title,
+                script=script,
+                captions_enabled=captions_enabled,
+                target_size=target_size,
+                voice_path=voice_path if real_voice_exists else None,
+                music_path=music_path,
+                music_volume=music_volume,
+                duck_music=duck_music,
+                voice_exists=real_voice_exists,
+                render_id=video_id,
+                profile=profile,
+            )
+        else:
+            self._render_staged(
+                output_path=work_output_path,
+                preview_paths=work_preview_paths,
+                slideshow_path=slideshow_path,
+                segmented=segmented,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                title=title,
+                script=script,
+                captions_enabled=captions_enabled,
+                target_size=target_size,
+                voice_path=voice_path if real_voice_exists else None,
+                music_path=music_path,
+                music_volume=music_volume,
+                duck_music=duck_music,
+                voice_exists=real_voice_exists,
+                render_id=video_id,
+                profile=profile,
+                cacheable=cacheable,
+            )
+
+        return self._publish_render(
+            video_id=video_id,
+            profile=profile,
+            work_output_path=work_output_path,
+            work_preview_paths=work_preview_paths,
+            cache_key=cache_key if cacheable else None,
+        )
+
+    def _publish_render(
+        self,
+        *,
+        video_id: str,
+        profile: RenderProfile,
+        work_output_path: Path,
+        work_preview_paths: dict[str, Path],
+        cache_key: str | None,
+    ) -> RenderArtifacts:
+        stem = f'{video_id}{profile.output_suffix}'
+        output_path = self.renders_dir / f'{stem}.mp4'
+        preview_paths = self._preview_paths(self.renders_dir, stem)
+        # Replacing (rather than overwriting) also keeps hard links into the render cache intact.
+        promote(work_output_path, output_path)
+        for name, path in work_preview_paths.items():
+            promote(path, preview_paths[name])
+        if self.render_cache is not None and cache_key:
+            self.render_cache.store(cache_key, {'mp4': output_path, **preview_paths})
+        if profile.name == 'final':
+            # A promoted draft no longer needs its files.
+            draft_stem = f'{video_id}{RENDER_PROFILES["draft"].output_suffix}'
+            draft_paths = [self.renders_dir / f'{draft_stem}.mp4', *self._preview_paths(self.renders_dir, draft_stem).values()]
+            for path in draft_paths:
+                path.unlink(missing_ok=True)
+        return self._render_artifacts(output_path, preview_paths)
+
+    def _plan_distributed_render(
+        self,
+        *,
+        work_dir: Path,
+        video_id: str,
+        profile: RenderProfile,
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        target_size: tuple[int, int],
+        voice_path: Path | None,
+        music_path: Path | None,
+        music_volume: int,
+        duck_music: bool,
+        voice_exists: bool,
+        cache_key: str | None,
+        cacheable: bool,
+    ) -> DistributedRenderPlan | None:
+        chunks = self._plan_segments(
+            len(image_paths),
+            per_image_duration,
+            total_duration,
+            profile.overlay_fps,
+            segment_seconds=self.chunk_seconds,
+        )
+        if len(chunks) < 2:
+            return None
+        slideshow_key = self._slideshow_stage_key(
             image_paths=image_paths,
             per_image_duration=per_image_duration,
             total_duration=total_duration,
@@ -124,23 +732,282 @@ class VideoPipelineService:
             script=script,
             captions_enabled=captions_enabled,
             target_size=target_size,
+            profile=profile,
         )
+        if slideshow_key and self.render_cache is not None and self.render_cache.contains(slideshow_key, ['mp4']):
+            # Only the audio mix and mux are left; fanning out would cost more than it saves.
+            return None
 
-        music_path = self._resolve_music_path(music_mode, music_track_id, music_file_url)
-        self._compose_final_video(
-            output_path=output_path,
-            slideshow_path=slideshow_path,
-            total_duration=total_duration,
-            voice_path=voice_path if real_voice_exists else None,
+        # The audio mix is cheap next to the video encode and needs the local TTS and music
+        # caches, so the coordinator builds it and ships it with the frames.
+        stem = f'{video_id}{profile.output_suffix}'
+        audio_path = work_dir / f'{stem}_audio.m4a'
+        audio_key = self._audio_stage_key(
+            voice_path=voice_path,
             music_path=music_path,
             music_volume=music_volume,
             duck_music=duck_music,
-            voice_exists=real_voice_exists,
+            total_duration=total_duration,
+        )
+        self._run_stage(
+            'audio',
+            audio_key if cacheable else None,
+            {'m4a': audio_path},
+            lambda: self._build_audio_mix(
+                audio_path=audio_path,
+                total_duration=total_duration,
+                voice_path=voice_path,
+                music_path=music_path,
+                music_volume=music_volume,
+                duck_music=duck_music,
+                voice_exists=voice_exists,
+                render_id=video_id,
+            ),
+        )
+
+        storage = self._object_store()
+        storage_prefix = f'renders/{video_id}/{uuid4().hex}'
+        uploaded: dict[Path, str] = {}
+        frame_keys: list[str] = []
+        for path in image_paths:
+            if path not in uploaded:
+                uploaded[path] = f'{storage_prefix}/frames/{len(uploaded):04d}{path.suffix}'
+                storage.put_object(uploaded[path], path)
+            frame_keys.append(uploaded[path])
+        stored_audio_key = f'{storage_prefix}/audio.m4a'
+        storage.put_object(stored_audio_key, audio_path)
+        logger.info(
+            'render_distributed_planned',
+            extra={'render_id': video_id, 'chunks': len(chunks), 'frames': len(uploaded), 'prefix': storage_prefix},
+        )
+        return DistributedRenderPlan(
             render_id=video_id,
+            storage_prefix=storage_prefix,
+            quality=profile.name,
+            width=target_size[0],
+            height=target_size[1],
+            title=title,
+            script=script,
+            captions_enabled=captions_enabled,
+            per_image_duration=per_image_duration,
+            total_duration=total_duration,
+            frame_keys=frame_keys,
+            chunks=[list(chunk) for chunk in chunks],
+            audio_key=stored_audio_key,
+            slideshow_key=slideshow_key,
+            cache_key=cache_key,
         )
 
-        self._make_thumbnail(output_path, thumb_path)
-        return str(output_path), str(thumb_path)
+    def _chunk_key(self, plan: DistributedRenderPlan, index: int) -> str:
+        return f'{plan.storage_prefix}/chunks/{index:03d}.mp4'
+
+    def _object_store(self) -> StorageProvider:
+        if self._storage is None:
+            self._storage = get_storage_provider()
+        return self._storage
+
+    def _preview_paths(self, directory: Path, stem: str) -> dict[str, Path]:
+        # Keys double as render cache artifact names; the poster keeps the historical
+        # {id}.jpg name that thumbnail_url has always pointed at.
+        return {
+            'jpg': directory / f'{stem}.jpg',
+            '320.webp': directory / f'{stem}_320.webp',
+            '640.webp': directory / f'{stem}_640.webp',
+            'sprite.webp': directory / f'{stem}_sprite.webp',
+        }
+
+    def _render_artifacts(self, output_path: Path, preview_paths: dict[str, Path]) -> RenderArtifacts:
+        return RenderArtifacts(
+            video_path=str(output_path),
+            poster_path=str(preview_paths['jpg']),
+            thumb_320_path=str(preview_paths['320.webp']),
+            thumb_640_path=str(preview_paths['640.webp']),
+            sprite_path=str(preview_paths['sprite.webp']),
+        )
+
+    def _render_staged(
+        self,
+        *,
+        output_path: Path,
+        preview_paths: dict[str, Path],
+        slideshow_path: Path,
+        segmented: bool,
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        target_size: tuple[int, int],
+        voice_path: Path | None,
+        music_path: Path | None,
+        music_volume: int,
+        duck_music: bool,
+        voice_exists: bool,
+        render_id: str,
+        profile: RenderProfile,
+        cacheable: bool,
+    ) -> None:
+        # Each stage's artifact is cached under a hash of exactly the inputs it depends on,
+        # so an edit re-runs only the affected stages and a failed job resumes from the
+        # last stage that completed.
+        audio_path = slideshow_path.with_name(f'{output_path.stem}_audio.m4a')
+        slideshow_key = self._slideshow_stage_key(
+            image_paths=image_paths,
+            per_image_duration=per_image_duration,
+            total_duration=total_duration,
+            title=title,
+            script=script,
+            captions_enabled=captions_enabled,
+            target_size=target_size,
+            profile=profile,
+        )
+        build_slideshow = self._build_slideshow_segmented if segmented else self._build_slideshow
+        self._run_stage(
+            'slideshow',
+            slideshow_key,
+            {'mp4': slideshow_path},
+            lambda: build_slideshow(
+                slideshow_path=slideshow_path,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                title=title,
+                script=script,
+                captions_enabled=captions_enabled,
+                target_size=target_size,
+                profile=profile,
+            ),
+        )
+        audio_key = self._audio_stage_key(
+            voice_path=voice_path,
+            music_path=music_path,
+            music_volume=music_volume,
+            duck_music=duck_music,
+            total_duration=total_duration,
+        )
+        self._run_stage(
+            'audio',
+            audio_key if cacheable else None,
+            {'m4a': audio_path},
+            lambda: self._build_audio_mix(
+                audio_path=audio_path,
+                total_duration=total_duration,
+                voice_path=voice_path,
+                music_path=music_path,
+                music_volume=music_volume,
+                duck_music=duck_music,
+                voice_exists=voice_exists,
+                render_id=render_id,
+            ),
+        )
+        self._mux(output_path=output_path, slideshow_path=slideshow_path, audio_path=audio_path, total_duration=total_duration)
+        self._run_stage(
+            'previews',
+            self._stage_key('previews', {'slideshow': slideshow_key}),
+            preview_paths,
+            lambda: self._make_previews(slideshow_path, preview_paths, total_duration),
+        )
+
+    def _slideshow_stage_key(
+        self,
+        *,
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        target_size: tuple[int, int],
+        profile: RenderProfile,
+    ) -> str | None:
+        return self._stage_key(
+            'slideshow',
+            {
+                'images': [content_digest(path) for path in image_paths],
+                'per_image_duration': round(per_image_duration, 3),
+                'total_duration': round(total_duration, 3),
+                'title': title or '',
+                'captions': script if captions_enabled else None,
+                'target_size': target_size,
+                'profile': profile,
+            },
+        )
+
+    def _audio_stage_key(
+        self,
+        *,
+        voice_path: Path | None,
+        music_path: Path | None,
+        music_volume: int,
+        duck_music: bool,
+        total_duration: float,
+    ) -> str | None:
+        return self._stage_key(
+            'audio',
+            {
+                'voice': content_digest(voice_path) if voice_path else None,
+                'music': content_digest(music_path) if music_path else None,
+                'music_volume': music_volume if music_path else None,
+                'duck_music': duck_music if music_path else None,
+                'total_duration': round(total_duration, 3),
+            },
+        )
+
+    def _stage_key(self, stage: str, inputs: dict[str, object]) -> str | None:
+        if self.render_cache is None:
+            return None
+        return self.render_cache.make_key({'stage': stage, **inputs})
+
+    def _run_stage(self, stage: str, key: str | None, artifacts: dict[str, Path], build: Callable[[], None]) -> None:
+        self._check_cancelled()
+        if key and self.render_cache is not None and self.render_cache.restore(key, artifacts):
+            logger.info('render_stage_reused', extra={'stage': stage, 'cache_key': key})
+            self._report_progress(stage, 1.0)
+            return
+        # Artifacts may be hard links into the cache from an earlier run; replace rather
+        # than overwrite them.
+        for path in artifacts.values():
+            path.unlink(missing_ok=True)
+        build()
+        if key and self.render_cache is not None:
+            self.render_cache.store(key, artifacts)
+
+    def _render_cache_inputs(
+        self,
+        *,
+        title: str | None,
+        script: str,
+        language_name: str | None,
+        voice_name: str,
+        audio_sample_rate_hz: int,
+        image_paths: list[Path],
+        target_size: tuple[int, int],
+        duration_mode: str,
+        duration_seconds: int | None,
+        captions_enabled: bool,
+        music_path: Path | None,
+        music_volume: int,
+        duck_music: bool,
+        profile: RenderProfile,
+    ) -> dict[str, object]:
+        return {
+            'quality': profile.name,
+            'title': title or '',
+            'script': script.strip(),
+            'language': language_name or '',
+            'voice': voice_name,
+            'sample_rate_hz': audio_sample_rate_hz,
+            'tts_model': self.settings.sarvam_model,
+            'images': [content_digest(path) for path in image_paths],
+            'target_size': list(target_size),
+            'duration_mode': duration_mode,
+            'duration_seconds': duration_seconds if duration_mode == 'custom' else None,
+            'captions_enabled': captions_enabled,
+            'music': content_digest(music_path) if music_path else None,
+            'music_volume': music_volume if music_path else None,
+            'duck_music': duck_music if music_path else None,
+        }
 
     def _resolve_timing(
         self,
@@ -172,54 +1039,127 @@ class VideoPipelineService:
         script: str,
         captions_enabled: bool,
         target_size: tuple[int, int],
+        profile: RenderProfile,
     ) -> None:
-        target_w, target_h = target_size
-        title_text = self._escape_drawtext(title or '')
-        text_filters: list[str] = []
-        if title_text:
-            title_font = self._font_clause(title or '')
-            text_filters.append(
-                f"drawtext=text='{title_text}'{title_font}:fontcolor=white:fontsize=34:x=40:y=h-th-40:box=1:boxcolor=black@0.45:boxborderw=12"
-            )
-        if captions_enabled and script.strip():
-            text_filters.extend(self._build_caption_filters(script=script, total_duration=total_duration))
-        text_filters.append(
-            "drawtext=text='RangManch AI':fontcolor=white@0.65:fontsize=18:x=w-tw-30:y=24"
-        )
-        video_filter = (
-            f'scale={target_w}:{target_h}:force_original_aspect_ratio=decrease,'
-            f'pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2,format=yuv420p'
+        video_filter = self._build_video_filter(
+            title=title,
+            script=script,
+            captions_enabled=captions_enabled,
+            total_duration=total_duration,
+            target_size=target_size,
+            profile=profile,
+            captions_path=slideshow_path.with_suffix('.ass'),
         )
-        if text_filters:
-            video_filter = f"{video_filter},{','.join(text_filters)}"
+        concat_file = slideshow_path.with_suffix('.txt')
+        self._run([
+            'ffmpeg',
+            '-y',
+            *self._slideshow_input_args(
+                concat_file=concat_file,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                target_size=target_size,
+                profile=profile,
+            ),
+            '-vf',
+            video_filter,
+            '-r',
+            str(profile.fps),
+            *self._video_codec_args(profile),
+            '-t',
+            f'{total_duration:.2f}',
+            str(slideshow_path),
+        ], stage='slideshow', duration=total_duration)
 
-        if not image_paths:
-            self._run([
-                'ffmpeg',
-                '-y',
-                '-f',
-                'lavfi',
-                '-i',
-                f'color=c=0x111827:s={target_w}x{target_h}:d={total_duration:.2f}',
-                '-c:v',
-                'libx264',
-                '-pix_fmt',
-                'yuv420p',
-                '-vf',
-                video_filter,
-                str(slideshow_path),
-            ])
-            return
+    def _build_slideshow_segmented(
+        self,
+        slideshow_path: Path,
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        target_size: tuple[int, int],
+        profile: RenderProfile,
+    ) -> None:
+        segments = self._plan_segments(len(image_paths), per_image_duration, total_duration, profile.overlay_fps)
+        cores = self.thread_budget or os.cpu_count() or 1
+        workers = max(1, min(len(segments), self.segment_workers, cores))
+        threads_per_segment = max(1, cores // workers)
+
+        commands: list[list[str]] = []
+        segment_paths: list[Path] = []
+        for index, segment in enumerate(segments):
+            segment_path = slideshow_path.with_name(f'{slideshow_path.stem}_seg{index:03d}.mp4')
+            commands.append(self._segment_command(
+                segment_path=segment_path,
+                segment=segment,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                title=title,
+                script=script,
+                captions_enabled=captions_enabled,
+                target_size=target_size,
+                profile=profile,
+                threads=threads_per_segment,
+            ))
+            segment_paths.append(segment_path)
+
+        def run_segment(index: int) -> None:
+            _, _, start, end = segments[index]
+            self._run(
+                commands[index],
+                stage='slideshow',
+                duration=end - start,
+                part=index,
+                part_weight=(end - start) / total_duration,
+            )
 
-        concat_file = self.renders_dir / f'{slideshow_path.stem}.txt'
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run_segment, range(len(commands))))
+
+        self._concat_segments(segment_paths, slideshow_path)
+
+    def _segment_command(
+        self,
+        *,
+        segment_path: Path,
+        segment: tuple[int, int, float, float],
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        target_size: tuple[int, int],
+        profile: RenderProfile,
+        threads: int | None,
+    ) -> list[str]:
+        first, last, start, end = segment
+        concat_file = segment_path.with_suffix('.txt')
         lines: list[str] = []
-        for path in image_paths:
-            lines.append(f"file {shlex.quote(str(path))}")
-            lines.append(f'duration {per_image_duration:.3f}')
-        lines.append(f"file {shlex.quote(str(image_paths[-1]))}")
+        for image_index in range(first, last):
+            shown_from = max(start, image_index * per_image_duration)
+            shown_to = min(end, (image_index + 1) * per_image_duration)
+            lines.append(f"file {shlex.quote(str(image_paths[image_index]))}")
+            lines.append(f'duration {shown_to - shown_from:.3f}')
+        lines.append(f"file {shlex.quote(str(image_paths[last - 1]))}")
         concat_file.write_text('\n'.join(lines), encoding='utf-8')
 
-        self._run([
+        video_filter = self._build_video_filter(
+            title=title,
+            script=script,
+            captions_enabled=captions_enabled,
+            total_duration=total_duration,
+            target_size=target_size,
+            profile=profile,
+            captions_path=segment_path.with_suffix('.ass'),
+            time_offset=start,
+        )
+        return [
             'ffmpeg',
             '-y',
             '-f',
@@ -231,20 +1171,78 @@ class VideoPipelineService:
             '-vf',
             video_filter,
             '-r',
-            '30',
-            '-c:v',
-            'libx264',
-            '-pix_fmt',
-            'yuv420p',
-            '-t',
-            f'{total_duration:.2f}',
+            str(profile.fps),
+            *self._video_codec_args(profile, threads=threads),
+            # Frame counts come from the segment's absolute boundaries, so the segments of
+            # one video always add up to exactly the frames a single pass would produce.
+            '-frames:v',
+            str(round(end * profile.fps) - round(start * profile.fps)),
+            str(segment_path),
+        ]
+
+    def _concat_segments(self, segment_paths: list[Path], slideshow_path: Path) -> None:
+        # Every segment starts on its own IDR frame, so the concat demuxer can join
+        # them with stream copy.
+        segment_list = slideshow_path.with_name(f'{slideshow_path.stem}_segments.txt')
+        segment_list.write_text(
+            '\n'.join(f"file {shlex.quote(str(path.resolve()))}" for path in segment_paths),
+            encoding='utf-8',
+        )
+        self._run([
+            'ffmpeg',
+            '-y',
+            '-f',
+            'concat',
+            '-safe',
+            '0',
+            '-i',
+            str(segment_list),
+            '-c',
+            'copy',
             str(slideshow_path),
-        ])
+        ], stage='concat')
+
+    def _use_segmented_slideshow(self, image_paths: list[Path], total_duration: float) -> bool:
+        if not self.parallel_segments or len(image_paths) < 2 or self.segment_workers < 2:
+            return False
+        return total_duration >= 2 * self.segment_seconds
 
-    def _compose_final_video(
+    def _plan_segments(
         self,
-        output_path: Path,
-        slideshow_path: Path,
+        image_count: int,
+        per_image_duration: float,
+        total_duration: float,
+        fps: int,
+        segment_seconds: int | None = None,
+    ) -> list[tuple[int, int, float, float]]:
+        # Consecutive images are grouped into (first, last, start, end) segments of at
+        # least segment_seconds; boundaries fall on image changes and whole frames.
+        # Boundaries are whole frames counted from the start of the video, never from the
+        # previous boundary, so rounding cannot accumulate across segments.
+        segment_seconds = segment_seconds or self.segment_seconds
+        segments: list[tuple[int, int, float, float]] = []
+        first = 0
+        start_frame = 0
+        for image_index in range(image_count):
+            image_start = image_index * per_image_duration
+            if image_start >= total_duration:
+                break
+            image_end = min(total_duration, (image_index + 1) * per_image_duration)
+            is_last = image_index == image_count - 1 or image_end >= total_duration
+            end_frame = round(image_end * fps)
+            if is_last:
+                segments.append((first, image_index + 1, start_frame / fps, total_duration))
+                break
+            if end_frame - start_frame >= segment_seconds * fps:
+                segments.append((first, image_index + 1, start_frame / fps, end_frame / fps))
+                first = image_index + 1
+                start_frame = end_frame
+        return segments
+
+    def _build_audio_mix(
+        self,
+        *,
+        audio_path: Path,
         total_duration: float,
         voice_path: Path | None,
         music_path: Path | None,
@@ -257,40 +1255,301 @@ class VideoPipelineService:
             self._run([
                 'ffmpeg',
                 '-y',
-                '-i',
-                str(slideshow_path),
-                '-c:v',
-                'copy',
                 '-f',
                 'lavfi',
                 '-i',
                 f'anullsrc=r=44100:cl=stereo:d={total_duration:.2f}',
-                '-shortest',
                 '-c:a',
                 'aac',
                 '-b:a',
                 '128k',
-                str(output_path),
-            ])
+                str(audio_path),
+            ], stage='audio', duration=total_duration)
             return
 
-        cmd = ['ffmpeg', '-y', '-i', str(slideshow_path)]
-        filter_parts: list[str] = []
-        map_audio = ''
+        cmd = ['ffmpeg', '-y']
+        audio_inputs, voice_input_index, music_input_index = self._audio_input_args(
+            voice_path=voice_path,
+            music_path=music_path,
+            first_index=0,
+        )
+        cmd.extend(audio_inputs)
+        filter_parts, map_audio = self._build_audio_graph(
+            voice_input_index=voice_input_index,
+            music_input_index=music_input_index,
+            total_duration=total_duration,
+            music_volume=music_volume,
+            duck_music=duck_music,
+            voice_exists=voice_exists,
+            render_id=render_id,
+        )
+
+        if filter_parts:
+            cmd.extend(['-filter_complex', ';'.join(filter_parts)])
+        cmd.extend([
+            '-map',
+            map_audio,
+            '-c:a',
+            'aac',
+            '-b:a',
+            '128k',
+            '-t',
+            f'{total_duration:.2f}',
+            str(audio_path),
+        ])
+        self._run(cmd, stage='audio', duration=total_duration)
+
+    def _mux(self, *, output_path: Path, slideshow_path: Path, audio_path: Path, total_duration: float) -> None:
+        # Both streams are already encoded; muxing is a stream copy.
+        output_path.unlink(missing_ok=True)
+        self._run([
+            'ffmpeg',
+            '-y',
+            '-i',
+            str(slideshow_path),
+            '-i',
+            str(audio_path),
+            '-map',
+            '0:v',
+            '-map',
+            '1:a',
+            '-c',
+            'copy',
+            '-shortest',
+            str(output_path),
+        ], stage='mux', duration=total_duration)
+
+    def _render_single_pass(
+        self,
+        *,
+        output_path: Path,
+        preview_paths: dict[str, Path],
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        target_size: tuple[int, int],
+        voice_path: Path | None,
+        music_path: Path | None,
+        music_volume: int,
+        duck_music: bool,
+        voice_exists: bool,
+        render_id: str,
+        profile: RenderProfile,
+    ) -> None:
+        concat_file = output_path.with_name(f'{output_path.stem}_slideshow.txt')
+        cmd = [
+            'ffmpeg',
+            '-y',
+            *self._slideshow_input_args(
+                concat_file=concat_file,
+                image_paths=image_paths,
+                per_image_duration=per_image_duration,
+                total_duration=total_duration,
+                target_size=target_size,
+                profile=profile,
+            ),
+        ]
+        audio_inputs, voice_input_index, music_input_index = self._audio_input_args(
+            voice_path=voice_path,
+            music_path=music_path,
+            first_index=1,
+        )
+        cmd.extend(audio_inputs)
+
+        video_filter = self._build_video_filter(
+            title=title,
+            script=script,
+            captions_enabled=captions_enabled,
+            total_duration=total_duration,
+            target_size=target_size,
+            profile=profile,
+            captions_path=output_path.with_name(f'{output_path.stem}_captions.ass'),
+        )
+        preview_parts, preview_outputs = self._preview_graph('previewsrc', total_duration, preview_paths)
+        filter_parts = [f'[0:v]{video_filter},split=2[vout][previewsrc]', *preview_parts]
+        audio_parts, map_audio = self._build_audio_graph(
+            voice_input_index=voice_input_index,
+            music_input_index=music_input_index,
+            total_duration=total_duration,
+            music_volume=music_volume,
+            duck_music=duck_music,
+            voice_exists=voice_exists,
+            render_id=render_id,
+        )
+        filter_parts.extend(audio_parts)
+        if not map_audio:
+            silent_index = 1 + len([index for index in (voice_input_index, music_input_index) if index is not None])
+            cmd.extend(['-f', 'lavfi', '-i', f'anullsrc=r=44100:cl=stereo:d={total_duration:.2f}'])
+            map_audio = f'{silent_index}:a'
+
+        cmd.extend([
+            '-filter_complex',
+            ';'.join(filter_parts),
+            '-map',
+            '[vout]',
+            '-map',
+            map_audio,
+            *self._video_codec_args(profile),
+            '-c:a',
+            'aac',
+            '-b:a',
+            '128k',
+            '-t',
+            f'{total_duration:.2f}',
+            '-shortest',
+            str(output_path),
+            *preview_outputs,
+        ])
+        self._run(cmd, stage='render', duration=total_duration)
+
+    def _slideshow_input_args(
+        self,
+        *,
+        concat_file: Path,
+        image_paths: list[Path],
+        per_image_duration: float,
+        total_duration: float,
+        target_size: tuple[int, int],
+        profile: RenderProfile,
+    ) -> list[str]:
+        target_w, target_h = target_size
+        if not image_paths:
+            return [
+                '-f',
+                'lavfi',
+                '-i',
+                f'color=c=0x111827:s={target_w}x{target_h}:r={profile.overlay_fps}:d={total_duration:.2f}',
+            ]
+
+        lines: list[str] = []
+        for path in image_paths:
+            lines.append(f"file {shlex.quote(str(path))}")
+            lines.append(f'duration {per_image_duration:.3f}')
+        lines.append(f"file {shlex.quote(str(image_paths[-1]))}")
+        concat_file.write_text('\n'.join(lines), encoding='utf-8')
+        return ['-f', 'concat', '-safe', '0', '-i', str(concat_file)]
+
+    def _build_video_filter(
+        self,
+        *,
+        title: str | None,
+        script: str,
+        captions_enabled: bool,
+        total_duration: float,
+        target_size: tuple[int, int],
+        profile: RenderProfile,
+        captions_path: Path,
+        time_offset: float = 0.0,
+    ) -> str:
+        target_w, target_h = target_size
+        title_text = self._escape_drawtext(title or '')
+        text_filters: list[str] = []
+        if title_text:
+            title_font = self._font_clause(title or '')
+            text_filters.append(
+                f"drawtext=text='{title_text}'{title_font}:fontcolor=white:fontsize=34:x=40:y=h-th-40:box=1:boxcolor=black@0.45:boxborderw=12"
+            )
+        if captions_enabled and script.strip():
+            # All captions come from one ASS track, so per-frame cost no longer grows with
+            # the number of sentences the way chained drawtext filters did.
+            fonts_dir = self._write_caption_track(
+                captions_path=captions_path,
+                script=script,
+                total_duration=total_duration,
+                target_size=target_size,
+                time_offset=time_offset,
+            )
+            if fonts_dir is not None:
+                caption_filter = f"ass=filename='{self._escape_drawtext(str(captions_path))}'"
+                if fonts_dir:
+                    caption_filter += f":fontsdir='{self._escape_drawtext(fonts_dir)}'"
+                text_filters.append(caption_filter)
+        text_filters.append(
+            "drawtext=text='RangManch AI':fontcolor=white@0.65:fontsize=18:x=w-tw-30:y=24"
+        )
+        # Scale/pad run once per source image. Overlays are drawn on a low-rate stream, and
+        # only the final fps filter duplicates frames up to the output rate; x264 codes
+        # those duplicates as skip blocks.
+        video_filter = (
+            f'scale={target_w}:{target_h}:force_original_aspect_ratio=decrease,'
+            f'pad={target_w}:{target_h}:(ow-iw)/2:(oh-ih)/2,format=yuv420p,fps={profile.overlay_fps}'
+        )
+        if text_filters:
+            video_filter = f"{video_filter},{','.join(text_filters)}"
+        output_w, output_h = profile.output_size(target_size)
+        if (output_w, output_h) != (target_w, target_h):
+            video_filter = f'{video_filter},scale={output_w}:{output_h}'
+        return f'{video_filter},fps={profile.fps}'
+
+    def _threads_for_job(self, total_duration: float) -> int | None:
+        if not self.thread_budget:
+            return None
+        # x264 frame threads only pay off with enough frames in flight, so short reels use
+        # less than their slot's budget.
+        return max(1, min(self.thread_budget, int(total_duration // 5) + 1))
 
-        input_index = 1
+    def _video_codec_args(self, profile: RenderProfile, threads: int | None = None) -> list[str]:
+        threads = threads or self._encoder_threads
+        thread_args = ['-threads', str(threads)] if threads else []
+        return [
+            *thread_args,
+            '-c:v',
+            'libx264',
+            '-preset',
+            profile.preset,
+            '-tune',
+            profile.tune,
+            '-crf',
+            str(profile.crf),
+            '-g',
+            str(profile.fps * profile.gop_seconds),
+            '-pix_fmt',
+            'yuv420p',
+        ]
+
+    def _audio_input_args(
+        self,
+        *,
+        voice_path: Path | None,
+        music_path: Path | None,
+        first_index: int,
+    ) -> tuple[list[str], int | None, int | None]:
+        args: list[str] = []
+        input_index = first_index
         voice_input_index: int | None = None
         music_input_index: int | None = None
 
         if voice_path:
-            cmd.extend(['-i', str(voice_path)])
+            args.extend(['-i', str(voice_path)])
             voice_input_index = input_index
             input_index += 1
 
         if music_path:
-            cmd.extend(['-stream_loop', '-1', '-i', str(music_path)])
+            # Library beds already cover the render; only raw tracks need looping.
+            if not self.music_library.owns(music_path):
+                args.extend(['-stream_loop', '-1'])
+            args.extend(['-i', str(music_path)])
             music_input_index = input_index
 
+        return args, voice_input_index, music_input_index
+
+    def _build_audio_graph(
+        self,
+        *,
+        voice_input_index: int | None,
+        music_input_index: int | None,
+        total_duration: float,
+        music_volume: int,
+        duck_music: bool,
+        voice_exists: bool,
+        render_id: str,
+    ) -> tuple[list[str], str]:
+        filter_parts: list[str] = []
+        map_audio = ''
+
         music_gain = max(0.0, min(1.0, music_volume / 100.0)) * MUSIC_BASE_GAIN
         if voice_exists and duck_music:
             music_gain *= 0.6
@@ -307,27 +1566,24 @@ class VideoPipelineService:
             filter_parts.append(f'[{music_input_index}:a]atrim=0:{total_duration:.2f},asetpts=N/SR/TB,volume={music_gain:.3f}[aout]')
             map_audio = '[aout]'
 
-        if filter_parts:
-            cmd.extend(['-filter_complex', ';'.join(filter_parts)])
-
-        cmd.extend(['-map', '0:v'])
-        if map_audio:
-            cmd.extend(['-map', map_audio])
-
-        cmd.extend([
-            '-c:v',
-            'libx264',
-            '-c:a',
-            'aac',
-            '-b:a',
-            '128k',
-            '-shortest',
-            str(output_path),
-        ])
+        return filter_parts, map_audio
 
-        self._run(cmd)
+    def _voice_duration(self, voice_path: Path) -> float:
+        key = self._stage_key('timing', {'voice': content_digest(voice_path)})
+        if key and self.render_cache is not None:
+            cached = self.render_cache.get_value(key)
+            if isinstance(cached, (int, float)):
+                return float(cached)
+        duration = self._probe_duration(voice_path)
+        if key and self.render_cache is not None:
+            self.render_cache.put_value(key, duration)
+        return duration
 
     def _probe_duration(self, media_path: Path) -> float:
+        # Voiceovers are WAV or MP3, whose headers give the duration without forking ffprobe.
+        duration = audio_duration(media_path)
+        if duration is not None:
+            return max(0.0, duration)
         result = subprocess.run(
             [
                 'ffprobe',
@@ -346,6 +1602,15 @@ class VideoPipelineService:
         value = float(result.stdout.strip() or '0')
         return max(0.0, value)
 
+    def _music_bed(self, music_path: Path, total_duration: float, sample_rate: int) -> Path:
+        # The bed is loudness-normalised PCM at the render's rate and at least total_duration
+        # long, so the mix skips the decode/resample/loop of the original track.
+        try:
+            return self.music_library.bed(music_path, total_duration, sample_rate)
+        except (RuntimeError, OSError) as exc:
+            logger.warning('music_bed_failed', extra={'path': str(music_path), 'error': str(exc)})
+            return music_path
+
     def _resolve_music_path(self, music_mode: str, track_id: str | None, music_file_url: str | None) -> Path | None:
         if music_mode == 'none':
             return None
@@ -360,6 +1625,18 @@ class VideoPipelineService:
             return candidate if candidate.exists() else None
         return None
 
+    def _prepare_frames(self, image_paths: list[Path], target_size: tuple[int, int]) -> list[Path]:
+        # Pre-scaled derivatives are cached per target size, so ffmpeg's scale/pad becomes a
+        # pass-through instead of decoding full-size photos on every render.
+        frames: list[Path] = []
+        for path in image_paths:
+            try:
+                frames.append(self.image_ingest.derivative(path, target_size).resolve())
+            except (ValueError, RuntimeError) as exc:
+                logger.warning('image_derivative_failed', extra={'path': str(path), 'error': str(exc)})
+                frames.append(path)
+        return frames
+
     def _urls_to_local_paths(self, urls: list[str]) -> list[Path]:
         paths: list[Path] = []
         for url in urls:
@@ -375,13 +1652,129 @@ class VideoPipelineService:
         return Path('data') / normalized
 
     def _make_thumbnail(self, source_video: Path, thumb_path: Path) -> None:
-        self._run(['ffmpeg', '-y', '-i', str(source_video), '-frames:v', '1', str(thumb_path)])
+        self._run(['ffmpeg', '-y', '-i', str(source_video), '-frames:v', '1', str(thumb_path)], stage='thumbnail')
 
-    def _run(self, cmd: list[str]) -> None:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            stderr = (result.stderr or '').strip()
-            raise RuntimeError(f'ffmpeg failed ({result.returncode}): {stderr[:800]}')
+    def _make_previews(self, source_video: Path, preview_paths: dict[str, Path], total_duration: float) -> None:
+        filter_parts, output_args = self._preview_graph('0:v', total_duration, preview_paths)
+        self._run(
+            ['ffmpeg', '-y', '-i', str(source_video), '-filter_complex', ';'.join(filter_parts), *output_args],
+            stage='previews',
+            duration=total_duration,
+        )
+
+    def _preview_graph(
+        self,
+        source_label: str,
+        total_duration: float,
+        preview_paths: dict[str, Path],
+    ) -> tuple[list[str], list[str]]:
+        # Every preview comes from the same decode: frames sampled evenly across the video
+        # are tiled into the hover sprite, and the thumbnail filter picks the most
+        # representative of them as the poster instead of the title card at frame 0.
+        sample_rate = f'{PREVIEW_SPRITE_FRAMES}/{max(total_duration, 0.1):.2f}'
+        filter_parts = [
+            f'[{source_label}]fps={sample_rate},split=2[posterpool][spritepool]',
+            f'[posterpool]thumbnail=n={PREVIEW_SPRITE_FRAMES},split=3[poster][poster320][poster640]',
+            '[poster320]scale=320:-2[thumb320]',
+            '[poster640]scale=640:-2[thumb640]',
+            f'[spritepool]scale={PREVIEW_SPRITE_WIDTH}:-2,tile={PREVIEW_SPRITE_FRAMES}x1[sprite]',
+        ]
+        webp_args = ['-c:v', 'libwebp', '-quality', str(PREVIEW_WEBP_QUALITY)]
+        output_args = [
+            '-map', '[poster]', '-frames:v', '1', '-q:v', '2', str(preview_paths['jpg']),
+            '-map', '[thumb320]', '-frames:v', '1', *webp_args, str(preview_paths['320.webp']),
+            '-map', '[thumb640]', '-frames:v', '1', *webp_args, str(preview_paths['640.webp']),
+            '-map', '[sprite]', '-frames:v', '1', *webp_args, str(preview_paths['sprite.webp']),
+        ]
+        return filter_parts, output_args
+
+    def _run(
+        self,
+        cmd: list[str],
+        *,
+        stage: str | None = None,
+        duration: float | None = None,
+        part: int = 0,
+        part_weight: float = 1.0,
+    ) -> None:
+        self._check_cancelled()
+        if not stage:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0:
+                stderr = (result.stderr or '').strip()
+                raise RuntimeError(f'ffmpeg failed ({result.returncode}): {stderr[-800:]}')
+            return
+
+        # -progress emits key=value blocks on stdout as encoding advances; stderr goes to a
+        # file so a chatty encoder can never block on a full pipe.
+        progress_cmd = [cmd[0], '-progress', 'pipe:1', '-nostats', *cmd[1:]]
+        started = time.monotonic()
+        out_seconds = 0.0
+        speed: float | None = None
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8', errors='replace') as stderr_file:
+            # Own session, so cancellation can signal ffmpeg and anything it spawned at once.
+            process = subprocess.Popen(
+                progress_cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                start_new_session=True,
+            )
+            try:
+                for line in process.stdout or []:
+                    key, _, value = line.strip().partition('=')
+                    if key in {'out_time_us', 'out_time_ms'} and value.lstrip('-').isdigit():
+                        # ffmpeg reports out_time_ms in microseconds as well.
+                        out_seconds = max(out_seconds, int(value) / 1_000_000)
+                        if duration:
+                            self._report_progress(stage, out_seconds / duration, part=part, part_weight=part_weight)
+                    elif key == 'speed' and value.endswith('x'):
+                        try:
+                            speed = float(value[:-1])
+                        except ValueError:
+                            pass
+                    elif key == 'progress':
+                        self._check_cancelled()
+                returncode = process.wait()
+            except BaseException:
+                self._kill_process_group(process)
+                raise
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().strip()
+                raise RuntimeError(f'ffmpeg failed ({returncode}): {stderr[-800:]}')
+
+        self._report_progress(stage, 1.0, part=part, part_weight=part_weight)
+        elapsed = time.monotonic() - started
+        media_seconds = duration or out_seconds
+        logger.info(
+            'ffmpeg_stage_completed',
+            extra={
+                'stage': stage,
+                'part': part,
+                'elapsed_seconds': round(elapsed, 3),
+                'media_seconds': round(media_seconds, 3),
+                'speed_factor': speed if speed is not None else (round(media_seconds / elapsed, 3) if elapsed else None),
+            },
+        )
+
+    def _check_cancelled(self) -> None:
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+
+    def _kill_process_group(self, process: subprocess.Popen) -> None:
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=5)
+        except ProcessLookupError:
+            return
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+
+    def _report_progress(self, stage: str, fraction: float, *, part: int = 0, part_weight: float = 1.0) -> None:
+        if self._progress is not None:
+            self._progress.update(stage, fraction, part=part, part_weight=part_weight)
 
     def _escape_drawtext(self, text: str) -> str:
         value = text.strip().replace('\n', ' ')
@@ -460,21 +1853,104 @@ class VideoPipelineService:
             return 'unicode'
         return 'unicode'
 
-    def _build_caption_filters(self, script: str, total_duration: float) -> list[str]:
+    def _write_caption_track(
+        self,
+        *,
+        captions_path: Path,
+        script: str,
+        total_duration: float,
+        target_size: tuple[int, int],
+        time_offset: float = 0.0,
+    ) -> str | None:
+        # Returns the fonts dir for the ass filter ('' when only system fonts apply), or
+        # None when there is nothing to caption.
         parts = [value.strip() for value in re.split(r'(?<=[.!?])\s+', script.strip()) if value.strip()]
         if not parts:
-            return []
+            return None
         segment = max(0.8, total_duration / len(parts))
-        filters: list[str] = []
+        events: list[str] = []
+        styles: dict[str, str | None] = {}
         for index, sentence in enumerate(parts):
-            start = index * segment
-            end = min(total_duration, (index + 1) * segment)
-            text = self._escape_drawtext(sentence[:140])
-            font_clause = self._font_clause(sentence)
-            filters.append(
-                "drawtext="
-                f"text='{text}'{font_clause}:fontcolor=white:fontsize=30:x=(w-text_w)/2:y=h-th-90:"
-                "box=1:boxcolor=black@0.55:boxborderw=10:shadowcolor=black@0.7:shadowx=1:shadowy=1:"
-                f"enable='between(t,{start:.2f},{end:.2f})'"
+            start = max(0.0, index * segment - time_offset)
+            end = min(total_duration, (index + 1) * segment) - time_offset
+            if end <= 0 or start >= end:
+                continue
+            style = self._detect_script(sentence)
+            if style not in styles:
+                styles[style] = self._resolve_font_path(sentence)
+            events.append(
+                f'Dialogue: 0,{self._ass_timestamp(start)},{self._ass_timestamp(end)},{style},,0,0,0,,'
+                f'{self._escape_ass(sentence[:140])}'
             )
-        return filters
+        if not events:
+            return None
+
+        target_w, target_h = target_size
+        # Matches the old drawtext look: white 30px text in a 55% black box 90px above the bottom.
+        style_lines = [
+            f'Style: {style},{self._font_family(font_path)},30,&H00FFFFFF,&H00FFFFFF,&H73000000,&H4D000000,'
+            '0,0,0,0,100,100,0,0,3,10,1,2,40,40,90,1'
+            for style, font_path in styles.items()
+        ]
+        captions_path.write_text(
+            '\n'.join([
+                '[Script Info]',
+                'ScriptType: v4.00+',
+                f'PlayResX: {target_w}',
+                f'PlayResY: {target_h}',
+                'WrapStyle: 0',
+                'ScaledBorderAndShadow: yes',
+                '',
+                '[V4+ Styles]',
+                'Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, '
+                'Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, '
+                'Alignment, MarginL, MarginR, MarginV, Encoding',
+                *style_lines,
+                '',
+                '[Events]',
+                'Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text',
+                *events,
+                '',
+            ]),
+            encoding='utf-8',
+        )
+        font_paths = sorted({path for path in styles.values() if path})
+        return self._caption_fonts_dir(captions_path, font_paths) if font_paths else ''
+
+    def _caption_fonts_dir(self, captions_path: Path, font_paths: list[str]) -> str:
+        # libass takes a single fontsdir, and the fonts for different scripts live in
+        # different system directories; link every one this track uses into one place.
+        fonts_dir = captions_path.with_name(f'{captions_path.stem}_fonts')
+        fonts_dir.mkdir(parents=True, exist_ok=True)
+        for font_path in font_paths:
+            link = fonts_dir / Path(font_path).name
+            if link.exists():
+                continue
+            try:
+                link.symlink_to(font_path)
+            except OSError:
+                shutil.copyfile(font_path, link)
+        return str(fonts_dir)
+
+    def _font_family(self, font_path: str | None) -> str:
+        if not font_path:
+            return 'Sans'
+        # libass matches fonts by family name, so use the one in the font's name table.
+        family = _font_family_name(font_path)
+        if family:
+            return family
+        stem = Path(font_path).stem.split('-')[0]
+        if ' ' not in stem:
+            stem = re.sub(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', ' ', stem)
+        return stem.strip()
+
+    def _ass_timestamp(self, seconds: float) -> str:
+        centiseconds = int(round(seconds * 100))
+        hours, remainder = divmod(centiseconds, 360000)
+        minutes, remainder = divmod(remainder, 6000)
+        secs, centis = divmod(remainder, 100)
+        return f'{hours}:{minutes:02d}:{secs:02d}.{centis:02d}'
+
+    def _escape_ass(self, text: str) -> str:
+        value = text.strip().replace('\n', ' ').replace('\\', '/')
+        return value.replace('{', '(').replace('}', ')')
@@ -1,19 +1,40 @@
+import asyncio
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict
 from pathlib import Path
 from uuid import uuid4
 
+from celery import chord, group
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 
 from app.db.repositories.video_repository import VideoRepository
 from app.models.entities import Video, VideoStatus
 from app.services.asset_tagging_service import AssetTaggingService
+from app.services.image_ingest import ImageIngestService
+from app.services.music_library import MusicLibrary
+from app.services.render_cancellation import CancellationToken, GroupCancellationToken, RenderCancelled
+from app.services.render_scheduler import RenderScheduler
 from app.services.render_service import celery_app
-from app.services.video_pipeline import VideoPipelineService
+from app.services.script_translation import translate_script
+from app.services.tts import LANGUAGE_OPTIONS, generate_voiceover_detailed
+from app.services.video_pipeline import (
+    DistributedRenderPlan,
+    RenderArtifacts,
+    VideoPipelineService,
+    throttled_progress,
+)
 
 logger = logging.getLogger(__name__)
 
+# Progress a distributed render reports once its chunks are queued and once they have all
+# been encoded; the callback's concat, mux and previews fill the rest.
+DISTRIBUTED_DISPATCH_PROGRESS = 40
+DISTRIBUTED_FINISH_PROGRESS = 85
+
 
 class VideoService:
     def __init__(self, db: Session) -> None:
@@ -47,6 +68,7 @@ class VideoService:
         duration_seconds: int | None = None,
         captions_enabled: bool = True,
         audio_sample_rate_hz: int = 22050,
+        quality: str = 'final',
         selected_model: str | None = None,
         reference_images: list[str] | None = None,
         music_mode: str = 'none',
@@ -55,47 +77,21 @@ class VideoService:
         duck_music: bool = True,
         music_file: UploadFile | None = None,
     ) -> Video:
-        normalized_mode = music_mode.strip().lower()
-        if normalized_mode not in {'none', 'library', 'upload'}:
-            raise ValueError('music_mode must be one of none|library|upload')
-        if normalized_mode == 'library' and not music_track_id:
-            raise ValueError('music_track_id is required when music_mode=library')
-        if normalized_mode == 'upload' and not music_file:
-            raise ValueError('music_file is required when music_mode=upload')
-        if aspect_ratio not in {'9:16', '16:9', '1:1'}:
-            raise ValueError('aspect_ratio must be one of 9:16|16:9|1:1')
-        if resolution not in {'720p', '1080p'}:
-            raise ValueError('resolution must be one of 720p|1080p')
-        if duration_mode not in {'auto', 'custom'}:
-            raise ValueError('duration_mode must be one of auto|custom')
-        if duration_mode == 'custom':
-            if duration_seconds is None or duration_seconds < 5 or duration_seconds > 300:
-                raise ValueError('duration_seconds must be between 5 and 300 for custom mode')
-        else:
-            duration_seconds = None
-        if audio_sample_rate_hz not in {8000, 22050, 48000}:
-            raise ValueError('audio_sample_rate_hz must be one of 8000|22050|48000')
+        normalized_mode, duration_seconds = self._validate_render_options(
+            aspect_ratios=[aspect_ratio],
+            resolution=resolution,
+            duration_mode=duration_mode,
+            duration_seconds=duration_seconds,
+            audio_sample_rate_hz=audio_sample_rate_hz,
+            quality=quality,
+            music_mode=music_mode,
+            music_track_id=music_track_id,
+            music_file=music_file,
+        )
         if selected_model and selected_model not in {'sora2', 'veo3'}:
             raise ValueError('selected_model must be one of sora2|veo3')
         normalized_reference_images = [value.strip() for value in (reference_images or []) if value.strip()]
-
-        image_urls: list[str] = []
-        for image in images:
-            ext = Path(image.filename or '').suffix or '.jpg'
-            safe_name = f'{uuid4()}{ext.lower()}'
-            target = self.upload_dir / safe_name
-            data = await image.read()
-            target.write_bytes(data)
-            image_urls.append(f'/static/uploads/{safe_name}')
-
-        music_file_url: str | None = None
-        if normalized_mode == 'upload' and music_file is not None:
-            ext = Path(music_file.filename or '').suffix.lower() or '.mp3'
-            safe_name = f'{uuid4()}{ext}'
-            target = self.music_upload_dir / safe_name
-            data = await music_file.read()
-            target.write_bytes(data)
-            music_file_url = f'/static/music_uploads/{safe_name}'
+        image_urls, music_file_url = await self._store_uploads(images, normalized_mode, music_file)
 
         video = self.repo.create(
             user_id=user_id,
@@ -109,6 +105,7 @@ class VideoService:
             duration_seconds=duration_seconds,
             captions_enabled=captions_enabled,
             audio_sample_rate_hz=audio_sample_rate_hz,
+            quality=quality,
             status=VideoStatus.processing,
             progress=5,
             image_urls=json.dumps(image_urls),
@@ -125,25 +122,333 @@ class VideoService:
         logger.info('video_job_enqueued', extra={'render_id': video.id})
         return video
 
+    async def create_video_variants(
+        self,
+        user_id: str,
+        script: str,
+        source_language: str,
+        languages: list[str],
+        aspect_ratios: list[str],
+        voice: str,
+        images: list[UploadFile],
+        title: str | None = None,
+        resolution: str = '1080p',
+        duration_mode: str = 'auto',
+        duration_seconds: int | None = None,
+        captions_enabled: bool = True,
+        audio_sample_rate_hz: int = 22050,
+        quality: str = 'final',
+        music_mode: str = 'none',
+        music_track_id: str | None = None,
+        music_volume: int = 20,
+        duck_music: bool = True,
+        music_file: UploadFile | None = None,
+    ) -> list[Video]:
+        languages = list(dict.fromkeys(value.strip() for value in languages if value.strip()))
+        aspect_ratios = list(dict.fromkeys(value.strip() for value in aspect_ratios if value.strip()))
+        if not script.strip():
+            raise ValueError('script is required for variant renders')
+        if not languages or not aspect_ratios:
+            raise ValueError('At least one language and one aspect_ratio are required')
+        supported_languages = {option.label for option in LANGUAGE_OPTIONS}
+        unsupported = [language for language in [source_language, *languages] if language not in supported_languages]
+        if unsupported:
+            raise ValueError(f'Unsupported languages: {", ".join(unsupported)}')
+        normalized_mode, duration_seconds = self._validate_render_options(
+            aspect_ratios=aspect_ratios,
+            resolution=resolution,
+            duration_mode=duration_mode,
+            duration_seconds=duration_seconds,
+            audio_sample_rate_hz=audio_sample_rate_hz,
+            quality=quality,
+            music_mode=music_mode,
+            music_track_id=music_track_id,
+            music_file=music_file,
+        )
+        # Uploads are stored once and shared by every variant row.
+        image_urls, music_file_url = await self._store_uploads(images, normalized_mode, music_file)
+
+        variant_group_id = str(uuid4())
+        videos: list[Video] = []
+        for language in languages:
+            for aspect_ratio in aspect_ratios:
+                videos.append(
+                    self.repo.create(
+                        user_id=user_id,
+                        title=title or None,
+                        language=language,
+                        script=script,
+                        voice=voice,
+                        aspect_ratio=aspect_ratio,
+                        resolution=resolution,
+                        duration_mode=duration_mode,
+                        duration_seconds=duration_seconds,
+                        captions_enabled=captions_enabled,
+                        audio_sample_rate_hz=audio_sample_rate_hz,
+                        quality=quality,
+                        variant_group_id=variant_group_id,
+                        status=VideoStatus.processing,
+                        progress=5,
+                        image_urls=json.dumps(image_urls),
+                        reference_images='[]',
+                        music_mode=normalized_mode,
+                        music_track_id=music_track_id,
+                        music_file_url=music_file_url,
+                        music_volume=max(0, min(100, int(music_volume))),
+                        duck_music=duck_music,
+                    )
+                )
+
+        process_video_variants.delay(variant_group_id, source_language)
+        logger.info('video_variants_enqueued', extra={'render_id': variant_group_id, 'variants': len(videos)})
+        return videos
+
+    def list_variant_group(self, variant_group_id: str, user_id: str) -> list[Video]:
+        return [video for video in self.repo.list_by_variant_group(variant_group_id) if video.user_id == user_id]
+
+    def _validate_render_options(
+        self,
+        *,
+        aspect_ratios: list[str],
+        resolution: str,
+        duration_mode: str,
+        duration_seconds: int | None,
+        audio_sample_rate_hz: int,
+        quality: str,
+        music_mode: str,
+        music_track_id: str | None,
+        music_file: UploadFile | None,
+    ) -> tuple[str, int | None]:
+        normalized_mode = music_mode.strip().lower()
+        if normalized_mode not in {'none', 'library', 'upload'}:
+            raise ValueError('music_mode must be one of none|library|upload')
+        if normalized_mode == 'library' and not music_track_id:
+            raise ValueError('music_track_id is required when music_mode=library')
+        if normalized_mode == 'upload' and not music_file:
+            raise ValueError('music_file is required when music_mode=upload')
+        if any(aspect_ratio not in {'9:16', '16:9', '1:1'} for aspect_ratio in aspect_ratios):
+            raise ValueError('aspect_ratio must be one of 9:16|16:9|1:1')
+        if resolution not in {'720p', '1080p'}:
+            raise ValueError('resolution must be one of 720p|1080p')
+        if duration_mode not in {'auto', 'custom'}:
+            raise ValueError('duration_mode must be one of auto|custom')
+        if duration_mode == 'custom':
+            if duration_seconds is None or duration_seconds < 5 or duration_seconds > 300:
+                raise ValueError('duration_seconds must be between 5 and 300 for custom mode')
+        else:
+            duration_seconds = None
+        if audio_sample_rate_hz not in {8000, 22050, 48000}:
+            raise ValueError('audio_sample_rate_hz must be one of 8000|22050|48000')
+        if quality not in {'draft', 'final'}:
+            raise ValueError('quality must be one of draft|final')
+        return normalized_mode, duration_seconds
+
+    async def _store_uploads(
+        self,
+        images: list[UploadFile],
+        music_mode: str,
+        music_file: UploadFile | None,
+    ) -> tuple[list[str], str | None]:
+        image_urls: list[str] = []
+        image_ingest = ImageIngestService(masters_dir=self.upload_dir)
+        for image in images:
+            data = await image.read()
+            # Decode, resize and re-encode are CPU-bound; keep them off the event loop.
+            master_path = await asyncio.to_thread(image_ingest.ingest, data)
+            image_urls.append(f'/static/uploads/{master_path.name}')
+
+        music_file_url: str | None = None
+        if music_mode == 'upload' and music_file is not None:
+            ext = Path(music_file.filename or '').suffix.lower() or '.mp3'
+            safe_name = f'{uuid4()}{ext}'
+            target = self.music_upload_dir / safe_name
+            data = await music_file.read()
+            await asyncio.to_thread(target.write_bytes, data)
+            # Analysis and per-rate normalisation happen once here instead of on the first
+            # render; if ffmpeg fails the render falls back to ingesting the raw track.
+            try:
+                await asyncio.to_thread(MusicLibrary().ingest, target)
+            except (RuntimeError, OSError) as exc:
+                logger.warning('music_upload_ingest_failed', extra={'path': str(target), 'error': str(exc)})
+            music_file_url = f'/static/music_uploads/{safe_name}'
+        return image_urls, music_file_url
+
     def retry_video(self, video_id: str, user_id: str) -> Video | None:
         video = self.get_video(video_id, user_id)
         if not video:
             return None
         self.repo.update(video, status=VideoStatus.processing, progress=0, error_message=None)
+        CancellationToken(video.id).clear()
         process_video.delay(video.id)
         logger.info('video_job_retried', extra={'render_id': video.id})
         return video
 
+    def cancel_video(self, video_id: str, user_id: str) -> Video | None:
+        video = self.get_video(video_id, user_id)
+        if not video:
+            return None
+        if video.status != VideoStatus.processing:
+            raise ValueError('Only videos that are still processing can be cancelled')
+        if self.repo.cancel(video.id) is None:
+            raise ValueError('Only videos that are still processing can be cancelled')
+        # The worker that owns the job sees the token, kills its ffmpeg process group and
+        # stops provider polling.
+        CancellationToken(video.id).cancel()
+        self.db.refresh(video)
+        logger.info('video_job_cancel_requested', extra={'render_id': video.id})
+        return video
+
+    def promote_video(self, video_id: str, user_id: str) -> Video | None:
+        video = self.get_video(video_id, user_id)
+        if not video:
+            return None
+        if video.quality != 'draft':
+            raise ValueError('Only draft videos can be promoted')
+        if video.status != VideoStatus.completed:
+            raise ValueError('Draft render must complete before it can be promoted')
+        self.repo.update(video, quality='final', status=VideoStatus.processing, progress=0, error_message=None)
+        CancellationToken(video.id).clear()
+        process_video.delay(video.id)
+        logger.info('video_job_promoted', extra={'render_id': video.id})
+        return video
+
 
 @celery_app.task(name='process_video')
 def process_video(video_id: str) -> None:
     from app.db.session import SessionLocal
 
+    db = SessionLocal()
+    try:
+        _render_video(VideoRepository(db), AssetTaggingService(db), VideoPipelineService(), video_id)
+    finally:
+        db.close()
+
+
+@celery_app.task(name='process_video_variants')
+def process_video_variants(variant_group_id: str, source_language: str) -> None:
+    from app.db.session import SessionLocal
+
     db = SessionLocal()
     repo = VideoRepository(db)
     tagging = AssetTaggingService(db)
     pipeline = VideoPipelineService()
+    # Variants reuse each other's slideshow and audio stages, which only staged renders cache.
+    pipeline.render_mode = 'staged'
+    by_language: dict[str, list[Video]] = {}
+    try:
+        for video in repo.list_by_variant_group(variant_group_id):
+            if video.status == VideoStatus.processing:
+                by_language.setdefault(video.language or source_language, []).append(video)
+        if not by_language:
+            return
+        sample = next(iter(by_language.values()))[0]
+        try:
+            image_urls = json.loads(sample.image_urls or '[]')
+        except json.JSONDecodeError:
+            image_urls = []
+
+        # Translation and synthesis are network-bound, so every language runs at once.
+        with ThreadPoolExecutor(max_workers=len(by_language)) as executor:
+            futures = {
+                language: executor.submit(
+                    _prepare_variant_language,
+                    source_script=sample.script,
+                    source_language=source_language,
+                    language=language,
+                    voice=sample.voice,
+                    sample_rate_hz=sample.audio_sample_rate_hz or 22050,
+                    cache_dir=pipeline.tts_cache_dir,
+                )
+                for language in by_language
+            }
+        scripts: dict[str, str] = {}
+        for language, future in futures.items():
+            try:
+                scripts[language] = future.result()
+            except Exception as exc:
+                for video in by_language[language]:
+                    repo.fail(video.id, f'Variant preparation failed: {exc}')
+                logger.exception('video_variant_prepare_failed', extra={'render_id': variant_group_id, 'language': language})
+                continue
+            for video in by_language[language]:
+                repo.update(video, script=scripts[language], progress=10)
+
+        with RenderScheduler().admit(variant_group_id) as slot:
+            pipeline.thread_budget = slot.threads
+            for language, videos in by_language.items():
+                if language not in scripts:
+                    continue
+                # The prebuild runs for the variants still wanted and stops, killing its
+                # ffmpeg, once all of them are cancelled.
+                active = [video for video in videos if not CancellationToken(video.id).cancelled]
+                if active:
+                    pipeline.cancel_token = GroupCancellationToken([CancellationToken(video.id) for video in active])
+                    try:
+                        pipeline.prebuild_variant_slideshows(
+                            variant_id=videos[0].id,
+                            title=sample.title,
+                            script=scripts[language],
+                            language_name=language,
+                            voice_name=sample.voice,
+                            audio_sample_rate_hz=sample.audio_sample_rate_hz or 22050,
+                            image_urls=image_urls,
+                            targets=[(video.aspect_ratio or '9:16', video.resolution or '1080p') for video in active],
+                            duration_mode=sample.duration_mode or 'auto',
+                            duration_seconds=sample.duration_seconds,
+                            captions_enabled=True if sample.captions_enabled is None else bool(sample.captions_enabled),
+                            quality=sample.quality or 'final',
+                        )
+                    except RenderCancelled:
+                        logger.info('video_variant_prebuild_cancelled', extra={'render_id': variant_group_id, 'language': language})
+                    except Exception:
+                        # Not fatal: each variant then encodes its own slideshow.
+                        logger.exception('video_variant_prebuild_failed', extra={'render_id': variant_group_id, 'language': language})
+                for video in videos:
+                    _render_video(repo, tagging, pipeline, video.id, admit=False)
+        logger.info('video_variants_completed', extra={'render_id': variant_group_id})
+    except Exception as exc:
+        for videos in by_language.values():
+            for video in videos:
+                db.refresh(video)
+                if video.status == VideoStatus.processing:
+                    repo.fail(video.id, str(exc))
+        logger.exception('video_variants_failed', extra={'render_id': variant_group_id})
+    finally:
+        db.close()
+
+
+def _prepare_variant_language(
+    *,
+    source_script: str,
+    source_language: str,
+    language: str,
+    voice: str,
+    sample_rate_hz: int,
+    cache_dir: Path,
+) -> str:
+    script = source_script if language == source_language else translate_script(source_script, language)
+    # Synthesizing here fills the TTS cache, so the renders only read the voiceover back.
+    generate_voiceover_detailed(
+        script=script,
+        voice=voice,
+        cache_dir=cache_dir,
+        language=language,
+        sample_rate_hz=sample_rate_hz,
+    )
+    return script
+
+
+def _render_video(
+    repo: VideoRepository,
+    tagging: AssetTaggingService,
+    pipeline: VideoPipelineService,
+    video_id: str,
+    admit: bool = True,
+) -> None:
+    cancel_token = CancellationToken(video_id)
+    pipeline.cancel_token = cancel_token
     try:
+        cancel_token.raise_if_cancelled()
         repo.set_progress(video_id, 15, VideoStatus.processing)
         video = repo.get_by_id(video_id)
         if not video:
@@ -159,35 +464,175 @@ def process_video(video_id: str) -> None:
         except json.JSONDecodeError:
             reference_images = []
 
-        repo.set_progress(video_id, 45, VideoStatus.processing)
-        pipeline.render_video_from_assets(
-            video_id=video_id,
-            title=video.title,
-            script=video.script,
-            language_name=video.language,
-            voice_name=video.voice,
-            audio_sample_rate_hz=video.audio_sample_rate_hz or 22050,
-            image_urls=image_urls,
-            aspect_ratio=video.aspect_ratio or '9:16',
-            resolution=video.resolution or '1080p',
-            duration_mode=video.duration_mode or 'auto',
-            duration_seconds=video.duration_seconds,
-            captions_enabled=True if video.captions_enabled is None else bool(video.captions_enabled),
-            music_mode=video.music_mode,
-            music_track_id=video.music_track_id,
-            music_file_url=video.music_file_url,
-            music_volume=video.music_volume,
-            duck_music=video.duck_music,
+        quality = video.quality or 'final'
+
+        def report_progress(percent: int) -> None:
+            # Never flip a cancelled video back to processing.
+            if not cancel_token.cancelled:
+                repo.set_progress(video_id, percent, VideoStatus.processing)
+
+        on_progress = throttled_progress(report_progress, start=15, end=95)
+        # Variant groups hold one slot for the whole group and render their videos in it.
+        admission = RenderScheduler().admit(video_id, cancel_token=cancel_token) if admit else nullcontext()
+        with admission as slot:
+            if slot is not None:
+                pipeline.thread_budget = slot.threads
+            result = pipeline.render_video_from_assets(
+                video_id=video_id,
+                title=video.title,
+                script=video.script,
+                language_name=video.language,
+                voice_name=video.voice,
+                audio_sample_rate_hz=video.audio_sample_rate_hz or 22050,
+                image_urls=image_urls,
+                aspect_ratio=video.aspect_ratio or '9:16',
+                resolution=video.resolution or '1080p',
+                duration_mode=video.duration_mode or 'auto',
+                duration_seconds=video.duration_seconds,
+                captions_enabled=True if video.captions_enabled is None else bool(video.captions_enabled),
+                music_mode=video.music_mode,
+                music_track_id=video.music_track_id,
+                music_file_url=video.music_file_url,
+                music_volume=video.music_volume,
+                duck_music=video.duck_music,
+                quality=quality,
+                on_progress=on_progress,
+                # Variant groups already share their slideshow encodes on this node.
+                distribute=pipeline.distributed and admit,
+            )
+        cancel_token.raise_if_cancelled()
+        if isinstance(result, DistributedRenderPlan):
+            # Dispatched after the slot is released: chunk tasks admit themselves on
+            # whichever node picks them up, this one included.
+            repo.set_progress(video_id, DISTRIBUTED_DISPATCH_PROGRESS, VideoStatus.processing)
+            _dispatch_distributed_render(result)
+            return
+        _complete_video(repo, tagging, video_id, quality, result)
+    except RenderCancelled:
+        repo.set_progress(video_id, 0, VideoStatus.cancelled)
+        logger.info('video_job_cancelled', extra={'render_id': video_id})
+    except Exception as exc:
+        repo.fail(video_id, str(exc))
+        logger.exception('video_job_failed', extra={'render_id': video_id})
+    finally:
+        cancel_token.clear()
+
+
+def _complete_video(
+    repo: VideoRepository,
+    tagging: AssetTaggingService,
+    video_id: str,
+    quality: str,
+    artifacts: RenderArtifacts,
+) -> None:
+    completed_video = repo.complete(
+        video_id,
+        output_url=f'/static/renders/{Path(artifacts.video_path).name}',
+        thumbnail_url=f'/static/renders/{Path(artifacts.poster_path).name}',
+        thumbnail_320_url=f'/static/renders/{Path(artifacts.thumb_320_path).name}',
+        thumbnail_640_url=f'/static/renders/{Path(artifacts.thumb_640_path).name}',
+        preview_sprite_url=f'/static/renders/{Path(artifacts.sprite_path).name}',
+    )
+    if completed_video is None:
+        # Cancelled (or settled by a sibling chunk) after the last cancellation check.
+        logger.info('video_job_result_discarded', extra={'render_id': video_id})
+        return
+    # Drafts are tagged once, when the promoted final render lands.
+    if quality == 'final':
+        tagging.auto_tag_video(completed_video)
+    logger.info('video_job_completed', extra={'render_id': video_id, 'quality': quality})
+
+
+def _dispatch_distributed_render(plan: DistributedRenderPlan) -> None:
+    payload = asdict(plan)
+    header = group(render_video_chunk.s(payload, index) for index in range(len(plan.chunks)))
+    try:
+        chord(header)(finalize_video_chunks.s(payload).on_error(discard_video_chunks.si(payload)))
+    except Exception:
+        # Eager mode runs the chord inline, every chunk included, and raises the failure
+        # instead of calling the errback.
+        if celery_app.conf.task_always_eager:
+            discard_video_chunks(payload)
+        raise
+    logger.info('video_job_distributed', extra={'render_id': plan.render_id, 'chunks': len(plan.chunks)})
+
+
+@celery_app.task(name='render_video_chunk')
+def render_video_chunk(payload: dict, index: int) -> str:
+    from app.db.session import SessionLocal
+
+    plan = DistributedRenderPlan(**payload)
+    cancel_token = CancellationToken(plan.render_id)
+    pipeline = VideoPipelineService()
+    pipeline.cancel_token = cancel_token
+    db = SessionLocal()
+    repo = VideoRepository(db)
+    try:
+        with RenderScheduler().admit(f'{plan.render_id}-chunk{index}', cancel_token=cancel_token) as slot:
+            pipeline.thread_budget = slot.threads
+            chunk_key = pipeline.render_distributed_chunk(plan, index)
+        done = pipeline.completed_chunks(plan)
+        if not cancel_token.cancelled:
+            span = DISTRIBUTED_FINISH_PROGRESS - DISTRIBUTED_DISPATCH_PROGRESS
+            repo.set_progress(
+                plan.render_id,
+                DISTRIBUTED_DISPATCH_PROGRESS + span * done // len(plan.chunks),
+                VideoStatus.processing,
+            )
+        return chunk_key
+    except RenderCancelled:
+        # A failed chunk never reaches the chord callback, so the chunk settles the video.
+        # Siblings may still be using the prefix; discard_video_chunks clears it once the
+        # whole chord has finished.
+        repo.set_progress(plan.render_id, 0, VideoStatus.cancelled)
+        logger.info('video_job_cancelled', extra={'render_id': plan.render_id, 'chunk': index})
+        raise
+    except Exception as exc:
+        repo.fail(plan.render_id, f'Render chunk {index} failed: {exc}')
+        logger.exception('video_chunk_failed', extra={'render_id': plan.render_id, 'chunk': index})
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name='discard_video_chunks')
+def discard_video_chunks(payload: dict) -> None:
+    # Chord error callback. The result backend only settles a chord once every chunk task
+    # has returned, so no sibling is still downloading frames or uploading its output.
+    VideoPipelineService().discard_distributed_render(DistributedRenderPlan(**payload))
+
+
+@celery_app.task(name='finalize_video_chunks')
+def finalize_video_chunks(chunk_keys: list[str], payload: dict) -> None:
+    from app.db.session import SessionLocal
+
+    plan = DistributedRenderPlan(**payload)
+    video_id = plan.render_id
+    cancel_token = CancellationToken(video_id)
+    pipeline = VideoPipelineService()
+    pipeline.cancel_token = cancel_token
+    db = SessionLocal()
+    repo = VideoRepository(db)
+    try:
+        cancel_token.raise_if_cancelled()
+
+        def report_progress(percent: int) -> None:
+            if not cancel_token.cancelled:
+                repo.set_progress(video_id, percent, VideoStatus.processing)
+
+        artifacts = pipeline.finish_distributed_render(
+            plan,
+            chunk_keys,
+            on_progress=throttled_progress(report_progress, start=DISTRIBUTED_FINISH_PROGRESS, end=95),
         )
-        repo.set_progress(video_id, 85, VideoStatus.processing)
-        output_url = f'/static/renders/{video_id}.mp4'
-        thumb_url = f'/static/renders/{video_id}.jpg'
-        completed_video = repo.complete(video_id, output_url=output_url, thumbnail_url=thumb_url)
-        if completed_video:
-            tagging.auto_tag_video(completed_video)
-        logger.info('video_job_completed', extra={'render_id': video_id})
+        cancel_token.raise_if_cancelled()
+        _complete_video(repo, AssetTaggingService(db), video_id, plan.quality, artifacts)
+    except RenderCancelled:
+        repo.set_progress(video_id, 0, VideoStatus.cancelled)
+        logger.info('video_job_cancelled', extra={'render_id': video_id})
     except Exception as exc:
         repo.fail(video_id, str(exc))
         logger.exception('video_job_failed', extra={'render_id': video_id})
     finally:
+        cancel_token.clear()
         db.close()
@@ -0,0 +1,438 @@
+"""Render pipeline benchmark.
+
+Drives VideoPipelineService.render_video_from_assets over a matrix of synthetic inputs
+(stubbed TTS, generated images and music) and writes per-stage wall time, CPU time, peak
+RSS and output size as JSON so runs can be compared across commits:
+
+    cd apps/api
+    python -m benchmarks.render_pipeline --output bench-$(git rev-parse --short HEAD).json
+    python -m benchmarks.render_pipeline --compare bench-old.json bench-new.json
+
+Requires ffmpeg/ffprobe on PATH and Pillow.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import platform
+import resource
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.services import video_pipeline
+from app.services.image_ingest import _load_pillow
+from app.services.tts import VoiceoverResult
+from app.services.video_pipeline import VideoPipelineService
+
+ASPECT_RATIOS = ('9:16', '16:9', '1:1')
+RESOLUTIONS = ('720p', '1080p')
+IMAGE_COUNTS = (1, 5, 20)
+SENTENCE_COUNTS = (0, 10, 40)
+
+# Roughly conversational pace, so stub voiceovers are as long as real ones.
+STUB_WORDS_PER_SECOND = 2.5
+STUB_SENTENCE = 'Sentence {index} walks the viewer through one more product detail.'
+MUSIC_SECONDS = 20
+# Matches the size ImageIngestService keeps masters at, which is what renders read.
+IMAGE_LONG_EDGE = 2160
+
+# CPU of in-process work is read per thread so parallel segment workers do not count
+# each other's time.
+RUSAGE_WORKER = getattr(resource, 'RUSAGE_THREAD', resource.RUSAGE_SELF)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    aspect_ratio: str
+    resolution: str
+    images: int
+    sentences: int
+    music: bool
+
+    @property
+    def name(self) -> str:
+        music = 'music' if self.music else 'nomusic'
+        return f'{self.aspect_ratio.replace(":", "x")}-{self.resolution}-{self.images}img-{self.sentences}sent-{music}'
+
+
+@dataclass
+class StageSample:
+    stage: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    child_cpu_seconds: float = 0.0
+    child_peak_rss_kb: int = 0
+    process_peak_rss_kb: int = 0
+    output_bytes: int = 0
+
+
+class StageRecorder:
+    def __init__(self) -> None:
+        self.samples: dict[str, StageSample] = {}
+        self._spans: dict[str, tuple[float, float]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def current_stage(self) -> str:
+        return getattr(self._local, 'stage', None) or 'other'
+
+    @contextmanager
+    def measure(self, stage: str, cmd: list[str] | None = None) -> Iterator[None]:
+        previous = getattr(self._local, 'stage', None)
+        self._local.stage = stage
+        started_wall = time.time()
+        started = time.perf_counter()
+        usage = resource.getrusage(RUSAGE_WORKER)
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            after = resource.getrusage(RUSAGE_WORKER)
+            self._local.stage = previous
+            output_bytes = _written_bytes(cmd, started_wall) if cmd else 0
+            with self._lock:
+                sample = self._sample(stage)
+                sample.calls += 1
+                sample.cpu_seconds += (after.ru_utime - usage.ru_utime) + (after.ru_stime - usage.ru_stime)
+                sample.process_peak_rss_kb = max(
+                    sample.process_peak_rss_kb,
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                )
+                sample.output_bytes += output_bytes
+                # Parallel segment parts overlap; wall time is the stage's span, not the sum.
+                first, last = self._spans.get(stage, (started, ended))
+                self._spans[stage] = (min(first, started), max(last, ended))
+                span_first, span_last = self._spans[stage]
+                sample.wall_seconds = span_last - span_first
+
+    def record_child(self, usage: resource.struct_rusage) -> None:
+        with self._lock:
+            sample = self._sample(self.current_stage)
+            cpu = usage.ru_utime + usage.ru_stime
+            sample.child_cpu_seconds += cpu
+            sample.cpu_seconds += cpu
+            sample.child_peak_rss_kb = max(sample.child_peak_rss_kb, usage.ru_maxrss)
+
+    def _sample(self, stage: str) -> StageSample:
+        if stage not in self.samples:
+            self.samples[stage] = StageSample(stage)
+        return self.samples[stage]
+
+
+_active_recorder: StageRecorder | None = None
+
+
+class MeasuredPopen(subprocess.Popen):
+    # Reaps children with wait4() so each ffmpeg/ffprobe's own CPU time and peak RSS are
+    # attributed to the stage that spawned it. Linux carries the forking process's RSS
+    # across exec, so a child's peak is never reported below this process's at spawn time.
+    def _try_wait(self, wait_flags):
+        try:
+            pid, status, usage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            return self.pid, 0
+        if pid == self.pid and _active_recorder is not None:
+            _active_recorder.record_child(usage)
+        return pid, status
+
+
+class BenchmarkPipeline(VideoPipelineService):
+    def __init__(self, recorder: StageRecorder) -> None:
+        super().__init__()
+        self.recorder = recorder
+
+    def _run(self, cmd: list[str], **kwargs) -> None:
+        with self.recorder.measure(kwargs.get('stage') or 'ffmpeg', cmd):
+            super()._run(cmd, **kwargs)
+
+    def _prepare_frames(self, image_paths: list[Path], target_size: tuple[int, int]) -> list[Path]:
+        with self.recorder.measure('frames'):
+            return super()._prepare_frames(image_paths, target_size)
+
+    def _probe_duration(self, media_path: Path) -> float:
+        with self.recorder.measure('probe'):
+            return super()._probe_duration(media_path)
+
+    def _music_bed(self, music_path: Path, total_duration: float, sample_rate: int) -> Path:
+        with self.recorder.measure('music'):
+            return super()._music_bed(music_path, total_duration, sample_rate)
+
+
+def _written_bytes(cmd: list[str], since: float) -> int:
+    total = 0
+    for arg in set(cmd):
+        if arg.startswith('-') or not os.path.isfile(arg):
+            continue
+        stat = os.stat(arg)
+        if stat.st_mtime >= since:
+            total += stat.st_size
+    return total
+
+
+def _write_tone(path: Path, seconds: float, sample_rate: int, frequency: float, channels: int = 1) -> None:
+    one_second = b''.join(
+        struct.pack('<h', int(3000 * math.sin(2 * math.pi * frequency * index / sample_rate))) * channels
+        for index in range(sample_rate)
+    )
+    whole, fraction = divmod(seconds, 1.0)
+    frame_bytes = 2 * channels
+    with wave.open(str(path), 'wb') as handle:
+        handle.setnchannels(channels)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        for _ in range(int(whole)):
+            handle.writeframes(one_second)
+        handle.writeframes(one_second[: int(fraction * sample_rate) * frame_bytes])
+
+
+def _stub_voiceover(
+    script: str,
+    voice: str,
+    cache_dir: Path,
+    language: str | None = None,
+    sample_rate_hz: int = 22050,
+    allow_premium: bool = True,
+) -> VoiceoverResult:
+    recorder = _active_recorder
+    with recorder.measure('voiceover') if recorder else nullcontext():
+        seconds = max(1.0, len(script.split()) / STUB_WORDS_PER_SECOND)
+        digest = hashlib.sha256(f'{script}|{sample_rate_hz}'.encode('utf-8')).hexdigest()[:16]
+        path = cache_dir / f'bench-{digest}.wav'
+        _write_tone(path, seconds, sample_rate_hz, frequency=220)
+    return VoiceoverResult(path=path, resolved_voice=voice, provider='benchmark', cached=False)
+
+
+def _write_images(count: int, upload_dir: Path) -> list[str]:
+    Image, _ = _load_pillow()
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    urls: list[str] = []
+    for index in range(count):
+        # Alternate orientations so letterboxing is exercised for every aspect ratio.
+        size = (IMAGE_LONG_EDGE, IMAGE_LONG_EDGE * 3 // 4) if index % 2 == 0 else (IMAGE_LONG_EDGE * 3 // 4, IMAGE_LONG_EDGE)
+        gradient = Image.linear_gradient('L').resize(size)
+        # Noise keeps JPEG decode/encode cost close to a real photo.
+        noise = Image.effect_noise(size, 48 + index)
+        image = Image.merge('RGB', (gradient, noise, gradient.transpose(Image.Transpose.ROTATE_180)))
+        path = upload_dir / f'bench-{index}.jpg'
+        image.save(path, format='JPEG', quality=92)
+        urls.append(f'/static/uploads/{path.name}')
+    return urls
+
+
+def _script(sentences: int) -> str:
+    return ' '.join(STUB_SENTENCE.format(index=index + 1) for index in range(sentences))
+
+
+def run_case(case: BenchmarkCase, args: argparse.Namespace) -> dict[str, object]:
+    global _active_recorder
+    workspace = Path(tempfile.mkdtemp(prefix=f'render-bench-{case.name}-'))
+    previous_cwd = Path.cwd()
+    os.chdir(workspace)
+    try:
+        image_urls = _write_images(case.images, Path('data/uploads'))
+        music_file_url = None
+        if case.music:
+            music_dir = Path('data/music_uploads')
+            music_dir.mkdir(parents=True, exist_ok=True)
+            _write_tone(music_dir / 'bench-music.wav', MUSIC_SECONDS, 44100, frequency=330, channels=2)
+            music_file_url = '/static/music_uploads/bench-music.wav'
+
+        recorder = StageRecorder()
+        _active_recorder = recorder
+        pipeline = BenchmarkPipeline(recorder)
+        if not args.cache:
+            pipeline.render_cache = None
+        if args.mode:
+            pipeline.render_mode = args.mode
+        if args.parallel_segments:
+            pipeline.parallel_segments = True
+        pipeline.thread_budget = args.threads or None
+
+        started = time.perf_counter()
+        self_before = resource.getrusage(resource.RUSAGE_SELF)
+        children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        artifacts = pipeline.render_video_from_assets(
+            video_id=f'bench-{case.name}',
+            title='Benchmark Render',
+            script=_script(case.sentences),
+            language_name='English',
+            voice_name='Shubh',
+            audio_sample_rate_hz=args.sample_rate,
+            image_urls=image_urls,
+            aspect_ratio=case.aspect_ratio,
+            resolution=case.resolution,
+            duration_mode='auto',
+            duration_seconds=None,
+            captions_enabled=True,
+            music_mode='upload' if case.music else 'none',
+            music_track_id=None,
+            music_file_url=music_file_url,
+            music_volume=30,
+            duck_music=True,
+            quality=args.quality,
+        )
+        wall = time.perf_counter() - started
+        self_after = resource.getrusage(resource.RUSAGE_SELF)
+        children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+        outputs = {name: os.path.getsize(path) for name, path in asdict(artifacts).items() if os.path.exists(path)}
+        return {
+            'case': {**asdict(case), 'name': case.name},
+            'total': {
+                'wall_seconds': round(wall, 4),
+                'cpu_seconds': round(
+                    (self_after.ru_utime - self_before.ru_utime)
+                    + (self_after.ru_stime - self_before.ru_stime)
+                    + (children_after.ru_utime - children_before.ru_utime)
+                    + (children_after.ru_stime - children_before.ru_stime),
+                    4,
+                ),
+                'process_peak_rss_kb': self_after.ru_maxrss,
+                'child_peak_rss_kb': max((sample.child_peak_rss_kb for sample in recorder.samples.values()), default=0),
+                'output_bytes': sum(outputs.values()),
+            },
+            'outputs': outputs,
+            'stages': [_rounded(sample) for sample in recorder.samples.values()],
+        }
+    finally:
+        _active_recorder = None
+        os.chdir(previous_cwd)
+        if args.keep:
+            print(f'kept workspace {workspace}', file=sys.stderr)
+        else:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+
+def _rounded(sample: StageSample) -> dict[str, object]:
+    return {key: round(value, 4) if isinstance(value, float) else value for key, value in asdict(sample).items()}
+
+
+def _environment() -> dict[str, object]:
+    def first_line(cmd: list[str]) -> str | None:
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return (result.stdout.splitlines() or [None])[0]
+
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_commit': first_line(['git', 'rev-parse', 'HEAD']),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'ffmpeg': first_line(['ffmpeg', '-version']),
+    }
+
+
+def _cases(args: argparse.Namespace) -> list[BenchmarkCase]:
+    return [
+        BenchmarkCase(aspect_ratio, resolution, images, sentences, music)
+        for aspect_ratio, resolution, images, sentences, music in itertools.product(
+            args.aspect_ratios,
+            args.resolutions,
+            args.images,
+            args.sentences,
+            [value == 'on' for value in args.music],
+        )
+    ]
+
+
+def compare(baseline_path: Path, candidate_path: Path) -> None:
+    baseline = {run['case']['name']: run for run in json.loads(baseline_path.read_text())['runs']}
+    candidate = {run['case']['name']: run for run in json.loads(candidate_path.read_text())['runs']}
+    print(f'{"case":<44} {"wall":>9} {"Δwall":>8} {"cpu":>9} {"Δcpu":>8} {"Δbytes":>8}')
+    for name in sorted(set(baseline) & set(candidate)):
+        old, new = baseline[name]['total'], candidate[name]['total']
+        print(
+            f'{name:<44} {new["wall_seconds"]:>8.2f}s {_delta(old["wall_seconds"], new["wall_seconds"]):>8}'
+            f' {new["cpu_seconds"]:>8.2f}s {_delta(old["cpu_seconds"], new["cpu_seconds"]):>8}'
+            f' {_delta(old["output_bytes"], new["output_bytes"]):>8}'
+        )
+    for name in sorted(set(baseline) ^ set(candidate)):
+        print(f'{name:<44} only in {"baseline" if name in baseline else "candidate"}')
+
+
+def _delta(old: float, new: float) -> str:
+    if not old:
+        return 'n/a'
+    return f'{(new - old) / old * 100:+.1f}%'
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--aspect-ratios', nargs='+', default=list(ASPECT_RATIOS))
+    parser.add_argument('--resolutions', nargs='+', default=list(RESOLUTIONS))
+    parser.add_argument('--images', nargs='+', type=int, default=list(IMAGE_COUNTS))
+    parser.add_argument('--sentences', nargs='+', type=int, default=list(SENTENCE_COUNTS))
+    parser.add_argument('--music', nargs='+', choices=('on', 'off'), default=['off', 'on'])
+    parser.add_argument('--quality', choices=('final', 'draft'), default='final')
+    parser.add_argument('--mode', choices=('staged', 'single_pass'), default=None)
+    parser.add_argument('--parallel-segments', action='store_true')
+    parser.add_argument('--threads', type=int, default=0, help='per-job ffmpeg thread budget (0 = ffmpeg default)')
+    parser.add_argument('--sample-rate', type=int, default=22050)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--cache', action='store_true', help='keep the render cache enabled (measures warm re-renders)')
+    parser.add_argument('--keep', action='store_true', help='keep per-case workspaces for inspection')
+    parser.add_argument('--output', type=Path, default=None)
+    parser.add_argument('--compare', nargs=2, type=Path, metavar=('BASELINE', 'CANDIDATE'))
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    subprocess.Popen = MeasuredPopen
+    video_pipeline.generate_voiceover_detailed = _stub_voiceover
+
+    runs: list[dict[str, object]] = []
+    cases = _cases(args)
+    for case in cases:
+        for attempt in range(args.repeat):
+            result = run_case(case, args)
+            result['attempt'] = attempt
+            runs.append(result)
+            total = result['total']
+            print(
+                f'{case.name:<44} {total["wall_seconds"]:>8.2f}s wall {total["cpu_seconds"]:>8.2f}s cpu',
+                file=sys.stderr,
+            )
+
+    report = {
+        'environment': _environment(),
+        'settings': {
+            'quality': args.quality,
+            'mode': args.mode or video_pipeline.get_settings().render_mode,
+            'parallel_segments': args.parallel_segments,
+            'threads': args.threads,
+            'sample_rate': args.sample_rate,
+            'cache': args.cache,
+        },
+        'runs': runs,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding='utf-8')
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
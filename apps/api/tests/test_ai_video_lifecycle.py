@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.db.session as db_session
+from app.db.base import Base
+from app.db.repositories.video_repository import VideoRepository
+from app.models.entities import User, Video, VideoStatus
+from app.services import ai_video_service
+from app.services.ai_video_service import AIVideoCreateService, ProviderResult, celery_process_ai_video
+from app.services.asset_tagging_service import AssetTaggingService
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    # The job opens its own session and writes cancellation markers under data/.
+    monkeypatch.chdir(tmp_path)
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    monkeypatch.setattr(db_session, 'SessionLocal', factory)
+    monkeypatch.setattr(AssetTaggingService, 'auto_tag_video', lambda self, video: [])
+    return factory
+
+
+def _draft_video(factory) -> str:
+    with factory() as db:
+        db.add(User(id='user-1'))
+        db.commit()
+        video = VideoRepository(db).create(user_id='user-1', script='A sunrise over the ghats', selected_model='sora2', status=VideoStatus.draft)
+        return video.id
+
+
+def _load(factory, video_id) -> Video:
+    with factory() as db:
+        return db.get(Video, video_id)
+
+
+def test_draft_job_completes(session_factory, monkeypatch):
+    video_id = _draft_video(session_factory)
+    monkeypatch.setattr(
+        AIVideoCreateService,
+        'generate_with_sora2',
+        lambda self, params: ProviderResult(provider='OpenAI Sora 2', model_key='sora2', video_url='/static/renders/ai.mp4', metadata={}),
+    )
+
+    celery_process_ai_video(video_id)
+
+    video = _load(session_factory, video_id)
+    assert (video.status, video.progress, video.output_url) == (VideoStatus.completed, 100, '/static/renders/ai.mp4')
+    assert video.provider_name == 'OpenAI Sora 2'
+
+
+def test_draft_job_fails(session_factory, monkeypatch):
+    video_id = _draft_video(session_factory)
+
+    def provider_down(self, params):
+        raise ai_video_service.ProviderError('provider down')
+
+    monkeypatch.setattr(AIVideoCreateService, 'generate_with_sora2', provider_down)
+
+    celery_process_ai_video(video_id)
+
+    video = _load(session_factory, video_id)
+    assert (video.status, video.progress, video.error_message) == (VideoStatus.failed, 100, 'provider down')
+
+
+def test_started_job_can_be_cancelled_and_is_not_overwritten(session_factory):
+    video_id = _draft_video(session_factory)
+    with session_factory() as db:
+        repo = VideoRepository(db)
+        assert repo.cancel(video_id) is None
+        assert repo.start(video_id, progress=20).status == VideoStatus.processing
+        assert repo.cancel(video_id).status == VideoStatus.cancelled
+        assert repo.complete(video_id, output_url='/late.mp4', thumbnail_url='/late.jpg') is None
+        assert repo.fail(video_id, 'late failure') is None
+        assert repo.start(video_id) is None
+
+    assert _load(session_factory, video_id).status == VideoStatus.cancelled
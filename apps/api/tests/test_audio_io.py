@@ -0,0 +1,128 @@
+import struct
+import wave
+
+import pytest
+
+from app.services.audio_io import audio_duration, audio_info
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz: 417-byte frames of 1152 samples.
+MPEG1_STEREO = b'\xff\xfb\x90\x00'
+MPEG1_MONO = b'\xff\xfb\x90\xc0'
+MPEG1_FRAME_BYTES = 417
+# MPEG-2 Layer III, 48 kbit/s, 24 kHz mono, what edge-tts produces: 144-byte frames of 576 samples.
+MPEG2_MONO = b'\xff\xf3\x64\xc0'
+MPEG2_FRAME_BYTES = 144
+# MPEG-2 Layer III, 48 kbit/s, 22.05 kHz mono: 156-byte frames of 576 samples.
+MPEG2_22K_MONO = b'\xff\xf3\x60\xc0'
+MPEG2_22K_FRAME_BYTES = 156
+
+
+def _mp3_frames(header: bytes, frame_bytes: int, count: int) -> bytes:
+    return (header + bytes(frame_bytes - len(header))) * count
+
+
+def _write_wav(path, *, rate: int, channels: int, frames: int) -> None:
+    with wave.open(str(path), 'wb') as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(bytes(frames * channels * 2))
+
+
+def test_wav_header(tmp_path):
+    path = tmp_path / 'voice.wav'
+    _write_wav(path, rate=22050, channels=1, frames=44100)
+
+    info = audio_info(path)
+
+    assert (info.codec, info.sample_rate_hz, info.channels) == ('pcm', 22050, 1)
+    assert info.duration_seconds == pytest.approx(2.0)
+
+
+def test_wav_with_extra_chunks_and_open_ended_size(tmp_path):
+    # A LIST chunk before fmt, and the 0xFFFFFFFF sizes a streamed preview is written with.
+    pcm = bytes(48000 * 2 * 2)
+    path = tmp_path / 'streamed.wav'
+    path.write_bytes(b''.join([
+        b'RIFF', struct.pack('<I', 0xFFFFFFFF), b'WAVE',
+        b'LIST', struct.pack('<I', 5), b'INFO\x00', b'\x00',
+        b'fmt ', struct.pack('<IHHIIHH', 16, 1, 2, 48000, 48000 * 4, 4, 16),
+        b'data', struct.pack('<I', 0xFFFFFFFF), pcm,
+    ]))
+
+    info = audio_info(path)
+
+    assert (info.sample_rate_hz, info.channels) == (48000, 2)
+    assert info.duration_seconds == pytest.approx(1.0)
+
+
+def test_mp3_frames_are_counted(tmp_path):
+    path = tmp_path / 'voice.mp3'
+    path.write_bytes(_mp3_frames(MPEG1_STEREO, MPEG1_FRAME_BYTES, 100))
+
+    info = audio_info(path)
+
+    assert (info.codec, info.sample_rate_hz, info.channels) == ('mp3', 44100, 2)
+    assert info.duration_seconds == pytest.approx(100 * 1152 / 44100)
+
+
+def test_mpeg2_mono_after_id3_tag(tmp_path):
+    tag_body = bytes(20)
+    tag = b'ID3\x04\x00\x00' + bytes([0, 0, 0, len(tag_body)]) + tag_body
+    path = tmp_path / 'edge.mp3'
+    path.write_bytes(tag + _mp3_frames(MPEG2_MONO, MPEG2_FRAME_BYTES, 50))
+
+    info = audio_info(path)
+
+    assert (info.sample_rate_hz, info.channels) == (24000, 1)
+    assert info.duration_seconds == pytest.approx(50 * 576 / 24000)
+
+
+def test_xing_frame_count_is_used_and_the_tag_frame_is_not_audio(tmp_path):
+    xing = MPEG1_MONO + bytes(17) + b'Xing' + struct.pack('>II', 0x1, 1000)
+    xing += bytes(MPEG1_FRAME_BYTES - len(xing))
+    path = tmp_path / 'lame.mp3'
+    path.write_bytes(xing + _mp3_frames(MPEG1_MONO, MPEG1_FRAME_BYTES, 3))
+
+    assert audio_duration(path) == round(1000 * 1152 / 44100, 3)
+
+
+def test_garbage_between_frames_is_skipped(tmp_path):
+    frames = _mp3_frames(MPEG1_STEREO, MPEG1_FRAME_BYTES, 10)
+    path = tmp_path / 'noisy.mp3'
+    path.write_bytes(b'\x00junk' + frames[:MPEG1_FRAME_BYTES * 5] + b'\x01\x02' + frames[MPEG1_FRAME_BYTES * 5:])
+
+    assert audio_info(path).duration_seconds == pytest.approx(10 * 1152 / 44100)
+
+
+def test_unknown_or_broken_files_return_none(tmp_path):
+    text = tmp_path / 'notes.txt'
+    text.write_text('not audio')
+    empty_mp3 = tmp_path / 'empty.mp3'
+    empty_mp3.write_bytes(b'')
+    truncated_wav = tmp_path / 'truncated.wav'
+    truncated_wav.write_bytes(b'RIFF\x00\x00\x00\x00WAVEfmt ')
+
+    assert audio_info(text) is None
+    assert audio_info(empty_mp3) is None
+    assert audio_info(truncated_wav) is None
+    assert audio_duration(tmp_path / 'missing.wav') is None
+
+
+def test_resample_skips_files_already_at_the_target_rate(tmp_path, monkeypatch):
+    from app.services import tts
+
+    calls: list[list[str]] = []
+    # _resample_audio_file swallows ffmpeg errors, so the fake records calls instead of raising.
+    monkeypatch.setattr(tts.subprocess, 'run', lambda args, **kwargs: calls.append(args))
+    wav = tmp_path / 'voice.wav'
+    _write_wav(wav, rate=22050, channels=1, frames=100)
+    mp3 = tmp_path / 'edge.mp3'
+    mp3.write_bytes(_mp3_frames(MPEG2_22K_MONO, MPEG2_22K_FRAME_BYTES, 5))
+
+    assert tts._resample_audio_file(wav, 22050) == wav
+    assert tts._resample_audio_file(mp3, 22050) == mp3
+    assert calls == []
+
+    tts._resample_audio_file(mp3, 48000)
+    assert len(calls) == 1
@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+
+from app.services import render_cache
+from app.services.render_cache import EVICTION_GRACE_SECONDS, RENDER_CACHE_VERSION, RenderCache, content_digest
+
+
+def test_key_ignores_input_order_and_tracks_every_value(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=0)
+    inputs = {'images': ['a', 'b'], 'aspect_ratio': '9:16', 'duration': 30}
+
+    key = cache.make_key(inputs)
+
+    assert key == cache.make_key(dict(reversed(list(inputs.items()))))
+    assert len(key) == 64
+    assert key != cache.make_key({**inputs, 'duration': 31})
+    assert key != cache.make_key({**inputs, 'images': ['b', 'a']})
+    assert key != cache.make_key({**inputs, 'version': RENDER_CACHE_VERSION + 1})
+
+
+def test_content_digest_follows_the_file_contents(tmp_path):
+    first = tmp_path / 'first.png'
+    second = tmp_path / 'second.png'
+    first.write_bytes(b'same bytes')
+    second.write_bytes(b'same bytes')
+
+    digest = content_digest(first)
+    assert digest == content_digest(second)
+
+    first.write_bytes(b'edited bytes, different length')
+    assert content_digest(first) != digest
+
+
+def test_store_then_restore_links_every_artifact(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=0)
+    video = tmp_path / 'out.mp4'
+    poster = tmp_path / 'out.jpg'
+    video.write_bytes(b'video')
+    poster.write_bytes(b'poster')
+    key = cache.make_key({'render': 1})
+
+    assert not cache.restore(key, {'mp4': tmp_path / 'restored.mp4'})
+    cache.store(key, {'mp4': video, 'jpg': poster})
+
+    targets = {'mp4': tmp_path / 'restored.mp4', 'jpg': tmp_path / 'restored.jpg'}
+    assert cache.restore(key, targets)
+    assert targets['mp4'].read_bytes() == b'video'
+    assert targets['jpg'].read_bytes() == b'poster'
+    assert not cache.restore(key, {**targets, 'webp': tmp_path / 'restored.webp'})
+
+
+
+def test_values_round_trip(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=0)
+    key = cache.make_key({'probe': 'audio.mp3'})
+
+    assert cache.get_value(key) is None
+    cache.put_value(key, {'duration': 12.5})
+    assert cache.get_value(key) == {'duration': 12.5}
+
+
+def _store_aged(cache, tmp_path, name, *, age, keep_source=False, size=100):
+    key = cache.make_key({'render': name})
+    artifacts = {}
+    for suffix in ('mp4', 'jpg'):
+        source = tmp_path / f'{name}.{suffix}'
+        source.write_bytes(bytes(size // 2))
+        artifacts[suffix] = source
+    cache.store(key, artifacts)
+    if not keep_source:
+        for source in artifacts.values():
+            source.unlink()
+    stamp = time.time() - age
+    for suffix in artifacts:
+        os.utime(cache.cache_dir / f'{key}.{suffix}', (stamp, stamp))
+    return key
+
+
+def _cached_keys(cache):
+    return {path.name.split('.', 1)[0] for path in cache.cache_dir.iterdir()}
+
+
+def test_evict_removes_least_recently_used_keys_down_to_the_watermark(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=250)
+    oldest = _store_aged(cache, tmp_path, 'oldest', age=3 * EVICTION_GRACE_SECONDS)
+    middle = _store_aged(cache, tmp_path, 'middle', age=2 * EVICTION_GRACE_SECONDS)
+    newest = _store_aged(cache, tmp_path, 'newest', age=2 * EVICTION_GRACE_SECONDS - 1)
+
+    assert cache.evict() == 1
+    assert _cached_keys(cache) == {middle, newest}
+    assert oldest not in _cached_keys(cache)
+
+
+def test_restore_refreshes_recency(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=250)
+    oldest = _store_aged(cache, tmp_path, 'oldest', age=3 * EVICTION_GRACE_SECONDS)
+    middle = _store_aged(cache, tmp_path, 'middle', age=2 * EVICTION_GRACE_SECONDS)
+    _store_aged(cache, tmp_path, 'newest', age=2 * EVICTION_GRACE_SECONDS - 1)
+
+    assert cache.restore(oldest, {'mp4': tmp_path / 'restored.mp4'})
+    (tmp_path / 'restored.mp4').unlink()
+
+    assert cache.evict() == 1
+    assert oldest in _cached_keys(cache)
+    assert middle not in _cached_keys(cache)
+
+
+def test_entries_still_linked_elsewhere_do_not_count(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=150)
+    for name in ('first', 'second', 'third'):
+        _store_aged(cache, tmp_path, name, age=3 * EVICTION_GRACE_SECONDS, keep_source=True)
+
+    assert cache.evict() == 0
+    assert len(_cached_keys(cache)) == 3
+
+
+def test_recently_used_entries_survive_an_over_budget_cache(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=50)
+    for name in ('first', 'second'):
+        _store_aged(cache, tmp_path, name, age=0)
+
+    assert cache.evict() == 0
+    assert len(_cached_keys(cache)) == 2
+
+
+def test_concurrent_stores_from_one_process_do_not_collide(tmp_path, monkeypatch, caplog):
+    real_link = os.link
+
+    def slow_link(source, target):
+        # Widens the window between linking the temp file and renaming it into place.
+        real_link(source, target)
+        time.sleep(0.01)
+
+    monkeypatch.setattr(render_cache.os, 'link', slow_link)
+    cache = RenderCache(tmp_path / 'cache', max_bytes=0)
+    key = cache.make_key({'segment': 0})
+    sources = []
+    for index in range(16):
+        source = tmp_path / f'segment-{index}.mp4'
+        source.write_bytes(bytes([index]) * 1024)
+        sources.append(source)
+    errors = []
+
+    def store(source):
+        try:
+            cache.store(key, {'mp4': source})
+            cache.put_value(key, {'source': source.name})
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=store, args=(source,)) for source in sources]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert not [record for record in caplog.records if record.message == 'render_cache_store_failed']
+    assert sorted(path.name for path in cache.cache_dir.iterdir()) == [f'{key}.json', f'{key}.mp4']
+    assert len(set((cache.cache_dir / f'{key}.mp4').read_bytes())) == 1
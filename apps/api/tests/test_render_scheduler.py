@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+
+from app.services.render_cancellation import CancellationToken, RenderCancelled
+from app.services.render_scheduler import RenderScheduler
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'condition not met in time'
+        time.sleep(0.01)
+
+
+def test_thread_budget_is_split_across_slots(tmp_path):
+    scheduler = RenderScheduler(tmp_path, max_jobs=2)
+
+    assert scheduler.threads_per_job == max(1, (os.cpu_count() or 1) // 2)
+    assert scheduler.queue_depth() == {'max_jobs': 2, 'active': 0, 'queued': 0, 'threads_per_job': scheduler.threads_per_job}
+
+
+def test_jobs_take_distinct_slots_and_release_them(tmp_path):
+    scheduler = RenderScheduler(tmp_path, max_jobs=2)
+
+    with scheduler.admit('first') as first, scheduler.admit('second') as second:
+        assert {first.index, second.index} == {0, 1}
+        assert scheduler.queue_depth()['active'] == 2
+    assert scheduler.queue_depth()['active'] == 0
+
+
+def test_job_beyond_the_cap_queues_until_a_slot_frees(tmp_path):
+    scheduler = RenderScheduler(tmp_path, max_jobs=1)
+    admitted = threading.Event()
+    slots = []
+
+    def third_job():
+        with scheduler.admit('waiting', poll_seconds=0.01) as slot:
+            slots.append(slot.index)
+            admitted.set()
+
+    with scheduler.admit('running'):
+        worker = threading.Thread(target=third_job)
+        worker.start()
+        _wait_for(lambda: scheduler.queue_depth()['queued'] == 1)
+        assert not admitted.is_set()
+    worker.join(timeout=5)
+
+    assert slots == [0]
+    assert scheduler.queue_depth() == {'max_jobs': 1, 'active': 0, 'queued': 0, 'threads_per_job': scheduler.threads_per_job}
+
+
+def test_cancelled_job_leaves_the_queue(tmp_path):
+    scheduler = RenderScheduler(tmp_path / 'slots', max_jobs=1)
+    token = CancellationToken('queued', control_dir=tmp_path / 'cancelled')
+    errors = []
+
+    def queued_job():
+        try:
+            with scheduler.admit('queued', poll_seconds=0.01, cancel_token=token):
+                pass
+        except RenderCancelled as exc:
+            errors.append(exc)
+
+    with scheduler.admit('running'):
+        worker = threading.Thread(target=queued_job)
+        worker.start()
+        _wait_for(lambda: scheduler.queue_depth()['queued'] == 1)
+        token.cancel()
+        worker.join(timeout=5)
+
+        assert len(errors) == 1
+        assert scheduler.queue_depth()['queued'] == 0
+    assert list(scheduler.queue_dir.iterdir()) == []
+
+
+def test_markers_left_by_dead_workers_are_not_counted(tmp_path):
+    scheduler = RenderScheduler(tmp_path, max_jobs=1)
+    (scheduler.queue_dir / 'crashed.1234.1').touch()
+
+    assert scheduler.queue_depth()['queued'] == 0
+    assert list(scheduler.queue_dir.iterdir()) == []
+
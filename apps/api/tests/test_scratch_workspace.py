@@ -0,0 +1,34 @@
+import os
+import threading
+
+from app.services import scratch_workspace
+from app.services.scratch_workspace import promote
+
+
+def test_promote_copies_across_devices_without_temp_name_collisions(tmp_path, monkeypatch):
+    real_replace = os.replace
+
+    def cross_device_rename(source, target):
+        # Renames out of scratch fail as they would from tmpfs; the copy's own rename works.
+        if '.tmp' not in str(source):
+            raise OSError(18, 'Invalid cross-device link')
+        real_replace(source, target)
+
+    monkeypatch.setattr(scratch_workspace.os, 'replace', cross_device_rename)
+    target = tmp_path / 'renders' / 'video.mp4'
+    sources = []
+    for index in range(8):
+        source = tmp_path / f'scratch-{index}.mp4'
+        source.write_bytes(bytes([index]) * 4096)
+        sources.append(source)
+
+    threads = [threading.Thread(target=promote, args=(source, target)) for source in sources]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    data = target.read_bytes()
+    assert len(data) == 4096 and len(set(data)) == 1
+    assert not any(source.exists() for source in sources)
+    assert [path.name for path in target.parent.iterdir()] == ['video.mp4']
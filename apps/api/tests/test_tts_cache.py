@@ -0,0 +1,115 @@
+import asyncio
+import os
+import sqlite3
+import time
+
+from app.services.tts_cache import (
+    EVICTION_GRACE_SECONDS,
+    SINGLE_FLIGHT_TIMEOUT_SECONDS,
+    TTS_CACHE_LOCK_DIR,
+    TTSCacheIndex,
+    single_flight,
+)
+
+
+def _add(index, name, *, size=100, age=0.0):
+    # Entries are added with no budget so record() does not evict while a test sets up.
+    path = index.cache_dir / name
+    path.write_bytes(bytes(size))
+    index.record(path, provider='edge')
+    with sqlite3.connect(index.db_path) as db:
+        db.execute('UPDATE entries SET last_hit_at = ? WHERE name = ?', (time.time() - age, name))
+    return path
+
+
+def test_lookup_hits_indexed_files_and_counts_misses(tmp_path):
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    cached = _add(index, 'cached.mp3')
+
+    assert index.lookup(cached)
+    assert index.lookup(cached)
+    assert not index.lookup(tmp_path / 'missing.mp3')
+
+    stats = index.stats()
+    assert (stats['entries'], stats['hits'], stats['misses']) == (1, 2, 1)
+    assert stats['hit_ratio'] == round(2 / 3, 4)
+
+
+def test_lookup_drops_rows_whose_file_was_deleted(tmp_path):
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    cached = _add(index, 'cached.mp3')
+    cached.unlink()
+
+    assert not index.lookup(cached)
+    assert index.stats()['entries'] == 0
+
+
+def test_evict_removes_least_recently_hit_entries_down_to_the_watermark(tmp_path):
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    oldest = _add(index, 'oldest.mp3', size=400, age=3 * EVICTION_GRACE_SECONDS)
+    middle = _add(index, 'middle.mp3', size=400, age=2 * EVICTION_GRACE_SECONDS)
+    newest = _add(index, 'newest.mp3', size=400, age=2 * EVICTION_GRACE_SECONDS - 1)
+    index.max_bytes = 1000
+
+    assert index.evict() == 1
+    assert not oldest.exists()
+    assert middle.exists() and newest.exists()
+    stats = index.stats()
+    assert (stats['entries'], stats['total_bytes'], stats['evictions']) == (2, 800, 1)
+
+
+def test_hits_protect_entries_from_eviction(tmp_path):
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    first = _add(index, 'first.mp3', size=400, age=3 * EVICTION_GRACE_SECONDS)
+    second = _add(index, 'second.mp3', size=400, age=2 * EVICTION_GRACE_SECONDS)
+
+    assert index.lookup(first)
+    index.max_bytes = 500
+
+    assert index.evict() == 1
+    assert first.exists()
+    assert not second.exists()
+
+
+def test_entries_inside_the_grace_period_are_kept_over_budget(tmp_path):
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    _add(index, 'first.mp3', size=400)
+    _add(index, 'second.mp3', size=400)
+    index.max_bytes = 100
+
+    assert index.evict() == 0
+    assert index.stats()['entries'] == 2
+
+
+def test_reconcile_indexes_untracked_files_and_forgets_removed_ones(tmp_path):
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    tracked = _add(index, 'tracked.mp3')
+    (tmp_path / 'untracked.wav').write_bytes(bytes(50))
+    (tmp_path / 'notes.txt').write_text('not audio')
+    tracked.unlink()
+
+    index.reconcile()
+
+    stats = index.stats()
+    assert (stats['entries'], stats['total_bytes']) == (1, 50)
+    assert index.lookup(tmp_path / 'untracked.wav')
+
+
+def test_lock_files_go_with_evicted_entries_and_stale_orphans(tmp_path):
+    async def synthesize(name):
+        async with single_flight(tmp_path, name) as waited:
+            assert not waited
+
+    for name in ('evicted.mp3', 'kept.mp3', 'failed.mp3'):
+        asyncio.run(synthesize(name))
+    index = TTSCacheIndex(tmp_path, max_bytes=0)
+    _add(index, 'evicted.mp3', size=400, age=2 * EVICTION_GRACE_SECONDS)
+    _add(index, 'kept.mp3', size=400)
+    index.max_bytes = 500
+    stale = time.time() - 2 * SINGLE_FLIGHT_TIMEOUT_SECONDS
+    os.utime(tmp_path / TTS_CACHE_LOCK_DIR / 'failed.mp3.lock', (stale, stale))
+
+    assert index.evict() == 1
+    index.reconcile()
+
+    assert sorted(path.name for path in (tmp_path / TTS_CACHE_LOCK_DIR).iterdir()) == ['kept.mp3.lock']
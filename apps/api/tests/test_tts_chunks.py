@@ -0,0 +1,55 @@
+from app.services.tts import TTS_CHUNK_MAX_CHARS, TTS_CHUNK_MIN_CHARS, split_script_chunks
+
+
+def test_short_sentences_ride_along_with_the_next_one():
+    chunks = split_script_chunks('Hi. Welcome to the channel. Today we are cooking a quick dal tadka at home.')
+
+    assert chunks == ['Hi. Welcome to the channel. Today we are cooking a quick dal tadka at home.']
+
+
+def test_sentences_long_enough_become_their_own_chunks():
+    first = 'This opening sentence is comfortably longer than the minimum.'
+    second = 'And this second one is also long enough to stand on its own.'
+
+    assert split_script_chunks(f'{first} {second}') == [first, second]
+
+
+def test_devanagari_danda_ends_a_sentence():
+    first = 'नमस्ते दोस्तों, आज हम एक नई रेसिपी बनाने वाले हैं।'
+    second = 'सबसे पहले हमें दाल को अच्छी तरह से धोना होगा।'
+
+    assert split_script_chunks(f'{first} {second}') == [first, second]
+
+
+def test_trailing_short_sentence_joins_the_last_chunk():
+    first = 'This opening sentence is comfortably longer than the minimum.'
+
+    assert split_script_chunks(f'{first} Thanks!') == [f'{first} Thanks!']
+
+
+def test_overlong_sentence_is_cut_at_clauses_then_words():
+    clause = 'word ' * 80
+    chunks = split_script_chunks(f'{clause.strip()}, and a short tail clause that follows it.')
+
+    assert all(len(chunk) <= TTS_CHUNK_MAX_CHARS for chunk in chunks)
+    assert all(len(chunk) >= TTS_CHUNK_MIN_CHARS for chunk in chunks)
+    assert ' '.join(chunks).split() == f'{clause.strip()}, and a short tail clause that follows it.'.split()
+
+
+def test_editing_one_sentence_keeps_the_other_chunks():
+    sentences = [
+        'This opening sentence is comfortably longer than the minimum.',
+        'The middle sentence is the one that is going to be edited.',
+        'And the closing sentence is also long enough to stand alone.',
+    ]
+    before = split_script_chunks(' '.join(sentences))
+    sentences[1] = 'The middle sentence was rewritten, with different words now.'
+    after = split_script_chunks(' '.join(sentences))
+
+    assert before[0] == after[0]
+    assert before[2] == after[2]
+    assert before[1] != after[1]
+
+
+def test_blank_script_has_no_chunks():
+    assert split_script_chunks('   \n\n ') == []
@@ -0,0 +1,45 @@
+import asyncio
+import wave
+
+import app.services.tts as tts
+from app.services.tts import TTS_CHUNK_SCRIPT_CHARS, astream_voiceover, split_script_chunks
+
+
+def _fake_sarvam(calls: list[str]):
+    def synthesize(text, output_path, *, language_code, speaker):
+        calls.append(text)
+        with wave.open(str(output_path), 'wb') as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(22050)
+            writer.writeframes(bytes(2 * len(text)))
+        return speaker
+
+    return synthesize
+
+
+def _stream(text: str, cache_dir) -> bytes:
+    async def run() -> bytes:
+        stream = await astream_voiceover(script=text, voice='Aditya', cache_dir=cache_dir, language='Hindi')
+        assert stream.provider == 'Sarvam AI'
+        return b''.join([data async for data in stream.chunks])
+
+    return asyncio.run(run())
+
+
+def test_short_premium_preview_is_one_sarvam_request(tmp_path, monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(tts.get_settings(), 'sarvam_api_key', 'test-key')
+    monkeypatch.setattr(tts, '_synthesize_with_sarvam', _fake_sarvam(calls))
+    text = (
+        'This opening sentence is comfortably longer than the minimum. '
+        'And this second one is also long enough to stand on its own.'
+    )
+    assert len(text) <= TTS_CHUNK_SCRIPT_CHARS
+    assert len(split_script_chunks(text)) == 2
+
+    audio = _stream(text, tmp_path)
+
+    assert calls == [text]
+    assert audio[:4] == b'RIFF'
+
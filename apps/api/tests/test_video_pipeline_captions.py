@@ -0,0 +1,50 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.services.video_pipeline import VideoPipelineService
+
+DEJAVU = Path('/usr/share/fonts/truetype/dejavu')
+
+
+@pytest.fixture
+def pipeline():
+    service = VideoPipelineService.__new__(VideoPipelineService)
+    service._font_cache = {}
+    return service
+
+
+@pytest.mark.skipif(not (DEJAVU / 'DejaVuSans.ttf').exists(), reason='DejaVu fonts are not installed')
+def test_mixed_script_captions_get_every_font_and_its_real_family(tmp_path, pipeline, monkeypatch):
+    # Two scripts resolving to fonts in different directories, under file names that do not
+    # spell out their family.
+    latin = tmp_path / 'system-a' / 'latin-regular.ttf'
+    devanagari = tmp_path / 'system-b' / 'deva.ttf'
+    for source, target in ((DEJAVU / 'DejaVuSans.ttf', latin), (DEJAVU / 'DejaVuSerif.ttf', devanagari)):
+        target.parent.mkdir()
+        shutil.copyfile(source, target)
+    fonts = {'unicode': str(latin), 'devanagari': str(devanagari)}
+    monkeypatch.setattr(pipeline, '_resolve_font_path', lambda text: fonts[pipeline._detect_script(text)])
+
+    captions_path = tmp_path / 'work' / 'slideshow.ass'
+    captions_path.parent.mkdir()
+    fonts_dir = pipeline._write_caption_track(
+        captions_path=captions_path,
+        script='Welcome to the show. नमस्ते दोस्तों।',
+        total_duration=6.0,
+        target_size=(1080, 1920),
+    )
+
+    assert sorted(path.name for path in Path(fonts_dir).iterdir()) == ['deva.ttf', 'latin-regular.ttf']
+    track = captions_path.read_text(encoding='utf-8')
+    assert 'Style: unicode,DejaVu Sans,' in track
+    assert 'Style: devanagari,DejaVu Serif,' in track
+
+
+def test_family_falls_back_to_the_file_name(pipeline, tmp_path):
+    broken = tmp_path / 'NotoSansTamil-Regular.ttf'
+    broken.write_bytes(b'not a font')
+
+    assert pipeline._font_family(str(broken)) == 'Noto Sans Tamil'
+    assert pipeline._font_family(None) == 'Sans'
@@ -0,0 +1,54 @@
+import pytest
+
+from app.services.video_pipeline import VideoPipelineService
+
+
+@pytest.fixture
+def pipeline():
+    # _plan_segments is pure; skip the constructor's directories and providers.
+    service = VideoPipelineService.__new__(VideoPipelineService)
+    service.segment_seconds = 10
+    return service
+
+
+def _assert_contiguous(segments, image_count, total_duration, fps):
+    assert segments[0][0] == 0 and segments[0][2] == 0
+    assert segments[-1][1] == image_count and segments[-1][3] == total_duration
+    for (_, last, _, end), (first, _, start, _) in zip(segments, segments[1:]):
+        assert first == last
+        assert start == end
+        assert round(start * fps) == pytest.approx(start * fps)
+
+
+def test_short_video_is_one_segment(pipeline):
+    assert pipeline._plan_segments(3, 2.0, 6.0, 30) == [(0, 3, 0.0, 6.0)]
+
+
+def test_segments_break_on_image_changes_once_long_enough(pipeline):
+    segments = pipeline._plan_segments(12, 4.0, 48.0, 30)
+
+    assert segments == [(0, 3, 0.0, 12.0), (3, 6, 12.0, 24.0), (6, 9, 24.0, 36.0), (9, 12, 36.0, 48.0)]
+
+
+def test_explicit_segment_length_overrides_the_default(pipeline):
+    segments = pipeline._plan_segments(12, 4.0, 48.0, 30, segment_seconds=20)
+
+    assert segments == [(0, 5, 0.0, 20.0), (5, 10, 20.0, 40.0), (10, 12, 40.0, 48.0)]
+
+
+def test_fractional_durations_land_on_whole_frames_without_drift(pipeline):
+    fps = 30
+    total = 100 / 3
+    segments = pipeline._plan_segments(10, total / 10, total, fps)
+
+    _assert_contiguous(segments, 10, total, fps)
+    assert all(end - start >= 10 for _, _, start, end in segments[:-1])
+    frames = sum(round(end * fps) - round(start * fps) for _, _, start, end in segments)
+    assert frames == round(total * fps)
+
+
+def test_images_past_the_audio_are_dropped(pipeline):
+    segments = pipeline._plan_segments(20, 3.0, 25.0, 24)
+
+    _assert_contiguous(segments, 9, 25.0, 24)
+    assert segments[-1][1] == 9